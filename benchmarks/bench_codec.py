@@ -0,0 +1,111 @@
+"""JSON encode/decode time per codec on realistic ComboCurve payloads.
+
+Times `APIBase.codec` candidates -- stdlib `json` and (when installed) orjson --
+on synthetic pages shaped like the API's heaviest responses:
+
+- a 20k-row daily production page (`get_company_daily_productions`), and
+- a 100-item monthly econ export page (`get_stream_econ_run_monthly_export`),
+  each item holding a well's monthly results with ~40 output columns.
+
+Decoding is timed from bytes, exactly as `_extract_json` receives the body;
+encoding is timed on the same structures, as a write payload would be. Offline,
+no credentials needed.
+
+Usage:
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from combocurve_api_helper._codec import JSONCodec, OrjsonCodec, StdlibJSONCodec, default_codec
+
+_OUTPUT_COLUMNS = [f'{name}_{stream}' for name in ('gross', 'net', 'wi', 'nri', 'revenue') for stream in 'ogwn'] + [
+    f'{name}' for name in ('total_revenue', 'total_expense', 'net_income', 'before_income_tax_cash_flow')
+]
+
+
+def _daily_production_page(rows: int) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {
+            'well': f'5e272d38b78910dd2a1b{i % 400:04x}',
+            'date': f'20{10 + i // 7300:02d}-{(i // 600) % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00.000Z',
+            'oil': round(rng.uniform(0, 500), 3),
+            'gas': round(rng.uniform(0, 3000), 3),
+            'water': round(rng.uniform(0, 800), 3),
+            'choke': rng.choice([None, 24.0, 32.0]),
+            'hoursOn': 24,
+            'operationalTag': rng.choice([None, 'flowing', 'shut-in']),
+            'createdAt': '2024-01-01T00:00:00.000Z',
+            'updatedAt': '2024-01-01T00:00:00.000Z',
+        }
+        for i in range(rows)
+    ]
+
+
+def _monthly_export_page(items: int, months: int) -> List[Dict[str, Any]]:
+    rng = random.Random(1)
+    return [
+        {
+            'well': f'5e272d38b78910dd2a1b{i:04x}',
+            'results': [
+                {
+                    'date': f'{2024 + m // 12}-{m % 12 + 1:02d}-15',
+                    'comboName': 'Default',
+                    'output': {column: rng.uniform(-1e5, 1e6) for column in _OUTPUT_COLUMNS},
+                }
+                for m in range(months)
+            ],
+        }
+        for i in range(items)
+    ]
+
+
+def _best_of(call: Callable[[], object], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='timing repetitions; the best is reported (default 10)')
+    args = parser.parse_args()
+
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print('orjson is not installed; timing stdlib json only')
+
+    payloads = {
+        'daily production (20k rows)': _daily_production_page(20_000),
+        'monthly export (100 items)': _monthly_export_page(100, 120),
+    }
+    for label, payload in payloads.items():
+        body = StdlibJSONCodec().dumps(payload)
+        print(f'{label}: {len(body) / 1e6:.1f} MB')
+        baseline: Dict[str, float] = {}
+        for codec in codecs:
+            decode = _best_of(lambda: codec.loads(body), args.repeat)
+            encode = _best_of(lambda: codec.dumps(payload), args.repeat)
+            baseline.setdefault('decode', decode)
+            baseline.setdefault('encode', encode)
+            print(
+                f'  {codec.name:<8} decode {decode * 1000:8.2f} ms ({baseline["decode"] / decode:4.1f}x)'
+                f'   encode {encode * 1000:8.2f} ms ({baseline["encode"] / encode:4.1f}x)'
+            )
+    print(f'APIBase.codec default: {default_codec().name}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Per-request latency: module-level `requests.request` vs. the pooled `APIBase.session`.
+
+Starts a keep-alive HTTP/1.1 stub on localhost and times N sequential GETs two ways:
+a fresh connection per call (what every call path did before `APIBase` owned a
+session) and the API's pooled keep-alive session. Offline, no credentials needed.
+
+Localhost has no TLS and near-zero RTT, so this measures only the TCP connect /
+teardown saved per call; against the real API each avoided TLS handshake saves one
+or two further round trips, and the gap is correspondingly larger.
+
+Usage:
+    python benchmarks/bench_session.py
+    python benchmarks/bench_session.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+import requests
+
+from combocurve_api_helper.base import APIBase
+
+_BODY = b'[{"id": "5e272d38b78910dd2a1bd691", "name": "Example"}]'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep connections open between requests
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _time_calls(call: Callable[[], requests.Response], n: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        call().raise_for_status()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    ms = sorted(s * 1000.0 for s in samples)
+    p95 = ms[int(0.95 * (len(ms) - 1))]
+    print(f'{label:<24} mean {statistics.mean(ms):7.3f} ms   p50 {statistics.median(ms):7.3f} ms   p95 {p95:7.3f} ms')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500, help='requests per mode (default 500)')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/v1/projects'
+
+    # Only the transport is exercised, so skip credential loading entirely.
+    api = APIBase.__new__(APIBase)
+    api._init_transport()
+
+    try:
+        unpooled = _time_calls(lambda: requests.request('get', url), args.requests)
+        pooled = _time_calls(lambda: api._send('get', url, headers={}), args.requests)
+    finally:
+        api.close()
+        server.shutdown()
+
+    _report('requests.request', unpooled)
+    _report('APIBase.session', pooled)
+    print(f'speedup (mean)           {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x')
+
+
+if __name__ == '__main__':
+    main()
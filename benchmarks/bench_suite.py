@@ -0,0 +1,297 @@
+"""Offline benchmark suite, with JSON results for comparing releases.
+
+Measures, against a local `fake_server` (run in a subprocess so the server does
+not compete with the client for the GIL):
+
+- ``pagination``: `_get_items` rows/s reading one collection at each `take`;
+- ``revalidation``: seconds and bytes received re-reading that collection
+  in full, and through an expired `ResponseCache` entry answered by 304s;
+- ``batch_write``: `_request_batched` records/s across `chunksize` x `max_workers`;
+- ``keysort``: `APIBase._keysort` rows/s from 1k to 1M scenario-like rows;
+- ``csv``: `to_csv` / `from_csv` rows/s for every mapper in `econ_models.MAPPERS`,
+  on the round-trip test fixtures replicated to `--csv-models` models;
+- ``import``: cold-start seconds in a fresh interpreter of the bare package
+  import, of a client ready to send, and of loading an econ-model mapper.
+
+Every measurement is the best of `--repeat` runs. Results are written as JSON
+(``{"meta": {...}, "results": [{"benchmark", "params", "metric", "value",
+"better"}, ...]}``); `--compare` diffs them against an earlier file and exits
+non-zero when any metric regressed by more than `--threshold`.
+
+Usage:
+    python benchmarks/bench_suite.py --output bench-2.1.0.json
+    python benchmarks/bench_suite.py --quick --only keysort csv
+    python benchmarks/bench_suite.py --output new.json --compare bench-2.1.0.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from combocurve_api_helper import __version__
+from combocurve_api_helper.base import APIBase, ItemList
+from combocurve_api_helper.econ_models.registry import MAPPERS
+from combocurve_api_helper.fake_server import client_for
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'econ_models', 'fixtures')
+_CSV_FIXTURES: Dict[str, str] = {
+    'StreamProperties': 'stream_properties.csv',
+    'Differentials': 'differentials.csv',
+    'ProductionTaxes': 'production_taxes.csv',
+    'Expenses': 'expenses.csv',
+    'Capex': 'capex.csv',
+    'ReservesCategory': 'reserves_category.csv',
+    'Pricing': 'pricing.csv',
+    'Dates': 'date_settings.csv',
+    'OwnershipReversion': 'ownership_reversion.csv',
+    'ActualOrForecast': 'actual_or_forecast.csv',
+    'Risking': 'risking.csv',
+}
+_SCENARIO_ORDER = {'name': 0, 'id': 3, 'createdAt': 2, 'updatedAt': 1}  # as in `get_scenarios`
+_WRITE_PATTERN = '/v1/projects/*/forecasts/*/parameters'
+_BENCHMARKS = ('pagination', 'revalidation', 'batch_write', 'keysort', 'csv', 'import')
+
+Result = Dict[str, Any]
+
+
+def _best_of(call: Callable[[], object], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def _result(benchmark: str, params: Dict[str, Any], metric: str, value: float, better: str) -> Result:
+    print(f'  {benchmark:<12} {json.dumps(params):<66} {metric:<26} {value:14,.4f}')
+    return {'benchmark': benchmark, 'params': params, 'metric': metric, 'value': value, 'better': better}
+
+
+class _FakeServerProcess:
+    """`python -m combocurve_api_helper.fake_server` on a free port, for the duration of a `with` block."""
+
+    def __init__(self, rows: int, latency: float) -> None:
+        self.args = [
+            sys.executable,
+            '-m',
+            'combocurve_api_helper.fake_server',
+            '--port',
+            '0',
+            '--max-take',
+            '1000',
+            '--latency',
+            str(latency),
+            '--collection',
+            f'/v1/wells={rows}',
+            '--collection',
+            f'{_WRITE_PATTERN}=0',
+        ]
+
+    def __enter__(self) -> str:
+        self.process = subprocess.Popen(self.args, stdout=subprocess.PIPE, text=True)
+        assert self.process.stdout is not None
+        banner = self.process.stdout.readline()  # 'Serving a fake ComboCurve API at <url> (...)'
+        return banner.split(' at ')[1].split()[0]
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.process.terminate()
+        self.process.wait()
+
+
+def bench_pagination(base_url: str, takes: List[int], repeat: int) -> Iterator[Result]:
+    api = client_for(base_url)
+    url = f'{base_url}/wells'
+    rows = len(api._get_items(url, {'take': max(takes)}))
+    for take in takes:
+        seconds = _best_of(lambda: api._get_items(url, {'take': take}), repeat)
+        yield _result('pagination', {'take': take, 'rows': rows}, 'rows_per_second', rows / seconds, 'higher')
+    api.close()
+
+
+def bench_revalidation(base_url: str, take: int, repeat: int) -> Iterator[Result]:
+    url = f'{base_url}/wells'
+    for mode in ('full', 'revalidated'):
+        api = client_for(base_url)
+        metrics = api.enable_metrics()
+        if mode == 'revalidated':
+            api.enable_cache(ttl=1e-9)  # every call after the first revalidates
+        api._get_items(url, {'take': take})
+        metrics.reset()
+        seconds = _best_of(lambda: api._get_items(url, {'take': take}), repeat)
+        received = metrics.snapshot()['GET /v1/wells']['bytes_received'] / repeat
+        params = {'mode': mode, 'take': take}
+        yield _result('revalidation', params, 'seconds', seconds, 'lower')
+        yield _result('revalidation', params, 'bytes_received', received, 'lower')
+        api.close()
+
+
+def bench_batch_write(
+    base_url: str, records: int, chunksizes: List[int], workers: List[int], repeat: int
+) -> Iterator[Result]:
+    api = client_for(base_url)
+    url = f'{base_url}/projects/a/forecasts/b/parameters'
+    data: ItemList = [
+        {'well': f'5e272d38b78910dd2a1b{i:04x}', 'phase': 'oil', 'series': 'best', 'forecastType': 'rate'}
+        for i in range(records)
+    ]
+    for chunksize in chunksizes:
+        for max_workers in workers:
+            seconds = _best_of(
+                lambda: api._request_batched('post', url, data, chunksize=chunksize, max_workers=max_workers), repeat
+            )
+            params = {'chunksize': chunksize, 'max_workers': max_workers, 'records': records}
+            yield _result('batch_write', params, 'records_per_second', records / seconds, 'higher')
+    api.close()
+
+
+def _scenario_rows(n: int) -> ItemList:
+    return [
+        {
+            'id': f'{(i * 2654435761) % 16**24:024x}',
+            'name': f'Scenario {(i * 7919) % n}',
+            'createdAt': f'2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00.000Z',
+            'updatedAt': f'2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00.000Z',
+        }
+        for i in range(n)
+    ]
+
+
+def bench_keysort(sizes: List[int], repeat: int) -> Iterator[Result]:
+    for n in sizes:
+        items = _scenario_rows(n)
+        seconds = _best_of(lambda: APIBase._keysort(items, _SCENARIO_ORDER), repeat if n < 1_000_000 else 1)
+        yield _result('keysort', {'rows': n}, 'rows_per_second', n / seconds, 'higher')
+
+
+def _replicate(models: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    return [{**models[i % len(models)], 'name': f'{models[i % len(models)]["name"]} #{i}'} for i in range(count)]
+
+
+def bench_csv(models_per_mapper: int, repeat: int) -> Iterator[Result]:
+    for model_type, mapper in sorted(MAPPERS.items()):
+        with open(os.path.join(_FIXTURES_DIR, _CSV_FIXTURES[model_type]), encoding='utf-8', newline='') as f:
+            models = _replicate(mapper.from_csv(f.read()), models_per_mapper)
+        text = mapper.to_csv(models)
+        rows = text.count('\r\n') - 1  # minus the header
+        params = {'mapper': model_type, 'models': len(models), 'rows': rows}
+        yield _result(
+            'csv', params, 'to_csv_rows_per_second', rows / _best_of(lambda: mapper.to_csv(models), repeat), 'higher'
+        )
+        yield _result(
+            'csv', params, 'from_csv_rows_per_second', rows / _best_of(lambda: mapper.from_csv(text), repeat), 'higher'
+        )
+
+
+# Cold-start steps, each timed in a fresh interpreter: the bare package import,
+# a client ready to send (mixins, `requests`, bundled assets), and a mapper.
+_STARTUP = {
+    'package': 'import combocurve_api_helper',
+    'client': 'from combocurve_api_helper import ComboCurveAPI; ComboCurveAPI.offline().ECON_MODELS',
+    'econ_models': 'from combocurve_api_helper.econ_models import get_mapper; get_mapper("Expenses")',
+}
+
+
+def bench_import(repeat: int) -> Iterator[Result]:
+    for startup, statement in _STARTUP.items():
+        code = f'import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)'
+        samples = [
+            float(subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout)
+            for _ in range(repeat)
+        ]
+        yield _result('import', {'startup': startup}, 'seconds_min', min(samples), 'lower')
+        yield _result('import', {'startup': startup}, 'seconds_median', statistics.median(samples), 'lower')
+
+
+def _key(result: Result) -> Tuple[str, str, str]:
+    return result['benchmark'], json.dumps(result['params'], sort_keys=True), result['metric']
+
+
+def compare(baseline: Dict[str, Any], results: List[Result], threshold: float) -> int:
+    """Print each metric's change against `baseline`; return the number of regressions beyond `threshold`."""
+    before = {_key(r): r for r in baseline['results']}
+    print(f'\nCompared with {baseline["meta"]["version"]} ({baseline["meta"]["timestamp"]}):')
+    regressions = 0
+    for result in results:
+        old = before.get(_key(result))
+        if old is None or not old['value']:
+            continue
+        change = result['value'] / old['value'] - 1
+        worse = -change if result['better'] == 'higher' else change
+        flag = 'REGRESSION' if worse > threshold else ''
+        regressions += bool(flag)
+        benchmark, params, metric = _key(result)
+        print(f'  {benchmark:<12} {params:<66} {metric:<26} {change:+8.1%} {flag}')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative change counted as a regression')
+    parser.add_argument('--only', nargs='+', choices=_BENCHMARKS, help='benchmarks to run (default all)')
+    parser.add_argument('--quick', action='store_true', help='smaller inputs and fewer repeats, for a smoke run')
+    parser.add_argument('--repeat', type=int, default=None, help='timing repetitions (default 5, 2 with --quick)')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds of fake-server latency per request')
+    parser.add_argument('--rows', type=int, default=None, help='rows in the paginated collection (default 10000)')
+    parser.add_argument('--csv-models', type=int, default=None, help='models per CSV mapper (default 500)')
+    args = parser.parse_args()
+
+    repeat = args.repeat or (2 if args.quick else 5)
+    rows = args.rows or (2_000 if args.quick else 10_000)
+    selected = set(args.only or _BENCHMARKS)
+    results: List[Result] = []
+
+    if selected & {'pagination', 'revalidation', 'batch_write'}:
+        with _FakeServerProcess(rows, args.latency) as base_url:
+            if 'pagination' in selected:
+                results.extend(bench_pagination(base_url, [25, 50, 100, 200, 1000], repeat))
+            if 'revalidation' in selected:
+                results.extend(bench_revalidation(base_url, 200, repeat))
+            if 'batch_write' in selected:
+                records = 500 if args.quick else 2_000
+                results.extend(bench_batch_write(base_url, records, [10, 25, 50, 100], [1, 4, 10], repeat))
+    if 'keysort' in selected:
+        sizes = [1_000, 10_000, 100_000] if args.quick else [1_000, 10_000, 100_000, 1_000_000]
+        results.extend(bench_keysort(sizes, repeat))
+    if 'csv' in selected:
+        results.extend(bench_csv(args.csv_models or (50 if args.quick else 500), repeat))
+    if 'import' in selected:
+        results.extend(bench_import(max(repeat, 5)))
+
+    report = {
+        'meta': {
+            'version': __version__,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'repeat': repeat,
+            'latency': args.latency,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f'\nWrote {len(results)} results to {args.output}')
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        if regressions:
+            sys.exit(f'{regressions} metric(s) regressed by more than {args.threshold:.0%}')
+
+
+if __name__ == '__main__':
+    main()
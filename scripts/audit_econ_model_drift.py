@@ -21,7 +21,7 @@ import argparse
 import sys
 from typing import Any, Dict, List, Sequence, Set
 
-from combocurve_api_helper import ComboCurveAPI
+from combocurve_api_helper import ComboCurveAPI, NameResolver
 from combocurve_api_helper.econ_models import MAPPERS, drift
 
 # econModelType -> ComboCurveAPI getter method name.
@@ -52,10 +52,8 @@ def fetch_models(
 
 
 def resolve_project_ids(api: ComboCurveAPI, names: Sequence[str]) -> List[str]:
-    projects = api.get_projects()
     ids: List[str] = []
-    for name in names:
-        pid = api.extract_id(projects, name)
+    for name, pid in NameResolver(api).ids('projects', names).items():
         if pid is None:
             print(f'  ! project not found, skipping: {name!r}', file=sys.stderr)
             continue
@@ -1,52 +1,113 @@
+"""ComboCurve API helper.
+
+Public names are imported on first access (PEP 562), so ``import
+combocurve_api_helper`` is cheap and reads no config files: the resource
+mixins, `requests` and the bundled assets load only when `ComboCurveAPI` (or
+another name that needs them) is first used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = '2.0.0'
 
-from .root import Root
-from .projects import Projects
-from .scenarios import Scenarios
-from .production import Production
-from .econ_runs import EconRuns
-from .wells import Wells
-from .models import Models
-from .company_models import CompanyModels
-from .forecasts import Forecasts
-from .typecurves import TypeCurves
-from .directional import Directional
-from .forecast_configurations import ForecastConfigurations
-from .ownership_qualifiers import OwnershipQualifiers
-from .exports import Exports
-
-# Explicit re-export (`as`) so downstream `mypy --strict`
-# (--no-implicit-reexport) sees these public types as exported.
-from .base import Item as Item
-from .base import ItemList as ItemList
-from .base import JsonValue as JsonValue
-from .base import WriteResponse as WriteResponse
-from .base import WriteError as WriteError
-from ._batch import BatchChunk as BatchChunk
-from ._batch import BatchWriteResult as BatchWriteResult
-
-
-class ComboCurveAPI(
-    Root,
-    Projects,
-    Scenarios,
-    Production,
-    EconRuns,
-    Wells,
-    Models,
-    CompanyModels,
-    Forecasts,
-    TypeCurves,
-    Directional,
-    ForecastConfigurations,
-    OwnershipQualifiers,
-    Exports,
-):
-    """
-    This class is the primary interface for interacting with the Combo Curve
-    API. It inherits all of the API endpoints from the other classes in this
-    module. It is intended to be used as a single entrypoint for interacting
-    with the ComboCurve API.
-    """
-
-    pass
+if TYPE_CHECKING:
+    # Explicit re-export (`as`) so downstream `mypy --strict`
+    # (--no-implicit-reexport) sees these public types as exported.
+    from ._api import ComboCurveAPI as ComboCurveAPI
+    from .root import Root as Root
+    from .projects import Projects as Projects
+    from .scenarios import Scenarios as Scenarios
+    from .production import Production as Production
+    from .econ_runs import EconRuns as EconRuns
+    from .wells import Wells as Wells
+    from .models import Models as Models
+    from .company_models import CompanyModels as CompanyModels
+    from .forecasts import Forecasts as Forecasts
+    from .typecurves import TypeCurves as TypeCurves
+    from .directional import Directional as Directional
+    from .forecast_configurations import ForecastConfigurations as ForecastConfigurations
+    from .ownership_qualifiers import OwnershipQualifiers as OwnershipQualifiers
+    from .exports import Exports as Exports
+    from .base import Item as Item
+    from .base import ItemList as ItemList
+    from .base import JsonValue as JsonValue
+    from .base import WriteResponse as WriteResponse
+    from .base import WriteError as WriteError
+    from ._batch import BatchChunk as BatchChunk
+    from ._batch import BatchWriteResult as BatchWriteResult
+    from ._auth import AuthHeaderStats as AuthHeaderStats
+    from ._rate_limit import TokenBucket as TokenBucket
+    from ._codec import JSONCodec as JSONCodec
+    from ._compress import CompressionStats as CompressionStats
+    from ._hooks import HookRegistry as HookRegistry
+    from ._hooks import RequestEvent as RequestEvent
+    from ._hooks import RequestHook as RequestHook
+    from ._metrics import RequestMetrics as RequestMetrics
+    from ._planner import PlannedRequest as PlannedRequest
+    from ._planner import RequestPlan as RequestPlan
+    from ._deadline import DeadlineExceeded as DeadlineExceeded
+    from ._cache import CacheStats as CacheStats
+    from ._cache import ResponseCache as ResponseCache
+    from ._resolver import NameResolver as NameResolver
+    from ._mirror import LocalMirror as LocalMirror
+    from ._codec import OrjsonCodec as OrjsonCodec
+    from ._codec import StdlibJSONCodec as StdlibJSONCodec
+
+# public name -> the module defining it
+_LAZY: Dict[str, str] = {
+    'ComboCurveAPI': '._api',
+    'Root': '.root',
+    'Projects': '.projects',
+    'Scenarios': '.scenarios',
+    'Production': '.production',
+    'EconRuns': '.econ_runs',
+    'Wells': '.wells',
+    'Models': '.models',
+    'CompanyModels': '.company_models',
+    'Forecasts': '.forecasts',
+    'TypeCurves': '.typecurves',
+    'Directional': '.directional',
+    'ForecastConfigurations': '.forecast_configurations',
+    'OwnershipQualifiers': '.ownership_qualifiers',
+    'Exports': '.exports',
+    'Item': '.base',
+    'ItemList': '.base',
+    'JsonValue': '.base',
+    'WriteResponse': '.base',
+    'WriteError': '.base',
+    'BatchChunk': '._batch',
+    'BatchWriteResult': '._batch',
+    'AuthHeaderStats': '._auth',
+    'TokenBucket': '._rate_limit',
+    'JSONCodec': '._codec',
+    'CompressionStats': '._compress',
+    'HookRegistry': '._hooks',
+    'RequestEvent': '._hooks',
+    'RequestHook': '._hooks',
+    'RequestMetrics': '._metrics',
+    'PlannedRequest': '._planner',
+    'RequestPlan': '._planner',
+    'DeadlineExceeded': '._deadline',
+    'CacheStats': '._cache',
+    'ResponseCache': '._cache',
+    'NameResolver': '._resolver',
+    'LocalMirror': '._mirror',
+    'OrjsonCodec': '._codec',
+    'StdlibJSONCodec': '._codec',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = globals()[name] = getattr(importlib.import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
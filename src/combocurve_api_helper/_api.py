@@ -0,0 +1,43 @@
+from .root import Root
+from .projects import Projects
+from .scenarios import Scenarios
+from .production import Production
+from .econ_runs import EconRuns
+from .wells import Wells
+from .models import Models
+from .company_models import CompanyModels
+from .forecasts import Forecasts
+from .typecurves import TypeCurves
+from .directional import Directional
+from .forecast_configurations import ForecastConfigurations
+from .ownership_qualifiers import OwnershipQualifiers
+from .exports import Exports
+
+
+class ComboCurveAPI(
+    Root,
+    Projects,
+    Scenarios,
+    Production,
+    EconRuns,
+    Wells,
+    Models,
+    CompanyModels,
+    Forecasts,
+    TypeCurves,
+    Directional,
+    ForecastConfigurations,
+    OwnershipQualifiers,
+    Exports,
+):
+    """
+    This class is the primary interface for interacting with the Combo Curve
+    API. It inherits all of the API endpoints from the other classes in this
+    module. It is intended to be used as a single entrypoint for interacting
+    with the ComboCurve API.
+    """
+
+    pass
+
+
+ComboCurveAPI.__module__ = 'combocurve_api_helper'  # its public home, as before the lazy package import
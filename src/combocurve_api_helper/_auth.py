@@ -0,0 +1,132 @@
+"""Expiry-aware, thread-safe cache of the request auth headers.
+
+`ComboCurveAuth.get_auth_headers()` decodes (and, near expiry, re-signs) the
+service-account JWT on every call, and is not safe to call from many threads
+at once. `_AuthHeaderCache` sits in front of it: it records the token's `exp`
+claim, serves the cached headers lock-free until shortly before that, and then
+lets exactly one thread refresh while the others either keep using the
+still-valid headers or, once they have actually expired, wait for the refresh.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+
+# Refresh this many seconds before the token's `exp`. Must stay below
+# ComboCurveAuth's own `seconds_before_token_expire` (60s by default), otherwise
+# the refresh would just return the same about-to-expire token.
+_REFRESH_AHEAD_SECONDS = 30.0
+# How long to trust headers whose token carries no readable `exp` claim.
+_FALLBACK_TTL_SECONDS = 300.0
+# Lower bound between refreshes, so a token that is already inside the refresh
+# window does not trigger a refresh on every request.
+_MIN_REFRESH_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class AuthHeaderStats:
+    """Counters of an API instance's auth header cache."""
+
+    refreshes: int  # times the headers were (re)signed
+    signing_seconds: float  # total wall time spent inside those refreshes
+    waits: int  # requests that blocked on another thread's refresh of expired headers
+
+
+class _Entry(NamedTuple):
+    headers: Dict[str, str]
+    refresh_at: float  # epoch seconds after which a refresh is due
+    expires_at: float  # epoch seconds after which the headers must not be sent
+
+
+def _token_expiry(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the `exp` claim (epoch seconds) of the bearer JWT in `headers`, if readable.
+
+    Only the payload is decoded; the signature is not verified (the token is
+    our own, and the server is the authority on it).
+    """
+    authorization = headers.get('Authorization', '')
+    if not authorization.startswith('Bearer '):
+        return None
+    parts = authorization[len('Bearer ') :].split('.')
+    if len(parts) != 3:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + '=' * (-len(parts[1]) % 4)))
+        return float(payload['exp'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class _AuthHeaderCache:
+    """Single-flight, expiry-aware cache around an auth-header factory."""
+
+    def __init__(self, fetch: Callable[[], Mapping[str, str]], refresh_ahead_seconds: float = _REFRESH_AHEAD_SECONDS):
+        self._fetch = fetch
+        self._refresh_ahead_seconds = refresh_ahead_seconds
+        self._entry: Optional[_Entry] = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._refreshes = 0
+        self._signing_seconds = 0.0
+        self._waits = 0
+
+    def get(self) -> Mapping[str, str]:
+        """Return current auth headers, refreshing them ahead of expiry.
+
+        Fresh headers are returned without locking. Once a refresh is due, one
+        caller refreshes; concurrent callers reuse the old headers while they
+        are still valid and only block when they have expired.
+        """
+        entry = self._entry
+        now = time.time()
+        if entry is not None and now < entry.refresh_at:
+            return entry.headers
+
+        still_valid = entry is not None and now < entry.expires_at
+        if not self._lock.acquire(blocking=False):
+            if still_valid:
+                assert entry is not None
+                return entry.headers
+            with self._stats_lock:
+                self._waits += 1
+            self._lock.acquire()
+        try:
+            # another thread may have refreshed while this one waited
+            entry = self._entry
+            if entry is not None and time.time() < entry.refresh_at:
+                return entry.headers
+            return self._refresh().headers
+        finally:
+            self._lock.release()
+
+    def _refresh(self) -> _Entry:
+        start = time.perf_counter()
+        headers = dict(self._fetch())
+        elapsed = time.perf_counter() - start
+
+        now = time.time()
+        expires_at = _token_expiry(headers)
+        if expires_at is None:
+            expires_at = now + _FALLBACK_TTL_SECONDS
+        refresh_at = max(expires_at - self._refresh_ahead_seconds, now + _MIN_REFRESH_INTERVAL_SECONDS)
+        entry = _Entry(headers, min(refresh_at, expires_at), expires_at)
+        self._entry = entry
+
+        with self._stats_lock:
+            self._refreshes += 1
+            self._signing_seconds += elapsed
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop the cached headers; the next `get` re-signs."""
+        self._entry = None
+
+    def stats(self) -> AuthHeaderStats:
+        with self._stats_lock:
+            return AuthHeaderStats(self._refreshes, self._signing_seconds, self._waits)
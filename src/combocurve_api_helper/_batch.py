@@ -15,9 +15,10 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from ._deadline import _Deadline
     from .base import ItemList
 
 
@@ -34,6 +35,14 @@ class BatchChunk:
     results: ItemList = field(default_factory=list)  # 207 results[], aligned to this chunk's payload
     general_errors: ItemList = field(default_factory=list)
     error_message: str = ''  # set on whole-chunk failure (4xx/5xx or exhausted 429 retries)
+    attempts: int = 1  # requests sent for this chunk, retries included
+    request_bytes: int = 0  # body size of one attempt as sent (encoded, after compression)
+    elapsed: float = 0.0  # seconds from the first attempt to the final response, waits included
+    rate_limit_wait: float = 0.0  # seconds this chunk was held by a batch-wide 429 pause
+    backoff_wait: float = 0.0  # seconds slept backing off 502/503/504 before retrying
+    # the chunk failed on a connect/read timeout or ran out of its deadline budget;
+    # after a read timeout the server may still have applied it
+    timed_out: bool = False
 
     @property
     def is_chunk_failure(self) -> bool:
@@ -54,12 +63,37 @@ class BatchWriteResult:
     results: ItemList  # per-record, in the original payload order
     general_errors: ItemList
     chunks: List[BatchChunk]
+    # (seconds since the batch started, concurrency limit) at the start and at
+    # every change; a fixed-concurrency batch has the single entry (0.0, max_workers)
+    concurrency: List[Tuple[float, int]] = field(default_factory=list)
+    elapsed: float = 0.0  # wall seconds from the first chunk sent to the last response
+    rate_limit_pause: float = 0.0  # wall seconds every worker was paused by 429s
 
     @property
     def ok(self) -> bool:
         """True iff every record succeeded and no chunk failed wholesale."""
         return self.failed_count == 0 and not any(c.is_chunk_failure for c in self.chunks)
 
+    @property
+    def timed_out_chunks(self) -> List[BatchChunk]:
+        """Chunks that failed on a timeout or the deadline -- `data[c.offset : c.offset + c.count]` to resend."""
+        return [c for c in self.chunks if c.timed_out]
+
+    @property
+    def bytes_sent(self) -> int:
+        """Request body bytes sent across all chunks and attempts."""
+        return sum(c.request_bytes * c.attempts for c in self.chunks)
+
+    @property
+    def records_per_second(self) -> float:
+        """Records written per wall-clock second (0.0 for an empty batch)."""
+        return sum(c.count for c in self.chunks) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Request body bytes sent per wall-clock second (0.0 for an empty batch)."""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
 
 @dataclass
 class _RateLimitState:
@@ -69,16 +103,107 @@ class _RateLimitState:
     pause_seconds: float
     lock: threading.Lock = field(default_factory=threading.Lock)
     resume_at: float = 0.0
+    paused: float = 0.0  # total wall seconds covered by pauses
+
+    def wait_if_limited(self, deadline: Optional[_Deadline] = None) -> float:
+        """Block until any active rate-limit pause has elapsed; return the seconds waited.
 
-    def wait_if_limited(self) -> None:
-        """Block until any active rate-limit pause has elapsed."""
+        Raises `DeadlineExceeded` instead of starting a pause that would overrun `deadline`.
+        """
         with self.lock:
-            deadline = self.resume_at
-        remaining = deadline - time.monotonic()
+            resume_at = self.resume_at
+        remaining = resume_at - time.monotonic()
         if remaining > 0:
+            if deadline is not None:
+                deadline.check('waiting out a 429 pause', remaining)
             time.sleep(remaining)
+            return remaining
+        return 0.0
 
     def set_limited(self) -> None:
         """Record a 429 hit — all workers pause until `pause_seconds` from now."""
         with self.lock:
-            self.resume_at = max(self.resume_at, time.monotonic() + self.pause_seconds)
+            now = time.monotonic()
+            resume_at = max(self.resume_at, now + self.pause_seconds)
+            self.paused += resume_at - max(self.resume_at, now)
+            self.resume_at = resume_at
+
+
+@dataclass
+class _AdaptiveConcurrency:
+    """AIMD concurrency limit shared by batch-write worker threads.
+
+    Each request attempt holds one of `int(limit)` slots. A fast success (under
+    `latency_target` seconds) grows the limit by `1 / limit` -- about one slot
+    per window of successful requests, up to `ceiling` -- and a congestion
+    signal (429 or a transient gateway error) halves it, at most once per
+    window: responses to requests sent before the last cut don't cut again.
+    """
+
+    ceiling: int
+    latency_target: float
+    limit: float = 1.0
+    in_flight: int = 0
+    epoch: int = 0  # bumped on every cut
+    started: float = field(default_factory=time.monotonic)
+    timeline: List[Tuple[float, int]] = field(default_factory=list)
+    condition: threading.Condition = field(default_factory=threading.Condition)
+
+    def __post_init__(self) -> None:
+        self.limit = float(max(1, min(self.ceiling, int(self.limit))))
+        self.timeline.append((0.0, int(self.limit)))
+
+    def acquire(self) -> int:
+        """Block until a slot is free; return the epoch to hand back to `release`."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            return self.epoch
+
+    def release(self, epoch: int, *, congested: bool, fast: bool) -> None:
+        """Free a slot and adjust the limit from that attempt's outcome."""
+        with self.condition:
+            self.in_flight -= 1
+            before = int(self.limit)
+            if congested:
+                if epoch == self.epoch:
+                    self.limit = max(1.0, self.limit / 2.0)
+                    self.epoch += 1
+            elif fast:
+                self.limit = min(float(self.ceiling), self.limit + 1.0 / self.limit)
+            if int(self.limit) != before:
+                self.timeline.append((time.monotonic() - self.started, int(self.limit)))
+            self.condition.notify_all()
+
+
+@dataclass
+class _AsyncRateLimitState:
+    """`_RateLimitState` for the asyncio client: a 429 in any task pauses every
+    task of the batch. All tasks share one event loop, so no lock is needed."""
+
+    pause_seconds: float
+    resume_at: float = 0.0
+    paused: float = 0.0  # total wall seconds covered by pauses
+
+    async def wait_if_limited(self, deadline: Optional[_Deadline] = None) -> float:
+        """Sleep until any active rate-limit pause has elapsed; return the seconds waited.
+
+        Raises `DeadlineExceeded` instead of starting a pause that would overrun `deadline`.
+        """
+        import asyncio  # deferred: only the asyncio client needs it, and the sync client imports this module
+
+        remaining = self.resume_at - time.monotonic()
+        if remaining > 0:
+            if deadline is not None:
+                deadline.check('waiting out a 429 pause', remaining)
+            await asyncio.sleep(remaining)
+            return remaining
+        return 0.0
+
+    def set_limited(self) -> None:
+        """Record a 429 hit — all tasks pause until `pause_seconds` from now."""
+        now = time.monotonic()
+        resume_at = max(self.resume_at, now + self.pause_seconds)
+        self.paused += resume_at - max(self.resume_at, now)
+        self.resume_at = resume_at
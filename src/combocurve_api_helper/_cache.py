@@ -0,0 +1,414 @@
+"""Opt-in read-through cache of paginated GETs.
+
+Jobs that resolve names to ids call `get_projects`, `get_scenarios`,
+`get_econ_models_by_type`, `get_custom_columns_wells`, ... over and over with the
+same arguments. With a `ResponseCache` installed (`APIBase.enable_cache`),
+`_get_items` / `_get_items_iterator` answer a repeated call from the pages
+stored by the first one::
+
+    cache = api.enable_cache(ttl=300, routes={'/v1/projects': 3600, '/v1/projects/{id}/wells': 0})
+    api.get_projects()  # fetched, every page stored
+    api.get_projects()  # served from the cache
+    print(cache.stats())
+
+Entries are keyed by URL and params and hold every page's raw body, so each
+hit decodes fresh objects (callers may mutate what they get). A call is stored
+only once its last page has been read; a call abandoned midway stores nothing.
+
+- Freshness: each entry lives `ttl` seconds, or the TTL of the first `routes`
+  pattern matching the URL template (``fnmatch`` globs over paths with ids
+  replaced by ``{id}``, as in `RequestEvent.url_template`); 0 disables caching
+  for that route.
+- Size: least recently used entries are evicted beyond `max_entries` entries or
+  `max_bytes` of stored bodies.
+- Invalidation: every POST/PUT/PATCH/DELETE sent through `APIBase._send` (the
+  `_request_items_pages_chunks` pages, the `_request_batched` chunks, the
+  single-object endpoints) drops the entries of its resource: those whose URL,
+  query aside, is the written URL or lies below it. A write to one record also
+  drops the lists of the collection holding it -- the URL with its trailing
+  record-id segments stripped. A write to ``/v1/projects/{id}/scenarios``
+  drops that project's cached scenario lists, and a DELETE of
+  ``/v1/projects/{id}`` the cached ``/v1/projects`` lists too; neither touches
+  the company-level ``/v1/wells``.
+- Revalidation: pages stored with validators (``ETag``, ``Last-Modified``)
+  outlive their TTL. A call finding such an entry expired re-requests each
+  page conditionally (``If-None-Match`` / ``If-Modified-Since``); a 304 reuses
+  the stored body, so an unchanged list costs one empty response per page
+  instead of a download. From the first page that did change, the call reads
+  on normally, and the entry is stored afresh. Validators are trusted to cover
+  a page's ``Link`` header as well as its body. Entries without validators
+  expire outright. A tiny `ttl` therefore revalidates every call.
+- Backends: in memory by default, or an SQLite file at `path` that outlives the
+  process (and can be shared by several).
+
+Keys carry no credentials: do not share one cache between clients of different
+accounts. Only the blocking client uses it; `async_api` reads are not cached.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ._hooks import _ID_SEGMENT, _url_template
+
+_DEFAULT_TTL_SECONDS = 300.0
+_DEFAULT_MAX_ENTRIES = 1024
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Invalidations remembered for reads that were in flight when they happened.
+_INVALIDATION_LOG_SIZE = 256
+_SCHEMA_VERSION = 2  # of the SQLite backend; files of another version are emptied on open
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a `ResponseCache`."""
+
+    hits: int  # calls answered from the cache, revalidated ones included
+    misses: int  # calls that went to the network (absent, expired, or changed since stored)
+    stores: int  # calls whose pages were stored
+    evictions: int  # entries dropped to stay within `max_entries` / `max_bytes`
+    invalidations: int  # entries dropped by writes (or `invalidate`)
+    revalidations: int  # hits on expired entries, confirmed unchanged by 304s
+    entries: int  # entries currently stored
+    bytes: int  # their page bodies' size
+
+    @property
+    def hit_ratio(self) -> float:
+        """Hits / lookups (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _CachedPage:
+    url: str  # the page's request URL, query included
+    body: bytes  # the response body as received
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """The conditional-request headers revalidating this page (empty: it has no validators)."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    resource: str  # the call's URL without its query: what writes invalidate
+    expires_at: float  # epoch seconds
+    pages: Tuple[_CachedPage, ...]
+
+    @property
+    def size(self) -> int:
+        return sum(len(page.body) for page in self.pages)
+
+    @property
+    def revalidatable(self) -> bool:
+        return all(page.validators for page in self.pages)
+
+
+def _cached_page(url: str, body: bytes, headers: Mapping[str, str]) -> _CachedPage:
+    """The page of a response to `url`, with its validators."""
+    return _CachedPage(url, body, headers.get('ETag'), headers.get('Last-Modified'))
+
+
+def _cache_key(url: str, params: Optional[Mapping[str, Union[str, int, float]]]) -> str:
+    """`url` with `params` merged into its query, sorted, so equal requests share a key."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(str(k), str(v)) for k, v in (params or {}).items()]
+    return urlunsplit(parts._replace(query=urlencode(sorted(query)), fragment=''))
+
+
+def _resource(url: str) -> str:
+    return urlunsplit(urlsplit(url)._replace(query='', fragment='')).rstrip('/')
+
+
+def _under(resource: str, prefix: str) -> bool:
+    return not prefix or resource == prefix or resource.startswith(prefix + '/')
+
+
+def _collections_of(resource: str) -> Tuple[str, ...]:
+    """The collections holding the record `resource`: it with one, two, ... trailing record ids stripped."""
+    collections: List[str] = []
+    while True:
+        parent, _, segment = resource.rpartition('/')
+        if not _ID_SEGMENT.fullmatch(segment):
+            return tuple(collections)
+        collections.append(parent)
+        resource = parent
+
+
+def _invalidated_by(resource: str, prefix: str, collections: Tuple[str, ...]) -> bool:
+    """Whether an entry of `resource` is dropped by a write below `prefix` to a record of `collections`."""
+    return _under(resource, prefix) or resource in collections
+
+
+class _MemoryStore:
+    """LRU entries in an `OrderedDict`, least recently used first. Not thread-safe."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: _CacheEntry, max_entries: int, max_bytes: int) -> int:
+        """Store `entry`, then evict least recently used ones over the bounds; return how many."""
+        self.delete(key)
+        self._entries[key] = entry
+        self.bytes += entry.size
+        evicted = 0
+        while len(self._entries) > max_entries or self.bytes > max_bytes:
+            _, oldest = self._entries.popitem(last=False)
+            self.bytes -= oldest.size
+            evicted += 1
+        return evicted
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def delete_invalidated(self, prefix: str, collections: Tuple[str, ...]) -> int:
+        keys = [key for key, entry in self._entries.items() if _invalidated_by(entry.resource, prefix, collections)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+
+class _SQLiteStore:
+    """LRU entries in an SQLite file. Not thread-safe; other processes may share the file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        with self._db:
+            if self._db.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                self._db.execute('DROP TABLE IF EXISTS pages')
+                self._db.execute('DROP TABLE IF EXISTS entries')
+                self._db.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, resource TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL, used INTEGER NOT NULL, size INTEGER NOT NULL)'
+            )
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS pages (key TEXT NOT NULL, seq INTEGER NOT NULL, url TEXT NOT NULL,'
+                ' body BLOB NOT NULL, etag TEXT, last_modified TEXT, PRIMARY KEY (key, seq))'
+            )
+
+    def __len__(self) -> int:
+        count: int = self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        return count
+
+    @property
+    def bytes(self) -> int:
+        size: int = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        return size
+
+    def get(self, key: str) -> Optional[_CacheEntry]:
+        with self._db:
+            row = self._db.execute('SELECT resource, expires_at FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._touch(key)
+            pages = self._db.execute(
+                'SELECT url, body, etag, last_modified FROM pages WHERE key = ? ORDER BY seq', (key,)
+            ).fetchall()
+        return _CacheEntry(row[0], row[1], tuple(_CachedPage(url, bytes(body), *rest) for url, body, *rest in pages))
+
+    def put(self, key: str, entry: _CacheEntry, max_entries: int, max_bytes: int) -> int:
+        with self._db:
+            self._delete(key)
+            self._db.execute(
+                'INSERT INTO entries VALUES (?, ?, ?, 0, ?)', (key, entry.resource, entry.expires_at, entry.size)
+            )
+            self._touch(key)
+            self._db.executemany(
+                'INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    (key, seq, page.url, page.body, page.etag, page.last_modified)
+                    for seq, page in enumerate(entry.pages)
+                ),
+            )
+            stale = []
+            count = size = 0
+            for other, other_size in self._db.execute('SELECT key, size FROM entries ORDER BY used DESC').fetchall():
+                count += 1
+                size += other_size
+                if count > max_entries or size > max_bytes:
+                    stale.append(other)
+            for other in stale:
+                self._delete(other)
+        return len(stale)
+
+    def delete(self, key: str) -> None:
+        with self._db:
+            self._delete(key)
+
+    def delete_invalidated(self, prefix: str, collections: Tuple[str, ...]) -> int:
+        with self._db:
+            keys = [
+                key
+                for (key,) in self._db.execute(
+                    'SELECT key FROM entries WHERE resource = ? OR substr(resource, 1, ?) = ?'
+                    f' OR resource IN ({", ".join("?" * len(collections))})',
+                    (prefix, len(prefix) + 1, prefix + '/', *collections),
+                ).fetchall()
+            ]
+            for key in keys:
+                self._delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._db:
+            self._db.execute('DELETE FROM pages')
+            self._db.execute('DELETE FROM entries')
+
+    def _touch(self, key: str) -> None:
+        self._db.execute(
+            'UPDATE entries SET used = (SELECT COALESCE(MAX(used), 0) + 1 FROM entries) WHERE key = ?', (key,)
+        )
+
+    def _delete(self, key: str) -> None:
+        self._db.execute('DELETE FROM pages WHERE key = ?', (key,))
+        self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of paginated GET bodies, invalidated by writes (see the module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = _DEFAULT_TTL_SECONDS,
+        routes: Optional[Mapping[str, float]] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        path: Union[str, Path, None] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.routes: Dict[str, float] = dict(routes or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._store: Union[_MemoryStore, _SQLiteStore] = _MemoryStore() if path is None else _SQLiteStore(path)
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped by every invalidation
+        # (generation, written resource, collections holding it)
+        self._invalidated: Deque[Tuple[int, str, Tuple[str, ...]]] = deque(maxlen=_INVALIDATION_LOG_SIZE)
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._revalidations = 0
+
+    def ttl_for(self, url: str) -> float:
+        """Seconds a response of `url` stays fresh: the first matching `routes` TTL, else `ttl`."""
+        template = _url_template(url)
+        for pattern, ttl in self.routes.items():
+            if fnmatchcase(template, pattern):
+                return ttl
+        return self.ttl
+
+    def invalidate(self, url: str) -> int:
+        """Drop the entries of `url`'s resource (it and the paths below it) and of the
+        collections holding it, when it is a record; return how many."""
+        prefix = _resource(url)
+        collections = _collections_of(prefix)
+        with self._lock:
+            self._generation += 1
+            self._invalidated.append((self._generation, prefix, collections))
+            dropped = self._store.delete_invalidated(prefix, collections)
+            self._invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        """Drop every entry (the counters are kept)."""
+        with self._lock:
+            self._generation += 1
+            self._invalidated.append((self._generation, '', ()))
+            self._store.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._stores,
+                self._evictions,
+                self._invalidations,
+                self._revalidations,
+                len(self._store),
+                self._store.bytes,
+            )
+
+    def _lookup(self, key: str) -> Tuple[Optional[Tuple[_CachedPage, ...]], bool, int]:
+        """Return the pages stored under `key` (None on a miss), whether they are fresh, and the
+        generation to store the call's pages at.
+
+        Stale pages are returned only when they can be revalidated; the caller
+        reports how that went with `_revalidated`.
+        """
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                if entry.revalidatable:
+                    return entry.pages, False, self._generation
+                self._store.delete(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None, False, self._generation
+            self._hits += 1
+            return entry.pages, True, self._generation
+
+    def _revalidated(self, unchanged: bool) -> None:
+        """Count a revalidated call: a hit when every page was unchanged, else a miss."""
+        with self._lock:
+            if unchanged:
+                self._hits += 1
+                self._revalidations += 1
+            else:
+                self._misses += 1
+
+    def _store_pages(self, key: str, url: str, pages: Iterable[_CachedPage], generation: int) -> None:
+        """Store the pages of a call to `url` looked up at `generation`, unless a write to its resource
+        (or one too long ago to tell) happened since."""
+        ttl = self.ttl_for(url)
+        entry = _CacheEntry(_resource(url), time.time() + ttl, tuple(pages))
+        if ttl <= 0 or entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                since = [(prefix, collections) for g, prefix, collections in self._invalidated if g > generation]
+                if len(since) < self._generation - generation:
+                    return  # the log no longer reaches back to `generation`
+                if any(_invalidated_by(entry.resource, *written) for written in since):
+                    return
+            self._evictions += self._store.put(key, entry, self.max_entries, self.max_bytes)
+            self._stores += 1
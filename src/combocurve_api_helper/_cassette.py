@@ -0,0 +1,211 @@
+"""Record/replay transport: capture real traffic to a cassette file and serve it back offline.
+
+`APIBase.record_cassette(path)` mounts a recording `HTTPAdapter` on the pooled
+session for the duration of a ``with`` block; every response that passes
+through it is stored as an `Interaction` -- status, headers (``Link``,
+``Retry-After``, ...), decoded body, and the time it took -- and written to
+`path` as gzipped JSON lines when the block exits. Request headers (and with
+them the auth token) are never stored.
+
+`APIBase.replay_cassette(path, time_scale=...)` mounts a `CassettePlayer` that
+answers each request with the next recorded response for the same method and
+URL (and, for writes, the same body when recorded), sleeping `time_scale` times
+the recorded duration first: 1.0 replays the original timings, 0 as fast as
+possible. Together with `APIBase.offline()` a captured sync runs against new
+client versions with no network and no credentials::
+
+    with api.record_cassette('month-end.cassette.gz'):
+        run_month_end_sync(api)
+
+    replay = ComboCurveAPI.offline()
+    player = replay.replay_cassette('month-end.cassette.gz', time_scale=1.0)
+    run_month_end_sync(replay)
+    print(player.served, player.remaining)
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+_CASSETTE_FORMAT = 1
+
+# Response headers describing the original framing rather than the recorded
+# (already decoded) body; dropped so a replayed response is self-consistent.
+_UNRECORDED_HEADERS = frozenset(
+    ('connection', 'content-encoding', 'content-length', 'keep-alive', 'set-cookie', 'transfer-encoding')
+)
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """One recorded request/response pair."""
+
+    method: str
+    url: str  # including the query string
+    body_digest: Optional[str]  # sha1 of the request body as sent; None without a body
+    status: int
+    headers: Dict[str, str]
+    body: bytes  # decoded response body
+    started: float  # seconds since recording began
+    elapsed: float  # seconds from sending the request to reading the whole response
+
+
+def _request_body(request: PreparedRequest) -> bytes:
+    """Return `request`'s body as sent: ``b''`` without one, or for a streamed (iterable / file) body."""
+    body = request.body
+    if isinstance(body, str):
+        return body.encode()
+    if isinstance(body, bytes):
+        return body
+    return b''
+
+
+def _digest(body: bytes) -> Optional[str]:
+    return hashlib.sha1(body).hexdigest() if body else None
+
+
+def save_cassette(path: Union[str, os.PathLike[str]], interactions: List[Interaction]) -> None:
+    """Write `interactions` to `path` as gzipped JSON lines (a header line, then one line each)."""
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        header = {'cassette': _CASSETTE_FORMAT, 'saved_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+        f.write(json.dumps(header) + '\n')
+        for interaction in interactions:
+            record: Dict[str, Any] = asdict(interaction)
+            try:
+                record['body'] = interaction.body.decode('utf-8')
+            except UnicodeDecodeError:
+                record['body'] = base64.b64encode(interaction.body).decode('ascii')
+                record['base64'] = True
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+def load_cassette(path: Union[str, os.PathLike[str]]) -> List[Interaction]:
+    """Read the interactions of a cassette written by `save_cassette`."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('cassette') != _CASSETTE_FORMAT:
+            raise ValueError(f'{os.fspath(path)!r} is not a version {_CASSETTE_FORMAT} cassette')
+        interactions: List[Interaction] = []
+        for line in f:
+            record = json.loads(line)
+            body = record.pop('body')
+            record['body'] = base64.b64decode(body) if record.pop('base64', False) else body.encode('utf-8')
+            interactions.append(Interaction(**record))
+    return interactions
+
+
+def _build_response(request: PreparedRequest, status: int, headers: Mapping[str, str], body: bytes) -> Response:
+    """Return a `Response` to `request` whose body (streamed or not) is `body`."""
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.raw = io.BytesIO(body)
+    response.url = request.url or ''
+    response.request = request
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.reason = ''
+    return response
+
+
+class CassetteRecorder(HTTPAdapter):
+    """`HTTPAdapter` that records every response it receives (see `APIBase.record_cassette`)."""
+
+    def __init__(self, pool_connections: int, pool_maxsize: int) -> None:
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.interactions: List[Interaction] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        start = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        body = response.content  # read it all, even for streamed requests, to record it
+        elapsed = time.perf_counter() - start
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNRECORDED_HEADERS}
+        interaction = Interaction(
+            method=(request.method or 'GET').upper(),
+            url=request.url or '',
+            body_digest=_digest(_request_body(request)),
+            status=response.status_code,
+            headers=headers,
+            body=body,
+            started=start - self._origin,
+            elapsed=elapsed,
+        )
+        with self._lock:
+            self.interactions.append(interaction)
+        response.close()
+        return _build_response(request, interaction.status, headers, body)
+
+
+class CassettePlayer(BaseAdapter):
+    """Transport adapter that answers requests from recorded interactions (see `APIBase.replay_cassette`).
+
+    Each request consumes the first unused interaction with the same method,
+    URL and request-body digest, falling back to the same method and URL (so a
+    write whose body changed between client versions still replays). A request
+    with no recorded response raises `requests.ConnectionError`, as an
+    unreachable server would.
+    """
+
+    def __init__(self, interactions: List[Interaction], time_scale: float = 1.0) -> None:
+        super().__init__()
+        self.time_scale = time_scale
+        self.served = 0
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str, Optional[str]], Deque[Interaction]] = {}
+        self._loose: Dict[Tuple[str, str], Deque[Interaction]] = {}
+        for interaction in interactions:
+            key = (interaction.method, interaction.url)
+            self._queues.setdefault((*key, interaction.body_digest), deque()).append(interaction)
+            self._loose.setdefault(key, deque()).append(interaction)
+
+    @property
+    def remaining(self) -> int:
+        """Recorded interactions not replayed (yet)."""
+        with self._lock:
+            return sum(len(queue) for queue in self._loose.values())
+
+    def _take(self, method: str, url: str, digest: Optional[str]) -> Optional[Interaction]:
+        with self._lock:
+            exact = self._queues.get((method, url, digest))
+            loose = self._loose.get((method, url))
+            if exact:
+                interaction = exact.popleft()
+                assert loose is not None
+                loose.remove(interaction)
+            elif loose:
+                interaction = loose.popleft()
+                self._queues[(method, url, interaction.body_digest)].remove(interaction)
+            else:
+                return None
+            self.served += 1
+            return interaction
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        method = (request.method or 'GET').upper()
+        interaction = self._take(method, request.url or '', _digest(_request_body(request)))
+        if interaction is None:
+            raise requests.ConnectionError(f'no recorded response left for {method} {request.url}', request=request)
+        if self.time_scale > 0:
+            time.sleep(interaction.elapsed * self.time_scale)
+        return _build_response(request, interaction.status, interaction.headers, interaction.body)
+
+    def close(self) -> None:
+        pass
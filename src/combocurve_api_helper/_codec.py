@@ -0,0 +1,94 @@
+"""Pluggable JSON codec for request bodies and response parsing.
+
+Every write payload is encoded, and every response body decoded, by
+`APIBase.codec`. The default is `default_codec()`: orjson when it is installed
+(several times faster on 20k-row production pages and monthly-export pages),
+otherwise the stdlib `json` module. Any object with `dumps(obj) -> bytes` and
+`loads(bytes) -> object` can be installed instead, per instance
+(``api.codec = ...``) or process-wide (``APIBase.codec = ...``).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Union
+
+from typing_extensions import Protocol
+
+
+class JSONCodec(Protocol):
+    """What `APIBase` needs from a JSON implementation."""
+
+    @property
+    def name(self) -> str: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+
+class StdlibJSONCodec:
+    """The stdlib `json` module; always available."""
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        # `allow_nan=False` and compact separators match what `requests` sends for `json=`
+        return json.dumps(obj, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """orjson: Rust-backed encode/decode. Raises ImportError if orjson is missing.
+
+    numpy scalars and arrays (common in payloads built from DataFrames) are
+    serialized natively; anything else orjson cannot encode falls back to
+    whatever stdlib `json` would do with it -- i.e. a `TypeError`. NaN and
+    infinities, which orjson would write as ``null``, raise `ValueError` like
+    `StdlibJSONCodec` does.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps: Callable[..., bytes] = orjson.dumps
+        self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+        self._option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        data = self._dumps(obj, option=self._option)
+        if b'null' in data:  # orjson writes NaN and infinities as null: only then can `obj` hold one
+            _reject_non_finite(obj)
+        return data
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+def _reject_non_finite(obj: Any) -> None:
+    """Raise `ValueError`, as stdlib `json.dumps(allow_nan=False)` does, if `obj` holds a NaN or infinity."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f'Out of range float values are not JSON compliant: {value!r}')
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif getattr(getattr(value, 'dtype', None), 'kind', None) == 'f':  # numpy float scalars and arrays
+            stack.append(value.tolist())
+
+
+def default_codec() -> JSONCodec:
+    """Return the fastest installed codec: orjson if importable, else stdlib `json`."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
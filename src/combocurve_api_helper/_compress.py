@@ -0,0 +1,78 @@
+"""Opt-in gzip encoding of large request bodies.
+
+Bulk writes (daily productions, forecast parameters with verbose segment
+arrays, well upserts) are repetitive JSON that gzips more than tenfold, and on
+a slow uplink the upload dominates each request. `_RequestCompressor` gzips
+encoded bodies of at least `min_bytes` before `APIBase._send` puts them on the
+wire (marking them ``Content-Encoding: gzip``), and counts what it saved.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# Bodies below this many encoded bytes are sent as-is: a small body fits in a
+# packet or two either way. A 25-record forecast-parameters chunk is ~9 KB.
+_GZIP_MIN_BYTES = 4 * 1024
+# On forecast-parameter payloads level 5 gets within ~2% of level 9's ratio
+# (~10x) at under 80% of its CPU time.
+_GZIP_LEVEL = 5
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """Counters of an API instance's request-body compression."""
+
+    compressed_requests: int  # bodies sent gzip-encoded
+    uncompressed_bytes: int  # their size before compression
+    compressed_bytes: int  # their size on the wire
+    compress_seconds: float  # total CPU time spent compressing
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.uncompressed_bytes - self.compressed_bytes
+
+    @property
+    def ratio(self) -> float:
+        """Uncompressed / compressed size (1.0 before anything was compressed)."""
+        return self.uncompressed_bytes / self.compressed_bytes if self.compressed_bytes else 1.0
+
+
+class _RequestCompressor:
+    """Thread-safe gzip step for request bodies of at least `min_bytes` (None: disabled)."""
+
+    def __init__(self, min_bytes: Optional[int] = None, level: int = _GZIP_LEVEL) -> None:
+        self.min_bytes = min_bytes
+        self.level = level
+        self._lock = threading.Lock()
+        self._compressed_requests = 0
+        self._uncompressed_bytes = 0
+        self._compressed_bytes = 0
+        self._compress_seconds = 0.0
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Return `body` gzipped, or None to send it as-is (too small, or gzip didn't shrink it)."""
+        if self.min_bytes is None or len(body) < self.min_bytes:
+            return None
+        start = time.perf_counter()
+        # mtime=0 keeps the output deterministic (retries resend identical bytes)
+        compressed = gzip.compress(body, compresslevel=self.level, mtime=0)
+        elapsed = time.perf_counter() - start
+        if len(compressed) >= len(body):
+            return None
+        with self._lock:
+            self._compressed_requests += 1
+            self._uncompressed_bytes += len(body)
+            self._compressed_bytes += len(compressed)
+            self._compress_seconds += elapsed
+        return compressed
+
+    def stats(self) -> CompressionStats:
+        with self._lock:
+            return CompressionStats(
+                self._compressed_requests, self._uncompressed_bytes, self._compressed_bytes, self._compress_seconds
+            )
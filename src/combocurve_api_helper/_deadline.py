@@ -0,0 +1,91 @@
+"""Per-call deadline budgets spanning retries, pagination and batch chunks.
+
+Every request already carries connect/read timeouts (`APIBase.timeout`), so a
+stalled socket fails instead of hanging its thread. A deadline bounds a whole
+call on top of that::
+
+    with api.deadline(120):
+        wells = api.get_wells()  # every page, retries included, within 120 s
+
+Inside the block each request's timeouts are clipped to the time left; a
+retry whose wait (a 429's `Retry-After` or 60 s pause, a gateway backoff, a
+rate-limiter delay) would overrun the budget is not started, and
+`DeadlineExceeded` is raised instead. Batched writes (`_request_batched`) do not
+raise: chunks that run out of budget come back as timed-out chunk failures of a
+partial `BatchWriteResult`.
+
+The deadline lives in a context variable, so it applies to the calling thread
+or asyncio task (and the tasks it spawns), plus the worker threads the batch
+and windowed-read helpers start on its behalf. Nested blocks keep the earlier
+expiry.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+# Socket timers can fire a hair before `time.monotonic()` reaches the expiry they were clipped to.
+_TIMER_SLACK_SECONDS = 0.01
+
+_current: ContextVar[Optional[_Deadline]] = ContextVar('combocurve_api_helper_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """A call's deadline budget (`APIBase.deadline`) ran out, or the next wait would overrun it."""
+
+
+@dataclass(frozen=True)
+class _Deadline:
+    seconds: float  # the budget as given
+    expires_at: float  # `time.monotonic()` at expiry
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def check(self, what: str, needed: float = 0.0) -> float:
+        """Return the seconds left, raising `DeadlineExceeded` unless more than `needed` are."""
+        remaining = self.remaining()
+        if remaining <= needed:
+            raise self.exceeded(f'before {what}')
+        return remaining
+
+    def expired(self) -> bool:
+        return self.remaining() <= _TIMER_SLACK_SECONDS
+
+    def exceeded(self, when: str) -> DeadlineExceeded:
+        left = max(0.0, self.remaining())
+        return DeadlineExceeded(f'{self.seconds:g} s deadline exceeded {when} ({left:.3f} s left)')
+
+
+def _current_deadline() -> Optional[_Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def _deadline_scope(seconds: float) -> Iterator[_Deadline]:
+    deadline = _Deadline(seconds, time.monotonic() + seconds)
+    outer = _current.get()
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def _request_timeout(
+    timeout: Optional[Tuple[float, float]], deadline: Optional[_Deadline]
+) -> Optional[Tuple[float, float]]:
+    """Return the (connect, read) timeouts for one request: `timeout` clipped to the time left."""
+    if deadline is None:
+        return timeout
+    remaining = deadline.check('sending a request')
+    if timeout is None:
+        return (remaining, remaining)
+    connect, read = timeout
+    return (min(connect, remaining), min(read, remaining))
@@ -0,0 +1,93 @@
+"""Request lifecycle hooks.
+
+Every request the client sends goes through `APIBase._send` (or the async
+client's `_asend`), and every retry decision through the retry loops around it.
+Each of those points reports a `RequestEvent` to the instance's `HookRegistry`
+(``api.hooks``), so callers can feed their own logging or telemetry::
+
+    api.hooks.add(lambda event: log.info('%s %s %s', event.kind, event.url_template, event.status))
+
+Events are emitted on the thread that sent the request -- `_request_batched`'s
+worker threads included -- so hooks must be thread-safe. A hook that raises
+is reported as a `RuntimeWarning` and never fails the request.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from typing_extensions import Literal, TypeAlias
+
+EventKind: TypeAlias = Literal['start', 'response', 'retry', 'give_up']
+
+# Path segments that identify one record (ObjectIds, UUIDs) and are replaced by
+# `{id}` in `RequestEvent.url_template`, so events group by endpoint.
+_ID_SEGMENT = re.compile(r'[0-9a-fA-F]{24}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}')
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """One step in the life of a request.
+
+    - ``start``: about to send attempt `attempt`; `sleep` is the rate limiter's wait.
+    - ``response``: a response arrived (any status); `elapsed` covers the round trip.
+    - ``retry``: a retryable status (429/502/503/504); the next attempt follows `sleep` seconds.
+    - ``give_up``: retries are exhausted (`status` set) or sending raised (`error` set).
+    """
+
+    kind: EventKind
+    method: str
+    url: str
+    url_template: str  # path only, with record ids replaced by `{id}`
+    params: Optional[Mapping[str, Union[str, int, float]]]
+    attempt: int  # 0 for the first send, counting up per retry
+    status: Optional[int] = None
+    bytes_sent: int = 0  # request body as sent (after compression)
+    bytes_received: int = 0  # response body (`Content-Length`, else decoded size; 0 while streaming)
+    elapsed: float = 0.0  # seconds
+    sleep: float = 0.0  # seconds
+    error: Optional[BaseException] = None
+
+
+RequestHook: TypeAlias = Callable[[RequestEvent], None]
+
+
+def _url_template(url: str) -> str:
+    """Return `url`'s path with record-id segments replaced by `{id}`."""
+    path = urlsplit(url).path
+    return '/'.join('{id}' if _ID_SEGMENT.fullmatch(segment) else segment for segment in path.split('/'))
+
+
+class HookRegistry:
+    """Thread-safe set of `RequestHook`s, called in registration order."""
+
+    def __init__(self) -> None:
+        self._hooks: Tuple[RequestHook, ...] = ()
+        self._lock = threading.Lock()
+
+    def add(self, hook: RequestHook) -> Callable[[], None]:
+        """Register `hook`; return a callable that unregisters it."""
+        with self._lock:
+            self._hooks = (*self._hooks, hook)
+        return lambda: self.remove(hook)
+
+    def remove(self, hook: RequestHook) -> None:
+        """Unregister `hook` (a no-op if it is not registered)."""
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def emit(self, event: RequestEvent) -> None:
+        """Call every hook with `event`, turning hook exceptions into warnings."""
+        for hook in self._hooks:  # an immutable snapshot: hooks may (un)register concurrently
+            try:
+                hook(event)
+            except Exception as e:
+                warnings.warn(f'request hook {hook!r} raised {e!r}', RuntimeWarning, stacklevel=2)
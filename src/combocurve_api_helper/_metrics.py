@@ -0,0 +1,197 @@
+"""Optional in-process request metrics, fed by the request lifecycle hooks.
+
+`RequestMetrics` is a `RequestHook`: register it (``api.enable_metrics()``, or
+``api.hooks.add(metrics)`` to share one collector between instances) and it
+aggregates every `RequestEvent` per endpoint -- method plus `url_template`, so
+`/v1/projects/{id}/wells` is one series however many projects are read:
+
+- responses by status, pages fetched (successful GETs), bytes sent/received;
+- retries split by cause (429 rate limit vs. 502/503/504 gateway), give-ups,
+  and the total backoff slept;
+- a latency histogram with p50/p95/p99 estimates.
+
+`snapshot()` returns it all as plain dicts; `prometheus_text()` renders the
+Prometheus text exposition format for a scrape endpoint or a textfile collector.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from ._hooks import RequestEvent
+
+# Latency histogram bucket upper bounds (seconds): 5 ms to ~5 min, each 25% above
+# the last, so a percentile interpolated within its bucket is off by under 25%.
+_LATENCY_BUCKETS: Tuple[float, ...] = tuple(0.005 * 1.25**i for i in range(50))
+_PERCENTILES = (0.50, 0.95, 0.99)
+_GATEWAY_STATUSES = frozenset((502, 503, 504))
+_PROMETHEUS_PREFIX = 'combocurve'
+
+
+@dataclass
+class _EndpointMetrics:
+    statuses: Dict[int, int] = field(default_factory=dict)
+    pages: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries_rate_limit: int = 0
+    retries_gateway: int = 0
+    give_ups: int = 0
+    backoff_seconds: float = 0.0
+    latency_counts: List[int] = field(default_factory=lambda: [0] * (len(_LATENCY_BUCKETS) + 1))
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    def percentile(self, q: float) -> float:
+        """Estimate the `q` latency quantile by interpolating within its bucket."""
+        total = sum(self.latency_counts)
+        if total == 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.latency_counts):
+            if count and seen + count >= rank:
+                lower = _LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                upper = _LATENCY_BUCKETS[i] if i < len(_LATENCY_BUCKETS) else self.latency_max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.latency_max)
+            seen += count
+        return self.latency_max
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint request counters and latency histograms (a `RequestHook`)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], _EndpointMetrics] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        if event.kind == 'start':
+            return
+        key = (event.method.upper(), event.url_template)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics()
+            if event.kind == 'response':
+                assert event.status is not None
+                metrics.statuses[event.status] = metrics.statuses.get(event.status, 0) + 1
+                if key[0] == 'GET' and event.status < 400:
+                    metrics.pages += 1
+                metrics.bytes_sent += event.bytes_sent
+                metrics.bytes_received += event.bytes_received
+                metrics.latency_counts[bisect.bisect_left(_LATENCY_BUCKETS, event.elapsed)] += 1
+                metrics.latency_sum += event.elapsed
+                metrics.latency_max = max(metrics.latency_max, event.elapsed)
+            elif event.kind == 'retry':
+                if event.status in _GATEWAY_STATUSES:
+                    metrics.retries_gateway += 1
+                else:
+                    metrics.retries_rate_limit += 1
+                metrics.backoff_seconds += event.sleep
+            elif event.kind == 'give_up':
+                metrics.give_ups += 1
+
+    def reset(self) -> None:
+        """Drop everything collected so far."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics as plain dicts, keyed by ``'<METHOD> <url template>'``."""
+        with self._lock:
+            return {
+                f'{method} {template}': {
+                    'requests': m.requests,
+                    'statuses': dict(sorted(m.statuses.items())),
+                    'pages': m.pages,
+                    'bytes_sent': m.bytes_sent,
+                    'bytes_received': m.bytes_received,
+                    'retries': {'rate_limit': m.retries_rate_limit, 'gateway': m.retries_gateway},
+                    'give_ups': m.give_ups,
+                    'backoff_seconds': m.backoff_seconds,
+                    'latency_seconds': {
+                        'count': m.requests,
+                        'sum': m.latency_sum,
+                        'max': m.latency_max,
+                        **{f'p{round(q * 100)}': m.percentile(q) for q in _PERCENTILES},
+                    },
+                }
+                for (method, template), m in sorted(self._endpoints.items())
+            }
+
+    def prometheus_text(self) -> str:
+        """Render the metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: List[str] = []
+
+            def family(name: str, kind: str, help_: str) -> str:
+                full = f'{_PROMETHEUS_PREFIX}_{name}'
+                lines.append(f'# HELP {full} {help_}')
+                lines.append(f'# TYPE {full} {kind}')
+                return full
+
+            name = family('responses_total', 'counter', 'HTTP responses received, by status.')
+            for (method, template), m in endpoints:
+                for status, count in sorted(m.statuses.items()):
+                    lines.append(f'{name}{_labels(method, template, status=str(status))} {count}')
+
+            name = family('pages_total', 'counter', 'Successful GET pages fetched.')
+            for (method, template), m in endpoints:
+                if method == 'GET':
+                    lines.append(f'{name}{_labels(method, template)} {m.pages}')
+
+            name = family('retries_total', 'counter', 'Retries scheduled, by cause (rate_limit = 429, gateway = 5xx).')
+            for (method, template), m in endpoints:
+                lines.append(f'{name}{_labels(method, template, cause="rate_limit")} {m.retries_rate_limit}')
+                lines.append(f'{name}{_labels(method, template, cause="gateway")} {m.retries_gateway}')
+
+            name = family(
+                'give_ups_total', 'counter', 'Requests abandoned after exhausting retries or failing to send.'
+            )
+            for (method, template), m in endpoints:
+                lines.append(f'{name}{_labels(method, template)} {m.give_ups}')
+
+            name = family('backoff_seconds_total', 'counter', 'Seconds slept before retries.')
+            for (method, template), m in endpoints:
+                lines.append(f'{name}{_labels(method, template)} {_number(m.backoff_seconds)}')
+
+            for direction in ('sent', 'received'):
+                name = family(f'bytes_{direction}_total', 'counter', f'Body bytes {direction}.')
+                for (method, template), m in endpoints:
+                    value = m.bytes_sent if direction == 'sent' else m.bytes_received
+                    lines.append(f'{name}{_labels(method, template)} {value}')
+
+            name = family('request_duration_seconds', 'histogram', 'Request round-trip latency.')
+            for (method, template), m in endpoints:
+                cumulative = 0
+                for bound, count in zip(_LATENCY_BUCKETS, m.latency_counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_labels(method, template, le=_number(bound))} {cumulative}')
+                cumulative += m.latency_counts[-1]
+                lines.append(f'{name}_bucket{_labels(method, template, le="+Inf")} {cumulative}')
+                lines.append(f'{name}_sum{_labels(method, template)} {_number(m.latency_sum)}')
+                lines.append(f'{name}_count{_labels(method, template)} {cumulative}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(method: str, endpoint: str, **extra: str) -> str:
+    pairs = {'method': method, 'endpoint': endpoint, **extra}
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs.items()) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
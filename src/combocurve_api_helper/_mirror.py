@@ -0,0 +1,302 @@
+"""Local SQLite mirror of company wells, productions and forecast outputs, synced incrementally.
+
+Analyses that read the same company wells and production many times a day
+would otherwise crawl every page of `get_company_wells` /
+`get_company_monthly_productions` on each read. `LocalMirror` persists those
+collections in an SQLite file and answers queries from it:
+
+- Storage: one row per item, holding its JSON, keyed by collection, scope and
+  the item's key (its ``id``; ``well`` and ``date`` for production), and
+  indexed by well id, ``chosenID`` and date. Production items carry no
+  ``chosenID``, so production queries by chosenID go through the mirrored wells.
+- Sync: `sync` stores, per collection, a watermark -- the latest ``updatedAt``
+  it received. The next sync requests only the items with ``updatedAt`` at or
+  after the watermark (the API's ``updatedAt[ge]`` filter) and upserts them,
+  never over a copy updated later. A sync is one transaction: one that fails
+  leaves the mirror and its watermark as they were.
+- Deletions: an incremental sync cannot see deleted items. ``full=True``
+  crawls the whole collection again and replaces its rows.
+- Forecast outputs are mirrored per forecast, with `sync_forecast_outputs`.
+
+Queries read only the local file, never the API; the mirror is as current as
+its last sync (see `watermark`). Thread-safe; other processes may share the file.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from more_itertools import chunked
+
+from .base import Item, ItemList
+
+if TYPE_CHECKING:
+    from ._api import ComboCurveAPI
+
+
+_SCHEMA_VERSION = 1  # files of another version are emptied on open
+_INSERT_BATCH = 1000
+_DEFAULT_COLLECTIONS = ('wells', 'monthly_productions')
+
+
+@dataclass(frozen=True)
+class _MirroredCollection:
+    # (api, filters, scope) -> the collection's items, e.g. `get_company_wells`
+    fetch: Callable[['ComboCurveAPI', Dict[str, str], str], Iterable[Item]]
+    key: Callable[[Item], str]  # an item's key within its collection and scope
+    well: Callable[[Item], Any]  # its well id
+
+
+def _production_key(item: Item) -> str:
+    return f'{item.get("well")}|{item.get("date")}'
+
+
+def _forecast_outputs(api: 'ComboCurveAPI', filters: Dict[str, str], scope: str) -> ItemList:
+    project_id, forecast_id = scope.split('/')
+    return api.get_forecast_outputs(project_id, forecast_id, filters or None)
+
+
+_COLLECTIONS: Dict[str, _MirroredCollection] = {
+    'wells': _MirroredCollection(
+        lambda api, filters, scope: api.get_company_wells(filters or None),
+        lambda item: str(item['id']),
+        lambda item: item.get('id'),
+    ),
+    'monthly_productions': _MirroredCollection(
+        lambda api, filters, scope: api.get_stream_company_monthly_productions(filters or None),
+        _production_key,
+        lambda item: item.get('well'),
+    ),
+    'daily_productions': _MirroredCollection(
+        lambda api, filters, scope: api.get_stream_company_daily_productions(filters or None),
+        _production_key,
+        lambda item: item.get('well'),
+    ),
+    'forecast_outputs': _MirroredCollection(
+        _forecast_outputs,
+        lambda item: str(item['id']),
+        lambda item: item.get('well'),
+    ),
+}
+
+
+# Keeps the stored item when the incoming copy is older, e.g. when a getter sorts
+# an update ahead of the stale copy it replaced.
+_UPSERT = (
+    'INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (collection, scope, key) DO UPDATE SET'
+    ' well = excluded.well, chosen_id = excluded.chosen_id, date = excluded.date,'
+    ' updated_at = excluded.updated_at, body = excluded.body'
+    ' WHERE excluded.updated_at IS NULL OR items.updated_at IS NULL OR excluded.updated_at >= items.updated_at'
+)
+# the collections `sync` accepts; forecast outputs have `sync_forecast_outputs`
+_COMPANY_COLLECTIONS = ('wells', 'monthly_productions', 'daily_productions')
+
+
+class LocalMirror:
+    """Company wells, production and forecast outputs of a `ComboCurveAPI`, mirrored in the SQLite file `path`.
+
+    See `_mirror.py`.
+    """
+
+    def __init__(self, api: 'ComboCurveAPI', path: Union[str, Path]) -> None:
+        self.api = api
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._db:
+            if self._db.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                self._db.execute('DROP TABLE IF EXISTS items')
+                self._db.execute('DROP TABLE IF EXISTS watermarks')
+                self._db.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS items (collection TEXT NOT NULL, scope TEXT NOT NULL, key TEXT NOT NULL,'
+                ' well TEXT, chosen_id TEXT, date TEXT, updated_at TEXT, body BLOB NOT NULL,'
+                ' PRIMARY KEY (collection, scope, key))'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS items_well ON items (collection, scope, well, date)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS items_chosen_id ON items (collection, scope, chosen_id)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS items_date ON items (collection, scope, date)')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS watermarks (collection TEXT NOT NULL, scope TEXT NOT NULL,'
+                ' updated_at TEXT NOT NULL, PRIMARY KEY (collection, scope))'
+            )
+
+    def __enter__(self) -> LocalMirror:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    ######
+    # Sync
+    ######
+
+    def sync(self, collections: Sequence[str] = _DEFAULT_COLLECTIONS, *, full: bool = False) -> Dict[str, int]:
+        """Bring `collections` up to date; return the number of items each received.
+
+        `collections` are among ``'wells'``, ``'monthly_productions'`` and
+        ``'daily_productions'``. `full` crawls them whole and replaces their
+        rows, dropping items deleted since; otherwise only items updated since
+        the last sync are requested.
+        """
+        for collection in collections:
+            if collection not in _COMPANY_COLLECTIONS:
+                raise ValueError(f'Cannot sync {collection!r}; expected one of {list(_COMPANY_COLLECTIONS)}')
+        return {collection: self._sync(collection, '', full) for collection in collections}
+
+    def sync_forecast_outputs(self, project_id: str, forecast_id: str, *, full: bool = False) -> int:
+        """Bring the outputs of forecast `forecast_id` up to date; return the number of items received."""
+        return self._sync('forecast_outputs', f'{project_id}/{forecast_id}', full)
+
+    def watermark(self, collection: str, *, project_id: str = '', forecast_id: str = '') -> Optional[str]:
+        """Return the latest ``updatedAt`` synced into `collection` (None before its first sync)."""
+        scope = f'{project_id}/{forecast_id}' if collection == 'forecast_outputs' else ''
+        with self._lock:
+            row = self._db.execute(
+                'SELECT updated_at FROM watermarks WHERE collection = ? AND scope = ?', (collection, scope)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def _sync(self, collection: str, scope: str, full: bool) -> int:
+        spec = _COLLECTIONS[collection]
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT updated_at FROM watermarks WHERE collection = ? AND scope = ?', (collection, scope)
+            ).fetchone()
+            filters = {'updatedAt[ge]': row[0]} if row is not None and not full else {}
+            if full:
+                self._db.execute('DELETE FROM items WHERE collection = ? AND scope = ?', (collection, scope))
+
+            dumps = self.api.codec.dumps
+            received = 0
+            latest = row[0] if row is not None and not full else None
+            for batch in chunked(spec.fetch(self.api, filters, scope), _INSERT_BATCH):
+                rows: List[Tuple[Any, ...]] = []
+                for item in batch:
+                    updated_at = item.get('updatedAt')
+                    if isinstance(updated_at, str) and (latest is None or updated_at > latest):
+                        latest = updated_at
+                    well = spec.well(item)
+                    date = item.get('date')
+                    rows.append(
+                        (
+                            collection,
+                            scope,
+                            spec.key(item),
+                            None if well is None else str(well),
+                            item.get('chosenID'),
+                            None if date is None else str(date),
+                            updated_at if isinstance(updated_at, str) else None,
+                            dumps(item),
+                        )
+                    )
+                self._db.executemany(_UPSERT, rows)
+                received += len(rows)
+
+            if latest is not None:
+                self._db.execute('INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)', (collection, scope, latest))
+        return received
+
+    #########
+    # Queries
+    #########
+
+    def wells(
+        self, *, well_ids: Optional[Iterable[str]] = None, chosen_ids: Optional[Iterable[str]] = None
+    ) -> ItemList:
+        """Return the mirrored company wells: all of them, or those of `well_ids` and/or `chosen_ids`."""
+        where, args = self._match('well', well_ids)
+        chosen_where, chosen_args = self._match('chosen_id', chosen_ids)
+        return self._select('wells', '', where + chosen_where, args + chosen_args)
+
+    def well(self, well_id: str) -> Optional[Item]:
+        """Return the mirrored company well `well_id`, or None."""
+        found = self.wells(well_ids=[well_id])
+        return found[0] if found else None
+
+    def well_by_chosen_id(self, chosen_id: str) -> Optional[Item]:
+        """Return the mirrored company well whose ``chosenID`` is `chosen_id`, or None."""
+        found = self.wells(chosen_ids=[chosen_id])
+        return found[0] if found else None
+
+    def monthly_productions(
+        self,
+        *,
+        well_ids: Optional[Iterable[str]] = None,
+        chosen_ids: Optional[Iterable[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> ItemList:
+        """Return the mirrored monthly production, by well and date.
+
+        Only that of `well_ids` and/or the wells of `chosen_ids` when given, and
+        only dates from `start` up to (not including) `end`, compared as ISO
+        strings (e.g. ``'2024-01-01'``).
+        """
+        return self._productions('monthly_productions', well_ids, chosen_ids, start, end)
+
+    def daily_productions(
+        self,
+        *,
+        well_ids: Optional[Iterable[str]] = None,
+        chosen_ids: Optional[Iterable[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> ItemList:
+        """Return the mirrored daily production, by well and date; filtered as in `monthly_productions`."""
+        return self._productions('daily_productions', well_ids, chosen_ids, start, end)
+
+    def forecast_outputs(
+        self, project_id: str, forecast_id: str, *, well_ids: Optional[Iterable[str]] = None
+    ) -> ItemList:
+        """Return the mirrored outputs of forecast `forecast_id`: all of them, or those of `well_ids`."""
+        where, args = self._match('well', well_ids)
+        return self._select('forecast_outputs', f'{project_id}/{forecast_id}', where, args)
+
+    def _productions(
+        self,
+        collection: str,
+        well_ids: Optional[Iterable[str]],
+        chosen_ids: Optional[Iterable[str]],
+        start: Optional[str],
+        end: Optional[str],
+    ) -> ItemList:
+        where, args = self._match('well', well_ids)
+        if chosen_ids is not None:
+            chosen_ids = list(chosen_ids)
+            where += (
+                " AND well IN (SELECT well FROM items WHERE collection = 'wells' AND scope = ''"
+                f' AND chosen_id IN ({", ".join("?" * len(chosen_ids))}))'
+            )
+            args += chosen_ids
+        if start is not None:
+            where += ' AND date >= ?'
+            args.append(start)
+        if end is not None:
+            where += ' AND date < ?'
+            args.append(end)
+        return self._select(collection, '', where + ' ORDER BY well, date', args)
+
+    @staticmethod
+    def _match(column: str, values: Optional[Iterable[str]]) -> Tuple[str, List[Any]]:
+        """The ``AND column IN (...)`` clause restricting `column` to `values` (none when None)."""
+        if values is None:
+            return '', []
+        values = list(values)
+        return f' AND {column} IN ({", ".join("?" * len(values))})', values
+
+    def _select(self, collection: str, scope: str, where: str, args: List[Any]) -> ItemList:
+        with self._lock:
+            rows = self._db.execute(
+                f'SELECT body FROM items WHERE collection = ? AND scope = ?{where}', [collection, scope, *args]
+            ).fetchall()
+        loads = self.api.codec.loads
+        return [loads(bytes(row[0])) for row in rows]
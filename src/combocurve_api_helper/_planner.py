@@ -0,0 +1,190 @@
+"""Dry-run request planning: count the requests a job would send, and estimate how long it takes.
+
+Inside ``with api.dry_run(...) as plan:`` the session answers every request
+itself instead of sending it -- writes with an all-success 207 envelope, GETs
+with placeholder pages (``{}`` records, `take` per page, with `Link` next
+headers) up to the item counts given per endpoint. The helpers run their real
+chunking and pagination logic, so `plan` ends up holding the exact request
+sequence: endpoint, records per request (the chunk plan), and body bytes.
+
+The duration estimate combines two bounds and takes the larger:
+
+- latency: the sum of each request's expected latency -- measured per endpoint
+  by a `RequestMetrics` when given (its mean), else a default -- divided by the
+  job's concurrency;
+- quota: requests beyond the rate limiter's burst, at its refill rate.
+
+Records returned by dry-run reads are placeholders, so helpers that post-process
+them (e.g. sort by a field) or poll for a job's completion are not plannable;
+neither are the async helpers, which do not use the pooled session::
+
+    with api.dry_run(items={'/v1/wells': 30_000}, metrics=metrics, concurrency=4) as plan:
+        wells = api._get_items(f'{api.API_BASE_URL}/wells', {'take': 200})
+        api.post_forecast_wells(project_id, forecast_id, well_ids, chunksize=100)
+    print(plan.summary())
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from ._cassette import _build_response, _request_body
+from ._hooks import _url_template
+from ._metrics import RequestMetrics
+
+_DEFAULT_TAKE = 25  # the API's page size when a request sets no `take`
+
+
+@dataclass(frozen=True)
+class PlannedRequest:
+    """One request a dry run would have sent."""
+
+    method: str
+    url_template: str  # path with record ids replaced by `{id}`, as in `RequestEvent`
+    records: int  # records in the write body, or on the read page
+    bytes_sent: int  # body as it would be sent (encoded, after compression)
+
+    @property
+    def endpoint(self) -> str:
+        return f'{self.method} {self.url_template}'
+
+
+@dataclass
+class RequestPlan:
+    """The requests recorded by `APIBase.dry_run` and the job's estimated duration."""
+
+    concurrency: int = 1
+    requests_per_second: Optional[float] = None  # the quota; None: unlimited
+    burst: float = 0.0  # requests the quota allows back-to-back
+    default_latency: float = 0.5  # seconds per request for endpoints without a measurement
+    latencies: Dict[str, float] = field(default_factory=dict)  # endpoint -> measured mean seconds
+    requests: List[PlannedRequest] = field(default_factory=list)
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    def by_endpoint(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint: request count, records, bytes, the records of each request, and assumed latency."""
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for request in self.requests:
+            entry = endpoints.setdefault(
+                request.endpoint,
+                {'requests': 0, 'records': 0, 'bytes_sent': 0, 'chunks': [], 'latency': self.latency(request)},
+            )
+            entry['requests'] += 1
+            entry['records'] += request.records
+            entry['bytes_sent'] += request.bytes_sent
+            entry['chunks'].append(request.records)
+        return endpoints
+
+    def latency(self, request: PlannedRequest) -> float:
+        """Seconds `request` is expected to take."""
+        return self.latencies.get(request.endpoint, self.default_latency)
+
+    @property
+    def latency_seconds(self) -> float:
+        """Duration bound from request latencies, spread over `concurrency`."""
+        return sum(self.latency(r) for r in self.requests) / max(1, self.concurrency)
+
+    @property
+    def quota_seconds(self) -> float:
+        """Duration bound from the rate limit (0.0 when unlimited)."""
+        if not self.requests_per_second:
+            return 0.0
+        return max(0.0, self.request_count - self.burst) / self.requests_per_second
+
+    @property
+    def estimated_seconds(self) -> float:
+        return max(self.latency_seconds, self.quota_seconds)
+
+    def summary(self) -> str:
+        """Render the plan as text: one line per endpoint, then the estimate."""
+        lines = []
+        for endpoint, entry in self.by_endpoint().items():
+            chunks = entry['chunks']
+            sizes = f'{min(chunks)}-{max(chunks)}' if min(chunks) != max(chunks) else str(chunks[0])
+            lines.append(
+                f'{endpoint}: {entry["requests"]} requests, {entry["records"]} records '
+                f'({sizes} per request), {entry["bytes_sent"]} bytes, ~{entry["latency"]:.3f} s each'
+            )
+        bound = 'quota' if self.quota_seconds > self.latency_seconds else 'latency'
+        lines.append(
+            f'total: {self.request_count} requests, ~{self.estimated_seconds:.1f} s ({bound}-bound; '
+            f'latency {self.latency_seconds:.1f} s at concurrency {self.concurrency}, '
+            f'quota {self.quota_seconds:.1f} s)'
+        )
+        return '\n'.join(lines)
+
+
+def _mean_latencies(metrics: Optional[RequestMetrics]) -> Dict[str, float]:
+    if metrics is None:
+        return {}
+    return {
+        endpoint: entry['latency_seconds']['sum'] / entry['latency_seconds']['count']
+        for endpoint, entry in metrics.snapshot().items()
+        if entry['latency_seconds']['count']
+    }
+
+
+def _count_records(body: Any) -> int:
+    """Records in a write body: a list's length, or the longest list in an object (e.g. `wellIds`)."""
+    if isinstance(body, list):
+        return len(body)
+    if isinstance(body, dict):
+        return max((len(v) for v in body.values() if isinstance(v, list)), default=1)
+    return 1
+
+
+class _DryRunAdapter(BaseAdapter):
+    """Transport adapter that records requests into a `RequestPlan` and answers them synthetically."""
+
+    def __init__(self, plan: RequestPlan, items: Mapping[str, int]) -> None:
+        super().__init__()
+        self.plan = plan
+        self.items = items
+        self._lock = threading.Lock()
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        method = (request.method or 'GET').upper()
+        url = request.url or ''
+        template = _url_template(url)
+        raw = _request_body(request)
+        headers: Dict[str, str] = {'Content-Type': 'application/json'}
+
+        if method == 'GET':
+            query = {k: v[-1] for k, v in parse_qs(urlsplit(url).query).items()}
+            take = int(query.get('take', _DEFAULT_TAKE))
+            skip = int(query.get('skip', 0))
+            total = self.items.get(template, self.items.get(urlsplit(url).path, 0))
+            records = max(0, min(take, total - skip))
+            if skip + take < total:
+                next_query = urlencode({**query, 'skip': skip + take, 'take': take})
+                headers['Link'] = f'<{urlunsplit(urlsplit(url)._replace(query=next_query))}>;rel="next"'
+            body: Any = [{}] * records
+            status = 200
+        else:
+            payload = gzip.decompress(raw) if request.headers.get('Content-Encoding') == 'gzip' else raw
+            records = _count_records(json.loads(payload)) if payload else 0
+            body = {
+                'successCount': records,
+                'failedCount': 0,
+                'results': [{'status': 'OK', 'code': 200}] * records,
+                'generalErrors': [],
+            }
+            status = 207
+
+        with self._lock:
+            self.plan.requests.append(PlannedRequest(method, template, records, len(raw)))
+        return _build_response(request, status, headers, json.dumps(body).encode())
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,71 @@
+"""Client-side, proactive request pacing.
+
+`_RateLimitState` (in `_batch.py`) reacts to a 429 by pausing one batch for the
+whole quota window. `TokenBucket` instead spaces requests out *before* they hit
+the quota: every request through `APIBase._send` (and the async client's
+`_asend`) takes one token, and a caller that finds the bucket empty sleeps just
+long enough for its token to refill. One bucket is shared by every thread, and
+-- when installed with `APIBase.set_rate_limit` -- by every API instance in the
+process.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, holding at most `capacity`.
+
+    Tokens are reserved, not polled: `reserve()` takes a token immediately (the
+    balance may go negative) and returns how long the caller must wait before
+    using it. Waiters are therefore served in arrival order and never spin.
+    `try_reserve` takes them only when that wait is shorter than a bound.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f'rate must be positive, got {rate}')
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.reservations = 0  # requests paced through the bucket
+        self.waited_seconds = 0.0  # total delay imposed on callers
+
+    @classmethod
+    def per_minute(cls, requests: float, burst: Optional[float] = None) -> TokenBucket:
+        """Bucket allowing `requests` per minute (a typical quota unit), bursting to `burst`."""
+        return cls(requests / 60.0, burst)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` now and return the seconds to wait before using them."""
+        delay = self.try_reserve(tokens, max_wait=math.inf)
+        assert delay is not None  # every wait is shorter than an infinite one
+        return delay
+
+    def try_reserve(self, tokens: float = 1.0, *, max_wait: float) -> Optional[float]:
+        """Like `reserve`, but take nothing and return None if the wait would not be shorter than `max_wait`."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            balance = self._tokens - tokens
+            delay = -balance / self.rate if balance < 0 else 0.0
+            if delay >= max_wait:
+                return None
+            self._tokens = balance
+            self.reservations += 1
+            self.waited_seconds += delay
+        return delay
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; return the seconds waited."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,192 @@
+"""Hash-indexed name / id resolution for projects, scenarios, forecasts, type curves and econ models.
+
+`APIBase.extract_id` and `APIBase.index_of` scan a list the caller has just
+fetched, so resolving names one at a time costs a full list download and a
+linear scan per name. `NameResolver` fetches each list once and indexes it:
+
+- Indexes: one per list -- the company's projects, and a project's scenarios,
+  forecasts, type curves, or econ models of one type -- mapping name to id
+  (or, with ``casefold=True``, casefolded name to id) and id to item.
+- Bulk: `ids` resolves many names of one list in a single pass, with at most
+  one refetch for all of its misses.
+- Misses: a name or id absent from an index refetches that list, at most once
+  per call and once every `min_refresh_interval` seconds (default 5), so items
+  created since it was built are found. Names still absent resolve to None.
+- Concurrency: lists are fetched outside the resolver's lock, one fetch per
+  list at a time -- concurrent misses on a list share a single refetch, and
+  lookups in other lists are not held up by it.
+- Duplicates: like `extract_id`, a name shared by several items resolves to
+  the first of them in the list's order. Each such name is warned about once
+  per list, when first found, not on every lookup.
+
+Indexes are kept until `invalidate` drops them; renamed or deleted items are
+otherwise only noticed when a miss refetches their list.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .base import Item, ItemList
+
+if TYPE_CHECKING:
+    from ._api import ComboCurveAPI
+
+
+# kind -> fetches its list, given the API, a project id and an econ model type (each ignored when not needed)
+_FETCHERS: Dict[str, Callable[['ComboCurveAPI', str, str], ItemList]] = {
+    'projects': lambda api, project_id, econ_model_type: api.get_projects(),
+    'scenarios': lambda api, project_id, econ_model_type: api.get_scenarios(project_id),
+    'forecasts': lambda api, project_id, econ_model_type: api.get_forecasts(project_id),
+    'type_curves': lambda api, project_id, econ_model_type: api.get_type_curves(project_id),
+    'econ_models': lambda api, project_id, econ_model_type: api.get_econ_models_by_type(project_id, econ_model_type),
+}
+
+# (kind, project id, casefolded econ model type); '' where the kind has no such scope
+_Scope = Tuple[str, str, str]
+
+
+@dataclass
+class _Index:
+    by_name: Dict[str, str]  # name (casefolded when the resolver is) -> id of its first item
+    by_id: Dict[str, Item]
+    built_at: float  # `time.monotonic()`
+    duplicates: Set[str] = field(default_factory=set)  # names shared by several items
+
+
+def _build_index(items: ItemList, casefold: bool) -> _Index:
+    by_name: Dict[str, str] = {}
+    by_id: Dict[str, Item] = {}
+    duplicates: Set[str] = set()
+    for item in items:
+        id_ = item.get('id')
+        if id_ is None:
+            continue
+        by_id[str(id_)] = item
+        name = item.get('name')
+        if not isinstance(name, str):
+            continue
+        key = name.casefold() if casefold else name
+        if key in by_name:
+            duplicates.add(key)
+        else:
+            by_name[key] = str(id_)
+    return _Index(by_name, by_id, time.monotonic(), duplicates)
+
+
+class NameResolver:
+    """Resolve names to ids (and ids to items) of a `ComboCurveAPI`'s lists through cached hash indexes.
+
+    `kind` is one of ``'projects'``, ``'scenarios'``, ``'forecasts'``,
+    ``'type_curves'`` and ``'econ_models'``; every kind but projects needs a
+    `project_id`, and econ models an `econ_model_type` too. ``casefold=True``
+    matches names case-insensitively. See `_resolver.py`.
+    """
+
+    def __init__(self, api: 'ComboCurveAPI', *, casefold: bool = False, min_refresh_interval: float = 5.0) -> None:
+        self.api = api
+        self.casefold = casefold
+        self.min_refresh_interval = min_refresh_interval
+        self._indexes: Dict[_Scope, _Index] = {}
+        self._warned: Set[Tuple[_Scope, str]] = set()
+        self._generation = 0  # bumped by `invalidate`, so a fetch it overtook is not stored
+        self._lock = threading.Lock()  # guards the above; never held across a fetch
+        self._fetch_locks: Dict[_Scope, threading.Lock] = {}  # one fetch per list at a time
+
+    def id(
+        self, kind: str, name: str, *, project_id: Optional[str] = None, econ_model_type: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the id of the `kind` item named `name`, or None when there is none."""
+        return self.ids(kind, [name], project_id=project_id, econ_model_type=econ_model_type)[name]
+
+    def ids(
+        self,
+        kind: str,
+        names: Iterable[str],
+        *,
+        project_id: Optional[str] = None,
+        econ_model_type: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Return each of `names` mapped to the id of the `kind` item of that name (None when there is none)."""
+        scope = self._scope(kind, project_id, econ_model_type)
+        names = list(names)
+        index, fresh = self._index(scope)
+        found = {name: index.by_name.get(self._key(name)) for name in names}
+        if not fresh and None in found.values() and self._refresh_due(index):
+            index = self._rebuild(scope, index)
+            found = {name: index.by_name.get(self._key(name)) for name in names}
+        return found
+
+    def item(
+        self, kind: str, id_: str, *, project_id: Optional[str] = None, econ_model_type: Optional[str] = None
+    ) -> Optional[Item]:
+        """Return the `kind` item whose id is `id_`, or None when there is none."""
+        scope = self._scope(kind, project_id, econ_model_type)
+        index, fresh = self._index(scope)
+        item = index.by_id.get(id_)
+        if item is None and not fresh and self._refresh_due(index):
+            item = self._rebuild(scope, index).by_id.get(id_)
+        return item
+
+    def invalidate(self, kind: Optional[str] = None, *, project_id: Optional[str] = None) -> None:
+        """Drop the indexes of `kind` (every kind when None), only those of `project_id` when given."""
+        with self._lock:
+            self._generation += 1
+            for scope in list(self._indexes):
+                if (kind is None or scope[0] == kind) and (project_id is None or scope[1] == project_id):
+                    del self._indexes[scope]
+
+    def _scope(self, kind: str, project_id: Optional[str], econ_model_type: Optional[str]) -> _Scope:
+        if kind not in _FETCHERS:
+            raise ValueError(f'Unknown kind {kind!r}; expected one of {sorted(_FETCHERS)}')
+        if kind == 'projects':
+            return kind, '', ''
+        if project_id is None:
+            raise ValueError(f'Resolving {kind} requires a `project_id`')
+        if kind != 'econ_models':
+            return kind, project_id, ''
+        if econ_model_type is None:
+            raise ValueError('Resolving econ_models requires an `econ_model_type`')
+        return kind, project_id, econ_model_type.casefold()
+
+    def _key(self, name: str) -> str:
+        return name.casefold() if self.casefold else name
+
+    def _refresh_due(self, index: _Index) -> bool:
+        return time.monotonic() - index.built_at >= self.min_refresh_interval
+
+    def _index(self, scope: _Scope) -> Tuple[_Index, bool]:
+        """Return the index of `scope`, and whether it was built just now."""
+        with self._lock:
+            index = self._indexes.get(scope)
+        if index is not None:
+            return index, False
+        return self._rebuild(scope, None), True
+
+    def _rebuild(self, scope: _Scope, stale: Optional[_Index]) -> _Index:
+        """Refetch `scope`'s list and index it, unless another thread replaced `stale` while this one waited."""
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(scope, threading.Lock())
+        with fetch_lock:
+            with self._lock:
+                current = self._indexes.get(scope)
+                generation = self._generation
+            if current is not None and current is not stale:
+                return current
+            kind, project_id, econ_model_type = scope
+            items = _FETCHERS[kind](self.api, project_id, econ_model_type)
+            index = _build_index(items, self.casefold)
+            with self._lock:
+                if generation == self._generation:
+                    self._indexes[scope] = index
+                duplicates = sorted(name for name in index.duplicates if (scope, name) not in self._warned)
+                self._warned.update((scope, name) for name in duplicates)
+        for name in duplicates:
+            warnings.warn(
+                f'Several {kind} are named {name!r}; resolving it to the first, {index.by_name[name]}', UserWarning
+            )
+        return index
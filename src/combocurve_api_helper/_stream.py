@@ -0,0 +1,98 @@
+"""Incremental decoding of a streamed top-level JSON array.
+
+List endpoints answer with one JSON array per page -- up to 20,000 production
+records. `_iter_json_array` turns the raw byte chunks of such a body into its
+elements one at a time, so only the current element (plus at most one network
+chunk) is held in memory instead of the whole decoded page.
+
+Elements are decoded with the stdlib's C-accelerated `json.JSONDecoder.raw_decode`
+directly out of a rolling text buffer; the pluggable `APIBase.codec` only takes
+complete documents and is not used here.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Characters a complete JSON value can end with on its own. A number (or a
+# `true`/`false`/`null` literal) may still continue in the next chunk -- `1` or
+# `1.` may become `1.5`, and `raw_decode` stops at the `.` of the latter -- so
+# it is only accepted once a delimiter follows it in the buffer.
+_CLOSED_VALUE_ENDS = frozenset('}]"')
+_SCALAR_DELIMITERS = frozenset(',] \t\n\r')
+
+# Parser states: before the body, inside the array (expecting a value or `]`,
+# a value, or a `,`/`]` delimiter), after the closing `]`, or not an array.
+_START, _VALUE_OR_END, _VALUE, _DELIMITER, _DONE, _NOT_ARRAY = range(6)
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield each element of the UTF-8 JSON array spread across `chunks`.
+
+    A body whose top-level value is not an array is decoded whole once the
+    stream ends and yielded as a single element (mirroring `_extract_json`,
+    which wraps a lone object in a list). A truncated or malformed body raises
+    `ValueError` (`json.JSONDecodeError`) at the point it is detected.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    state = _START
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer = buffer[pos:] + text.decode(chunk)
+        pos = 0
+
+        while state not in (_NOT_ARRAY, _DONE):
+            pos = _skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if state == _START:
+                state = _VALUE_OR_END if char == '[' else _NOT_ARRAY
+                pos += char == '['
+            elif char == ']' and state in (_VALUE_OR_END, _DELIMITER):
+                state = _DONE
+                pos += 1
+            elif state == _DELIMITER:
+                if char != ',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                state = _VALUE
+                pos += 1
+            else:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # the element continues in the next chunk (or is malformed; see below)
+                if buffer[end - 1] not in _CLOSED_VALUE_ENDS and buffer[end : end + 1] not in _SCALAR_DELIMITERS:
+                    break
+                yield value
+                state = _DELIMITER
+                pos = end
+
+        if state == _DONE and buffer[pos:].strip():
+            raise json.JSONDecodeError('Extra data', buffer, _skip_whitespace(buffer, pos))
+
+    rest = (buffer[pos:] + text.decode(b'', final=True)).strip()
+    if state == _DONE:
+        return
+    if state in (_START, _NOT_ARRAY):
+        yield json.loads(rest)
+        return
+    # the stream ended inside the array: decode what is left to surface the real error
+    if rest and state != _DELIMITER:
+        decoder.raw_decode(rest)
+    raise json.JSONDecodeError("Expecting ',' delimiter or ']'", rest, len(rest))
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    match = _WHITESPACE.match(buffer, pos)
+    return match.end() if match is not None else pos
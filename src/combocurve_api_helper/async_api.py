@@ -0,0 +1,425 @@
+"""Native asyncio client.
+
+`AsyncComboCurveAPI` composes the same resource mixins as `ComboCurveAPI`, so
+every `get_*_url` builder is available unchanged, and adds awaitable versions of
+the generic dispatchers (`_aget_items`, `_aget_items_iterator`, `_apost_items`,
+`_aput_items`, `_apatch_items`, `_adelete_items`, `_arequest_batched`) that send
+on one pooled `httpx.AsyncClient` instead of a thread per in-flight request::
+
+    async with AsyncComboCurveAPI() as api:
+        urls = [api.get_company_well_by_id_url(well_id) for well_id in well_ids]
+        pages = await asyncio.gather(*(api._aget_items(url) for url in urls))
+
+Retry semantics match the blocking transport exactly (429 honoring
+`Retry-After`, 502/503/504 with exponential backoff, same retry budget), as do
+`timeout` and `deadline()`, and `_arequest_batched` returns the same 207-aware
+`BatchWriteResult`. The blocking
+endpoint methods inherited from the mixins still work -- on the synchronous
+session -- so call them off the event loop.
+
+Requires the optional `httpx` dependency (``pip install combocurve-api-helper[async]``).
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Optional, Union, Any
+
+from more_itertools import chunked
+from typing_extensions import Self
+from combocurve_api_v1.pagination import get_next_page_url
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "AsyncComboCurveAPI requires httpx; install it with `pip install 'combocurve-api-helper[async]'`"
+    ) from e
+
+from .base import (
+    APIBase,
+    ItemList,
+    _MAX_REQUEST_RETRIES,
+    _RATE_LIMIT_DEFAULT_PAUSE_SECONDS,
+    _RETRYABLE_GATEWAY_STATUSES,
+    _GATEWAY_BACKOFF_SECONDS,
+    _parse_chunk_response,
+    _reserve_rate_limit,
+    _retry_delay_seconds,
+    _split_chunks,
+    _stitch_batch,
+    _timed_out_chunk,
+)
+from ._batch import BatchChunk, BatchWriteResult, _AsyncRateLimitState
+from ._deadline import DeadlineExceeded, _current_deadline, _request_timeout
+from .root import Root
+from .projects import Projects
+from .scenarios import Scenarios
+from .production import Production
+from .econ_runs import EconRuns
+from .wells import Wells
+from .models import Models
+from .company_models import CompanyModels
+from .forecasts import Forecasts
+from .typecurves import TypeCurves
+from .directional import Directional
+from .forecast_configurations import ForecastConfigurations
+from .ownership_qualifiers import OwnershipQualifiers
+from .exports import Exports
+
+
+# Connections the async client may hold open at once (and keep alive between
+# requests). Unlike the thread-pooled transport, in-flight requests cost no
+# thread, so this is far above the blocking session's pool size.
+_ASYNC_MAX_CONNECTIONS = 100
+
+
+class AsyncAPIBase(APIBase):
+    """`APIBase` plus an awaitable transport on a pooled `httpx.AsyncClient`."""
+
+    def _init_transport(self) -> None:
+        super()._init_transport()
+        self.aclient = self._new_async_client(_ASYNC_MAX_CONNECTIONS)
+
+    @staticmethod
+    def _new_async_client(max_connections: int) -> httpx.AsyncClient:
+        """Return an `httpx.AsyncClient` keeping up to `max_connections` connections alive."""
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        return httpx.AsyncClient(limits=limits)
+
+    async def configure_async_client(
+        self, *, max_connections: Optional[int] = None, client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Replace the async client every awaitable request goes through.
+
+        `max_connections` rebuilds the default client with that connection
+        limit; `client` installs a caller-built client as-is (e.g. one carrying
+        proxies or a custom transport). The previous client is closed.
+        """
+        previous = self.aclient
+        if client is not None:
+            self.aclient = client
+        else:
+            self.aclient = self._new_async_client(max_connections or _ASYNC_MAX_CONNECTIONS)
+        await previous.aclose()
+
+    async def aclose(self) -> None:
+        """Close both the async client and the blocking session."""
+        await self.aclient.aclose()
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _asend(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        json_body: Any = None,
+        body: Optional[bytes] = None,
+        attempt: int = 0,
+    ) -> httpx.Response:
+        """Issue one HTTP request on the async client (no retries); see `_send`."""
+        deadline = _current_deadline()
+        rate_limiter = self.rate_limiter
+        waited = 0.0
+        if rate_limiter is not None:
+            waited = _reserve_rate_limit(rate_limiter, deadline)
+            if waited > 0:
+                await asyncio.sleep(waited)
+        connect_read = _request_timeout(self.timeout, deadline)
+        timeout = (
+            httpx.Timeout(None) if connect_read is None else httpx.Timeout(connect_read[1], connect=connect_read[0])
+        )
+        headers_ = dict(headers)
+        content = body if body is not None else self._encode_body(json_body, headers_)
+        try:
+            if not self.hooks:
+                return await self.aclient.request(
+                    method, url, headers=headers_, params=params, content=content, timeout=timeout
+                )
+
+            sent = len(content) if content is not None else 0
+            self._emit('start', method, url, params, attempt, bytes_sent=sent, sleep=waited)
+            start = time.perf_counter()
+            try:
+                response = await self.aclient.request(
+                    method, url, headers=headers_, params=params, content=content, timeout=timeout
+                )
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                self._emit('give_up', method, url, params, attempt, bytes_sent=sent, elapsed=elapsed, error=e)
+                raise
+            self._emit_response(method, url, params, attempt, response, sent, time.perf_counter() - start)
+            return response
+        except httpx.TimeoutException as e:
+            if deadline is not None and deadline.expired():  # cut short by the deadline, not `timeout`
+                raise deadline.exceeded(f'awaiting {method.upper()} {url}') from e
+            raise
+        finally:
+            cache = self.response_cache
+            if cache is not None and method.upper() != 'GET':
+                cache.invalidate(url)
+
+    async def _arequest_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        json_body: Any = None,
+    ) -> httpx.Response:
+        """Awaitable `_request_with_retry`: same retryable statuses, delays, and budget."""
+        deadline = _current_deadline()
+        for attempt in range(_MAX_REQUEST_RETRIES + 1):
+            headers = self._get_auth_headers()
+            response = await self._asend(
+                method, url, headers=headers, params=params, json_body=json_body, attempt=attempt
+            )
+            delay = _retry_delay_seconds(response, attempt)
+            if delay is None:
+                return response
+            if attempt == _MAX_REQUEST_RETRIES:
+                self._emit('give_up', method, url, params, attempt, status=response.status_code)
+                return response
+            if deadline is not None and delay >= deadline.remaining():
+                self._emit('give_up', method, url, params, attempt, status=response.status_code)
+                deadline.check(f'retrying HTTP {response.status_code} in {delay:g} s', delay)
+            self._emit('retry', method, url, params, attempt, status=response.status_code, sleep=delay)
+            await asyncio.sleep(delay)
+        raise RuntimeError('unreachable: retry loop always returns')
+
+    async def _arequest_items_pages(
+        self, method: str, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Awaitable `_request_items_pages`: follow `Link` next-page headers, yielding each page."""
+        while True:
+            response = await self._arequest_with_retry(method, url, params=params)
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                print(f'\nException occured during request:\nURL: {url}\nParams: {params}\n')
+                raise e
+
+            yield response
+
+            next_page_url: Optional[str] = get_next_page_url(response.headers)
+            if next_page_url is None:
+                break
+            url = next_page_url
+            params = None
+
+    async def _arequest_items_pages_chunks(
+        self,
+        method: str,
+        url: str,
+        data: ItemList,
+        chunksize: Optional[int] = None,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Awaitable `_request_items_pages_chunks`: send `data` in sequential chunks."""
+        if chunksize is None:
+            chunksize = len(data)
+
+        if chunksize == 0:
+            async for response in self._arequest_items_pages(method, url, params=params):
+                yield response
+
+        for chunk in chunked(data, chunksize):
+            params_ = params
+            while True:
+                response = await self._arequest_with_retry(method, url, params=params_, json_body=chunk)
+                try:
+                    response.raise_for_status()
+                except Exception as e:
+                    print(f'\nException occured during request:\nURL: {url}\n')
+                    raise e
+
+                yield response
+
+                next_page_url: Optional[str] = get_next_page_url(response.headers)
+                if next_page_url is None:
+                    break
+                url = next_page_url
+                params_ = None
+
+    async def _aget_items_iterator(
+        self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+    ) -> AsyncIterator[ItemList]:
+        """
+        Awaitable `_get_items_iterator`: asynchronously yields each page's JSON
+        as a list of objects
+        """
+        async for response in self._arequest_items_pages('get', url, params):
+            yield self._extract_json(response)
+
+    async def _aget_items(self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None) -> ItemList:
+        """
+        Awaitable `_get_items`: returns every page's JSON as one list of objects
+        """
+        items: ItemList = []
+        async for response in self._arequest_items_pages('get', url, params):
+            items.extend(self._extract_json(response))
+
+        return items
+
+    async def _awrite_items(self, method: str, url: str, data: ItemList, chunksize: Optional[int]) -> ItemList:
+        items: ItemList = []
+        async for response in self._arequest_items_pages_chunks(method, url, data, chunksize):
+            items.extend(self._extract_json(response))
+
+        return items
+
+    async def _apost_items(self, url: str, data: ItemList, chunksize: Optional[int] = None) -> ItemList:
+        """
+        Awaitable `_post_items`: POSTs `data` in chunks, returning JSON of type:
+        list of objects
+        """
+        return await self._awrite_items('post', url, data, chunksize)
+
+    async def _aput_items(self, url: str, data: ItemList, chunksize: Optional[int] = None) -> ItemList:
+        """
+        Awaitable `_put_items`: PUTs `data` in chunks, returning JSON of type:
+        list of objects
+        """
+        return await self._awrite_items('put', url, data, chunksize)
+
+    async def _apatch_items(self, url: str, data: ItemList, chunksize: Optional[int] = None) -> ItemList:
+        """
+        Awaitable `_patch_items`: PATCHes `data` in chunks, returning JSON of
+        type: list of objects
+        """
+        return await self._awrite_items('patch', url, data, chunksize)
+
+    async def _adelete_items(self, url: str, data: ItemList, chunksize: Optional[int] = None) -> ItemList:
+        """
+        Awaitable `_delete_items`: DELETEs `data` in chunks, returning JSON of
+        type: list of objects
+        """
+        return await self._awrite_items('delete', url, data, chunksize)
+
+    async def _asend_one_chunk(
+        self,
+        method: str,
+        url: str,
+        index: int,
+        offset: int,
+        chunk: ItemList,
+        rate_limit: _AsyncRateLimitState,
+    ) -> BatchChunk:
+        """Awaitable `_send_one_chunk`: same retries, whole-chunk failure accounting, timeouts and timings."""
+        count = len(chunk)
+        content_headers: Dict[str, str] = {}
+        body = self._encode_body(chunk, content_headers)
+        deadline = _current_deadline()
+        chunk_start = time.monotonic()
+        rate_limit_wait = 0.0
+        backoff_wait = 0.0
+        attempts = 0
+        response: Optional[httpx.Response] = None
+        try:
+            while True:
+                attempt = attempts
+                rate_limit_wait += await rate_limit.wait_if_limited(deadline)
+                if deadline is not None:
+                    deadline.check(f'sending batch chunk {index}')
+                headers = {**self._get_auth_headers(), **content_headers}
+                attempts += 1
+                response = await self._asend(method, url, headers=headers, body=body, attempt=attempt)
+                status = response.status_code
+
+                if attempt < _MAX_REQUEST_RETRIES:
+                    if status == 429:
+                        self._emit('retry', method, url, None, attempt, status=status, sleep=rate_limit.pause_seconds)
+                        rate_limit.set_limited()
+                        continue
+                    if status in _RETRYABLE_GATEWAY_STATUSES:
+                        delay = _GATEWAY_BACKOFF_SECONDS * (2.0**attempt)
+                        if deadline is not None:
+                            deadline.check(f'retrying HTTP {status} in {delay:g} s', delay)
+                        self._emit('retry', method, url, None, attempt, status=status, sleep=delay)
+                        await asyncio.sleep(delay)
+                        backoff_wait += delay
+                        continue
+                elif status == 429 or status in _RETRYABLE_GATEWAY_STATUSES:
+                    self._emit('give_up', method, url, None, attempt, status=status)
+
+                chunk_result = _parse_chunk_response(index, offset, count, response, self.codec)
+                break
+        except (httpx.TimeoutException, DeadlineExceeded) as e:
+            if isinstance(e, DeadlineExceeded) and e.__cause__ is None:  # `_asend` reported timeouts
+                self._emit('give_up', method, url, None, max(0, attempts - 1), error=e)
+            chunk_result = _timed_out_chunk(index, offset, count, response, e)
+
+        chunk_result.attempts = attempts
+        chunk_result.request_bytes = len(body or b'')
+        chunk_result.elapsed = time.monotonic() - chunk_start
+        chunk_result.rate_limit_wait = rate_limit_wait
+        chunk_result.backoff_wait = backoff_wait
+        return chunk_result
+
+    async def _arequest_batched(
+        self,
+        method: str,
+        url: str,
+        data: ItemList,
+        *,
+        chunksize: int,
+        max_workers: int = 10,
+        on_progress: Optional[Callable[[BatchChunk], None]] = None,
+    ) -> BatchWriteResult:
+        """Awaitable `_request_batched`: up to `max_workers` chunks in flight at once.
+
+        Returns the same stitched, input-ordered `BatchWriteResult`; a 429 in
+        any chunk pauses the whole batch. ``on_progress`` is called once per
+        completed chunk, on the event loop.
+        """
+        chunk_specs = _split_chunks(data, chunksize)
+
+        rate_limit = _AsyncRateLimitState(pause_seconds=_RATE_LIMIT_DEFAULT_PAUSE_SECONDS)
+        semaphore = asyncio.Semaphore(max_workers)
+        completed: List[BatchChunk] = []
+        start = time.monotonic()
+
+        async def send(index: int, off: int, chunk_list: ItemList) -> BatchChunk:
+            async with semaphore:
+                return await self._asend_one_chunk(method, url, index, off, chunk_list, rate_limit)
+
+        for future in asyncio.as_completed([send(index, off, chunk_list) for index, off, chunk_list in chunk_specs]):
+            chunk_result = await future
+            completed.append(chunk_result)
+            if on_progress is not None:
+                on_progress(chunk_result)
+
+        return _stitch_batch(completed, [(0.0, max_workers)], time.monotonic() - start, rate_limit.paused)
+
+
+class AsyncComboCurveAPI(
+    Root,
+    Projects,
+    Scenarios,
+    Production,
+    EconRuns,
+    Wells,
+    Models,
+    CompanyModels,
+    Forecasts,
+    TypeCurves,
+    Directional,
+    ForecastConfigurations,
+    OwnershipQualifiers,
+    Exports,
+    AsyncAPIBase,
+):
+    """
+    The asyncio counterpart of `ComboCurveAPI`: the same `get_*_url` builders
+    from every resource mixin, plus the awaitable `_a*` dispatchers of
+    `AsyncAPIBase`.
+    """
+
+    pass
@@ -1,20 +1,55 @@
+import contextvars
 import warnings
+from contextlib import contextmanager
 from pathlib import Path
 import json
+import queue
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from itertools import chain
+from urllib.parse import parse_qs, urlsplit
 from more_itertools import chunked
-from typing import Callable, List, Dict, Optional, Sequence, Tuple, Union, Any, Iterable, Iterator, Mapping
-from typing_extensions import Self, TypeAlias, TypedDict
+from typing import (
+    Callable,
+    ContextManager,
+    Deque,
+    Generic,
+    List,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from typing_extensions import Protocol, Self, TypeAlias, TypedDict
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 from combocurve_api_v1 import ServiceAccount, ComboCurveAuth
 from combocurve_api_v1.pagination import get_next_page_url
 
 from . import config
-from ._batch import BatchChunk, BatchWriteResult, _RateLimitState
+from ._auth import AuthHeaderStats, _AuthHeaderCache
+from ._rate_limit import TokenBucket
+from ._codec import JSONCodec, default_codec
+from ._stream import _iter_json_array
+from ._hooks import EventKind, HookRegistry, RequestEvent, _url_template
+from ._metrics import RequestMetrics
+from ._compress import CompressionStats, _GZIP_LEVEL, _GZIP_MIN_BYTES, _RequestCompressor
+from ._batch import BatchChunk, BatchWriteResult, _AdaptiveConcurrency, _RateLimitState
+from ._cassette import CassettePlayer, CassetteRecorder, load_cassette, save_cassette
+from ._planner import RequestPlan, _DryRunAdapter, _mean_latencies
+from ._deadline import DeadlineExceeded, _Deadline, _current_deadline, _deadline_scope, _request_timeout
+from ._cache import ResponseCache, _CachedPage, _cache_key, _cached_page
 
 
 # A single JSON value: the recursive union of everything `json.loads` can yield.
@@ -38,6 +73,26 @@ Item: TypeAlias = Dict[str, JsonValue]
 ItemList: TypeAlias = List[Item]
 
 
+class _ResponseLike(Protocol):
+    """The slice of an HTTP response the retry, pagination, and parsing helpers read.
+
+    Satisfied by `requests.Response` and by the async client's `httpx.Response`,
+    so both transports share one retry policy and one 207-envelope parser.
+    """
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+
 class WriteError(TypedDict, total=False):
     """One entry in a write response's `generalErrors` list."""
 
@@ -77,8 +132,29 @@ _RATE_LIMIT_DEFAULT_PAUSE_SECONDS = 60.0
 _RETRYABLE_GATEWAY_STATUSES = frozenset({502, 503, 504})
 _GATEWAY_BACKOFF_SECONDS = 1.0  # sleep before a gateway retry = _GATEWAY_BACKOFF_SECONDS * 2**attempt
 
+# Default `APIBase.timeout`: seconds to establish a connection, and seconds the
+# socket may go without receiving a byte of the response (not the whole response
+# time). Large writes and exports can legitimately take minutes to answer.
+_CONNECT_TIMEOUT_SECONDS = 10.0
+_READ_TIMEOUT_SECONDS = 300.0
+
+# Connection pooling for the keep-alive session every request goes through. All
+# routes (v1 and v2) share one host, so only a few per-host pools are ever cached;
+# `_POOL_MAXSIZE` is the number of reusable connections to that host and matches
+# `_request_batched`'s default `max_workers`, which grows it on demand.
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 10
+
+# Bytes read off the socket per step when a page body is decoded as a stream.
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Adaptive (AIMD) batch concurrency: start this many chunks in flight, and only
+# grow while chunks come back within the latency target.
+_ADAPTIVE_INITIAL_CONCURRENCY = 2
+_ADAPTIVE_LATENCY_TARGET_SECONDS = 10.0
+
 
-def _retry_after_seconds(response: Response) -> Optional[float]:
+def _retry_after_seconds(response: _ResponseLike) -> Optional[float]:
     """Return the `Retry-After` header as seconds if present in delta-seconds form.
 
     The HTTP-date form is not parsed here; callers fall back to the default pause.
@@ -92,7 +168,7 @@ def _retry_after_seconds(response: Response) -> Optional[float]:
         return None
 
 
-def _retry_delay_seconds(response: Response, attempt: int) -> Optional[float]:
+def _retry_delay_seconds(response: _ResponseLike, attempt: int) -> Optional[float]:
     """Seconds to wait before retrying `response`, or None if it is not retryable.
 
     Retryable: HTTP 429 (wait `Retry-After` or the default quota pause) and
@@ -107,16 +183,185 @@ def _retry_delay_seconds(response: Response, attempt: int) -> Optional[float]:
     return None
 
 
+def _parse_chunk_response(index: int, offset: int, count: int, response: _ResponseLike, codec: JSONCodec) -> BatchChunk:
+    """Build the `BatchChunk` for one sent batch chunk from its final response.
+
+    A 4xx/5xx is a whole-chunk failure carrying the error body; anything else is
+    parsed (with `codec`) as the 207 envelope (a malformed or non-object body
+    counts as empty).
+    """
+    status = response.status_code
+    if status >= 400:
+        try:
+            detail: Any = codec.loads(response.content)
+        except ValueError:
+            detail = response.text
+        return BatchChunk(
+            index=index,
+            offset=offset,
+            count=count,
+            http_status=status,
+            failed_count=count,
+            error_message=str(detail),
+        )
+
+    try:
+        body: Any = codec.loads(response.content)
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
+        body = {}
+    results_raw = body.get('results') or []
+    general_raw = body.get('generalErrors') or []
+    return BatchChunk(
+        index=index,
+        offset=offset,
+        count=count,
+        http_status=status,
+        success_count=int(body.get('successCount', 0) or 0),
+        failed_count=int(body.get('failedCount', 0) or 0),
+        results=[r for r in results_raw if isinstance(r, dict)],
+        general_errors=[e for e in general_raw if isinstance(e, dict)],
+    )
+
+
+def _timed_out_chunk(
+    index: int, offset: int, count: int, response: Optional[_ResponseLike], error: BaseException
+) -> BatchChunk:
+    """Build the whole-chunk failure of a chunk that hit a timeout or its deadline."""
+    return BatchChunk(
+        index=index,
+        offset=offset,
+        count=count,
+        http_status=response.status_code if response is not None else 0,
+        failed_count=count,
+        error_message=f'{type(error).__name__}: {error}',
+        timed_out=True,
+    )
+
+
+def _stitch_batch(
+    completed: List[BatchChunk],
+    concurrency: List[Tuple[float, int]],
+    elapsed: float = 0.0,
+    rate_limit_pause: float = 0.0,
+) -> BatchWriteResult:
+    """Order completed chunks by index and stitch them into one `BatchWriteResult`."""
+    completed.sort(key=lambda c: c.index)
+
+    results: ItemList = []
+    general_errors: ItemList = []
+    success_count = 0
+    failed_count = 0
+    for chunk_result in completed:
+        results.extend(chunk_result.results)
+        general_errors.extend(chunk_result.general_errors)
+        success_count += chunk_result.success_count
+        failed_count += chunk_result.failed_count
+
+    return BatchWriteResult(
+        success_count=success_count,
+        failed_count=failed_count,
+        results=results,
+        general_errors=general_errors,
+        chunks=completed,
+        concurrency=concurrency,
+        elapsed=elapsed,
+        rate_limit_pause=rate_limit_pause,
+    )
+
+
+def _is_skip_paginated(next_page_url: str) -> bool:
+    """True when a `Link` next-page URL pages by `skip` (vs. an opaque cursor)."""
+    return 'skip' in parse_qs(urlsplit(next_page_url).query)
+
+
+def _split_chunks(data: ItemList, chunksize: int) -> List[Tuple[int, int, ItemList]]:
+    """Split `data` into `(index, offset, chunk)` specs of up to `chunksize` records."""
+    chunk_specs: List[Tuple[int, int, ItemList]] = []
+    offset = 0
+    for index, chunk in enumerate(chunked(data, chunksize)):
+        chunk_list: ItemList = list(chunk)
+        chunk_specs.append((index, offset, chunk_list))
+        offset += len(chunk_list)
+    return chunk_specs
+
+
+def _reserve_rate_limit(rate_limiter: TokenBucket, deadline: Optional[_Deadline]) -> float:
+    """Take a request's token from `rate_limiter`; return the seconds to wait before sending.
+
+    Under a `deadline`, raises `DeadlineExceeded` -- without taking a token, so a
+    request that is never sent does not use up the shared quota -- if it has run
+    out or the wait would overrun it.
+    """
+    if deadline is None:
+        return rate_limiter.reserve()
+    what = 'waiting for the rate limiter'
+    waited = rate_limiter.try_reserve(max_wait=deadline.check(what))
+    if waited is None:
+        raise deadline.exceeded(f'before {what}')
+    return waited
+
+
+def _adapter_pool_maxsize(adapter: HTTPAdapter) -> int:
+    """Return the per-host connection pool size `adapter` was last initialized with."""
+    return int(getattr(adapter, '_pool_maxsize', 0))
+
+
+class _OfflineAuth:
+    """Stands in for `ComboCurveAuth` on instances built by `APIBase.offline()`: no auth headers."""
+
+    def get_auth_headers(self) -> Dict[str, str]:
+        return {}
+
+
+_T = TypeVar('_T')
+
+
+class _FromConfig(Generic[_T]):
+    """Class attribute computed from `config` on first access, so defining `APIBase` reads no files.
+
+    A subclass or instance assigning the attribute overrides it as usual.
+    """
+
+    def __init__(self, load: Callable[[], _T]) -> None:
+        self._load = load
+        self._value: Optional[_T] = None
+
+    def __get__(self, obj: object, owner: Optional[type] = None) -> _T:
+        if self._value is None:
+            self._value = self._load()
+        return self._value
+
+
 class APIBase:
     API_BASE_URL = 'https://api.combocurve.com/v1'
     API_BASE_URL_V2 = 'https://api.combocurve.com/v2'  # async export routes are the only /v2 routes
-    REFERENCE_WELLHEADER = config.REFERENCE_WELLHEADER
-    WELLHEADER_COLUMNS = {k.lower(): k for k in config.REFERENCE_WELLHEADER.keys()}
-    ECON_MODELS = config.ECON_MODELS
+    REFERENCE_WELLHEADER = _FromConfig(lambda: config.REFERENCE_WELLHEADER)
+    WELLHEADER_COLUMNS = _FromConfig(lambda: {k.lower(): k for k in config.REFERENCE_WELLHEADER.keys()})
+    ECON_MODELS = _FromConfig(lambda: config.ECON_MODELS)
+
+    # Optional proactive pacing: when set, every request takes a token first. The
+    # class attribute is process-wide (see `set_rate_limit`); assigning
+    # `api.rate_limiter` gives one instance its own bucket.
+    rate_limiter: Optional[TokenBucket] = None
+    # (connect, read) timeouts of every request, so a stalled socket raises
+    # `requests.Timeout` instead of hanging its thread; None waits forever. Per
+    # instance or, on the class, process-wide. See also `deadline()`.
+    timeout: Optional[Tuple[float, float]] = (_CONNECT_TIMEOUT_SECONDS, _READ_TIMEOUT_SECONDS)
+    # Encodes every write payload and decodes every response body: orjson when
+    # installed, else stdlib `json` (see `_codec.py`). Replaceable per instance
+    # or, on the class, process-wide.
+    codec: JSONCodec = default_codec()
+    # Opt-in read-through cache of `_get_items` / `_get_items_iterator` calls,
+    # invalidated by this client's writes (see `enable_cache`). Per instance
+    # or, on the class, process-wide.
+    response_cache: Optional[ResponseCache] = None
 
     def __init__(self) -> None:
         account = ServiceAccount.from_file(str(config.COMBOCURVE_JSON))
         self.auth = ComboCurveAuth(account, config.cfg.apikey)
+        self._init_transport()
 
     @classmethod
     def from_alternate_config(
@@ -133,14 +378,432 @@ class APIBase:
             account = ServiceAccount.from_file(combocurve_json_path.absolute())
 
         api_base.auth = ComboCurveAuth(account, cfg.apikey)
+        api_base._init_transport()
+
+        return api_base
+
+    @classmethod
+    def offline(cls) -> Self:
+        """Return an instance that sends no credentials and loads no config files.
 
+        For transports that need none: a replayed cassette (`replay_cassette`) or
+        a local `fake_server`.
+        """
+        api_base = cls.__new__(cls)
+        api_base.auth = _OfflineAuth()
+        api_base._init_transport()
         return api_base
 
-    def _extract_json(self, response: requests.Response) -> ItemList:
+    def _init_transport(self) -> None:
+        """Set up the per-instance transport state. Called by every constructor."""
+        self._session_lock = threading.Lock()
+        self._pool_maxsize = _POOL_MAXSIZE
+        self.session = self._new_session(_POOL_MAXSIZE)
+        self._auth_headers = _AuthHeaderCache(lambda: self.auth.get_auth_headers())
+        self._request_compressor = _RequestCompressor()
+        self.hooks = HookRegistry()
+
+    def _get_auth_headers(self) -> Mapping[str, str]:
+        """Return the current auth headers from the instance's expiry-aware cache.
+
+        Safe to call from any thread and on every attempt: the token is re-signed
+        (by exactly one caller) only shortly before it expires. Replacing
+        `self.auth` should be followed by `invalidate_auth_headers()`.
+        """
+        return self._auth_headers.get()
+
+    def invalidate_auth_headers(self) -> None:
+        """Drop the cached auth headers so the next request re-signs its token."""
+        self._auth_headers.invalidate()
+
+    def auth_header_stats(self) -> AuthHeaderStats:
+        """Return the auth header cache's refresh count and time spent signing."""
+        return self._auth_headers.stats()
+
+    @staticmethod
+    def _new_session(pool_maxsize: int) -> requests.Session:
+        """Return a `requests.Session` with keep-alive connection pools of `pool_maxsize`."""
+        session = requests.Session()
+        session.headers['Accept-Encoding'] = DEFAULT_ACCEPT_ENCODING
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def configure_session(
+        self, *, pool_maxsize: Optional[int] = None, session: Optional[requests.Session] = None
+    ) -> None:
+        """Replace the pooled session every request goes through.
+
+        `pool_maxsize` rebuilds the default session with that many reusable
+        connections per host. `session` installs a caller-built session as-is
+        (e.g. one carrying proxies, certificates, or custom adapters); its
+        `HTTPAdapter` pools are still grown (never shrunk) to `max_workers` by
+        `_request_batched`, keeping each adapter's pool count and blocking,
+        and it negotiates compressed responses unless it already sets its own
+        `Accept-Encoding`. The previous session is closed.
+        """
+        if session is not None:
+            session.headers.setdefault('Accept-Encoding', DEFAULT_ACCEPT_ENCODING)
+        with self._session_lock:
+            previous = self.session
+            if session is not None:
+                self._pool_maxsize = min(
+                    (_adapter_pool_maxsize(a) for a in session.adapters.values() if isinstance(a, HTTPAdapter)),
+                    default=_POOL_MAXSIZE,
+                )
+            elif pool_maxsize is not None:
+                self._pool_maxsize = pool_maxsize
+            self.session = session if session is not None else self._new_session(self._pool_maxsize)
+        previous.close()
+
+    def configure_compression(self, *, min_bytes: Optional[int] = _GZIP_MIN_BYTES, level: int = _GZIP_LEVEL) -> None:
+        """Gzip request bodies of at least `min_bytes` encoded bytes (None: send all uncompressed).
+
+        Off by default. Applies to every write body sent through `_send` --
+        the `_request_items_pages_chunks` pages, the `_request_batched` chunks,
+        and the single-object endpoints -- which go out with
+        ``Content-Encoding: gzip``. Bodies that gzip would not shrink are sent
+        as-is. `level` is the zlib compression level. Savings accumulate in
+        `compression_stats()` across reconfigurations.
+        """
+        self._request_compressor.min_bytes = min_bytes
+        self._request_compressor.level = level
+
+    @contextmanager
+    def record_cassette(self, path: Union[str, Path]) -> Iterator[CassetteRecorder]:
+        """Record every response received inside the ``with`` block to the cassette file `path`.
+
+        Mounts a recording adapter on the pooled session (a `configure_session`
+        in the block drops it) and saves the cassette when the block exits, even
+        on error. Statuses, headers and bodies are stored; request headers --
+        the auth token included -- are not. See `_cassette.py`.
+        """
+        recorder = CassetteRecorder(_POOL_CONNECTIONS, self._pool_maxsize)
+        with self._session_lock:
+            session = self.session
+            previous = {prefix: session.adapters[prefix] for prefix in ('https://', 'http://')}
+            for prefix in previous:
+                session.mount(prefix, recorder)
+        try:
+            yield recorder
+        finally:
+            with self._session_lock:
+                for prefix, adapter in previous.items():
+                    session.mount(prefix, adapter)
+            recorder.close()
+            save_cassette(path, recorder.interactions)
+
+    def replay_cassette(self, path: Union[str, Path], *, time_scale: float = 1.0) -> CassettePlayer:
+        """Answer every request from the cassette file `path` instead of the network.
+
+        Each response is delayed by `time_scale` times its recorded duration (1.0:
+        the original timings; 0: no delay). Returns the mounted `CassettePlayer`,
+        whose `served` / `remaining` counts show how the replayed run's requests
+        compare with the recorded one. Pair with `offline()` to replay without
+        credentials; `configure_session()` restores network access.
+        """
+        player = CassettePlayer(load_cassette(path), time_scale)
+        with self._session_lock:
+            self.session.mount('https://', player)
+            self.session.mount('http://', player)
+        return player
+
+    @contextmanager
+    def dry_run(
+        self,
+        *,
+        items: Optional[Mapping[str, int]] = None,
+        metrics: Optional[RequestMetrics] = None,
+        latency: float = 0.5,
+        concurrency: int = 1,
+    ) -> Iterator[RequestPlan]:
+        """Plan the requests made inside the ``with`` block instead of sending them.
+
+        Every request this instance makes in the block is recorded into the
+        yielded `RequestPlan` and answered locally: writes succeed in full, and
+        GETs return placeholder pages up to `items` records per endpoint (keyed
+        by URL template or path, e.g. ``'/v1/projects/{id}/wells'``; none when
+        absent). Nothing reaches the network, the rate limiter is not waited
+        on, the response cache is neither read nor invalidated, hooks do not
+        fire, and compression stats are left untouched.
+
+        The plan estimates the duration from each endpoint's mean latency in
+        `metrics` (`latency` seconds for endpoints it has not measured), spread
+        over `concurrency` parallel requests, and from the `rate_limiter` quota
+        in effect. See `_planner.py`.
+        """
+        bucket = self.rate_limiter
+        plan = RequestPlan(
+            concurrency=concurrency,
+            requests_per_second=bucket.rate if bucket is not None else None,
+            burst=bucket.capacity if bucket is not None else 0.0,
+            default_latency=latency,
+            latencies=_mean_latencies(metrics),
+        )
+        adapter = _DryRunAdapter(plan, items or {})
+        hooks, compressor, cache = self.hooks, self._request_compressor, self.response_cache
+        owns_limiter = 'rate_limiter' in vars(self)
+        owns_cache = 'response_cache' in vars(self)
+        with self._session_lock:
+            session = self.session
+            previous = {prefix: session.adapters[prefix] for prefix in ('https://', 'http://')}
+            for prefix in previous:
+                session.mount(prefix, adapter)
+        self.rate_limiter = None
+        self.response_cache = None
+        self.hooks = HookRegistry()
+        self._request_compressor = _RequestCompressor(compressor.min_bytes, compressor.level)
+        try:
+            yield plan
+        finally:
+            with self._session_lock:
+                for prefix, previous_adapter in previous.items():
+                    session.mount(prefix, previous_adapter)
+            self.hooks, self._request_compressor = hooks, compressor
+            if owns_limiter:
+                self.rate_limiter = bucket
+            else:
+                del self.rate_limiter  # fall back to the class-wide limiter again
+            if owns_cache:
+                self.response_cache = cache
+            else:
+                del self.response_cache
+
+    def deadline(self, seconds: float) -> ContextManager[_Deadline]:
+        """Bound every request made inside the ``with`` block to `seconds` from now, retries and pages included.
+
+        Request timeouts are clipped to the time left, and a wait (429 pause,
+        gateway backoff, rate limiter) that would overrun it raises
+        `DeadlineExceeded` instead of starting; batched writes return a partial
+        `BatchWriteResult` instead. The budget is per thread / asyncio task, not
+        per instance: it covers every client's requests in the block. See
+        `_deadline.py`.
+        """
+        return _deadline_scope(seconds)
+
+    def enable_metrics(self, metrics: Optional[RequestMetrics] = None) -> RequestMetrics:
+        """Start collecting per-endpoint request metrics; return the collector.
+
+        Registers `metrics` (a new `RequestMetrics` if omitted) as a request
+        hook; pass the same collector to several instances to aggregate them.
+        Unregister with ``api.hooks.remove(metrics)``.
+        """
+        if metrics is None:
+            metrics = RequestMetrics()
+        self.hooks.add(metrics)
+        return metrics
+
+    def enable_cache(
+        self,
+        cache: Optional[ResponseCache] = None,
+        *,
+        ttl: float = 300.0,
+        routes: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Union[str, Path, None] = None,
+    ) -> ResponseCache:
+        """Start caching `_get_items` / `_get_items_iterator` calls; return the cache.
+
+        Installs `cache`, or a new `ResponseCache` built from the keywords:
+        entries live `ttl` seconds (per URL template glob in `routes`, 0 for
+        never), at most `max_entries` of them and `max_bytes` of bodies, in
+        memory or in the SQLite file `path`. This client's writes invalidate
+        the entries of the resource they write to. Expired pages that came
+        with an ``ETag`` or ``Last-Modified`` are revalidated with conditional
+        requests rather than downloaded again. ``cache.stats()`` reports hits,
+        misses and revalidations; ``api.response_cache = None`` turns caching
+        off. See `_cache.py`.
+        """
+        if cache is None:
+            cache = ResponseCache(ttl=ttl, routes=routes, max_entries=max_entries, max_bytes=max_bytes, path=path)
+        self.response_cache = cache
+        return cache
+
+    def compression_stats(self) -> CompressionStats:
+        """Return how many request bodies were gzipped and the bytes that saved."""
+        return self._request_compressor.stats()
+
+    def _ensure_pool_size(self, pool_maxsize: int) -> None:
+        """Grow the session's connection pools to at least `pool_maxsize` connections.
+
+        Called before fanning requests out across a thread pool, so every worker
+        gets a kept-alive connection instead of urllib3 discarding the overflow.
+        """
+        with self._session_lock:
+            if pool_maxsize <= self._pool_maxsize:
+                return
+            self._pool_maxsize = pool_maxsize
+            for adapter in set(self.session.adapters.values()):
+                if isinstance(adapter, HTTPAdapter) and _adapter_pool_maxsize(adapter) < pool_maxsize:
+                    # keep the adapter's own pool count and blocking; a subclass's
+                    # `init_poolmanager` re-adds its extra pool kwargs, as on unpickling
+                    connections = getattr(adapter, '_pool_connections', _POOL_CONNECTIONS)
+                    block = getattr(adapter, '_pool_block', False)
+                    adapter.poolmanager.clear()  # close the old pools' idle connections rather than leaking them
+                    adapter.init_poolmanager(connections, pool_maxsize, block)
+
+    @staticmethod
+    def set_rate_limit(requests_per_second: Optional[float], burst: Optional[float] = None) -> Optional[TokenBucket]:
+        """Pace every request of every API instance in the process through one token bucket.
+
+        Size it to the account's quota (`requests_per_second=quota_per_minute / 60`)
+        so requests are spread out instead of tripping 429s and the
+        `_RATE_LIMIT_DEFAULT_PAUSE_SECONDS` stall that follows. `burst` caps how
+        many requests may go back-to-back after an idle spell (default: one
+        second's worth). `None` removes the limit. Returns the installed bucket;
+        assigning a prebuilt bucket to `APIBase.rate_limiter` is equivalent.
+        """
+        APIBase.rate_limiter = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        return APIBase.rate_limiter
+
+    def close(self) -> None:
+        """Close the pooled session and its kept-alive connections."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        json_body: Any = None,
+        body: Optional[bytes] = None,
+        stream: bool = False,
+        attempt: int = 0,
+    ) -> Response:
+        """Issue one HTTP request on the pooled session (no retries).
+
+        The single transport path for the package: `_request_with_retry`,
+        `_send_one_chunk`, and the single-object-body endpoints all send through
+        here, so they share kept-alive connections and the `rate_limiter`.
+        `json_body` is encoded with `codec` (and gzipped when large, see
+        `configure_compression`); a sender retrying one payload can encode it
+        once with `_encode_body` and pass the result as `body` (its content
+        headers in `headers`) instead. With `stream`, only the status
+        line and headers are read before returning; the body is left on the
+        connection for the caller to consume (or `close()`).
+
+        Sent with `timeout`, clipped to the time left under an active
+        `deadline()`; raises `DeadlineExceeded` if that has run out or the
+        rate limiter's delay would overrun it.
+
+        Emits the ``start`` and ``response`` hook events (``give_up`` if
+        sending raises); `attempt` is reported on them. Any method but GET
+        invalidates the `response_cache` entries of `url`'s resource, and of
+        the collection holding it when it is a record, even when the request
+        fails (it may have been partly applied).
+        """
+        deadline = _current_deadline()
+        rate_limiter = self.rate_limiter
+        waited = 0.0
+        if rate_limiter is not None:
+            waited = _reserve_rate_limit(rate_limiter, deadline)
+            if waited > 0:
+                time.sleep(waited)
+        timeout = _request_timeout(self.timeout, deadline)
+        headers_ = dict(headers)
+        data = body if body is not None else self._encode_body(json_body, headers_)
+        try:
+            if not self.hooks:
+                return self.session.request(
+                    method, url, headers=headers_, params=params, data=data, stream=stream, timeout=timeout
+                )
+
+            sent = len(data) if data is not None else 0
+            self._emit('start', method, url, params, attempt, bytes_sent=sent, sleep=waited)
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, headers=headers_, params=params, data=data, stream=stream, timeout=timeout
+                )
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                self._emit('give_up', method, url, params, attempt, bytes_sent=sent, elapsed=elapsed, error=e)
+                raise
+            self._emit_response(method, url, params, attempt, response, sent, time.perf_counter() - start, stream)
+            return response
+        except requests.Timeout as e:
+            if deadline is not None and deadline.expired():  # cut short by the deadline, not `timeout`
+                raise deadline.exceeded(f'awaiting {method.upper()} {url}') from e
+            raise
+        finally:
+            cache = self.response_cache
+            if cache is not None and method.upper() != 'GET':
+                cache.invalidate(url)
+
+    def _emit(
+        self,
+        kind: EventKind,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]],
+        attempt: int,
+        **fields: Any,
+    ) -> None:
+        """Report a `RequestEvent` to the registered hooks, if there are any."""
+        if self.hooks:
+            self.hooks.emit(RequestEvent(kind, method, url, _url_template(url), params, attempt, **fields))
+
+    def _emit_response(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]],
+        attempt: int,
+        response: _ResponseLike,
+        sent: int,
+        elapsed: float,
+        stream: bool = False,
+    ) -> None:
+        """Report the ``response`` event, sizing the body without reading a streamed one."""
+        length = response.headers.get('Content-Length')
+        if length is not None and length.isdigit():
+            received = int(length)
+        else:
+            received = 0 if stream else len(response.content)
+        self._emit(
+            'response',
+            method,
+            url,
+            params,
+            attempt,
+            status=response.status_code,
+            bytes_sent=sent,
+            bytes_received=received,
+            elapsed=elapsed,
+        )
+
+    def _encode_body(self, json_body: Any, headers: Dict[str, str]) -> Optional[bytes]:
+        """Encode `json_body` for the wire, setting its content headers in `headers`."""
+        if json_body is None:
+            return None
+        data = self.codec.dumps(json_body)
+        headers['Content-Type'] = 'application/json'
+        compressed = self._request_compressor.compress(data)
+        if compressed is None:
+            return data
+        headers['Content-Encoding'] = 'gzip'
+        return compressed
+
+    def _extract_json(self, response: _ResponseLike) -> ItemList:
         """
-        Ensure returned JSON is a list of objects
+        Decode the response body with `codec`, ensuring the JSON is a list of
+        objects
         """
-        json_ = response.json()
+        return self._decode_items(response.content)
+
+    def _decode_items(self, content: bytes) -> ItemList:
+        """Decode a page body with `codec`, ensuring the JSON is a list of objects."""
+        json_ = self.codec.loads(content)
         if isinstance(json_, dict):
             json_ = [json_]
         elif not isinstance(json_, list):
@@ -155,35 +818,61 @@ class APIBase:
         *,
         params: Optional[Mapping[str, Union[str, int, float]]] = None,
         json_body: Any = None,
+        stream: bool = False,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> Response:
-        """Issue a single HTTP request, refreshing auth headers each attempt and
-        retrying transient failures.
+        """Issue a single HTTP request, reading auth headers from the cache each
+        attempt (so a long backoff never resends an expired token) and retrying
+        transient failures.
 
         Retries HTTP 429 (waiting `Retry-After` or the default quota pause) and
         transient gateway errors 502/503/504 (exponential backoff), for up to
         `_MAX_REQUEST_RETRIES` retries. Any other response (success or a
         non-transient error) is returned immediately for the caller to handle
-        (e.g. `raise_for_status`).
+        (e.g. `raise_for_status`). Under a `deadline()`, a retry whose wait
+        would overrun it raises `DeadlineExceeded` instead of sleeping.
+        `headers` are sent in addition to the auth headers.
         """
+        deadline = _current_deadline()
         for attempt in range(_MAX_REQUEST_RETRIES + 1):
-            headers = self.auth.get_auth_headers()
-            response = requests.request(method, url, headers=headers, params=params, json=json_body)
+            headers_ = self._get_auth_headers()
+            if headers:
+                headers_ = {**headers_, **headers}
+            response = self._send(
+                method, url, headers=headers_, params=params, json_body=json_body, stream=stream, attempt=attempt
+            )
             delay = _retry_delay_seconds(response, attempt)
-            if delay is None or attempt == _MAX_REQUEST_RETRIES:
+            if delay is None:
+                return response
+            if attempt == _MAX_REQUEST_RETRIES:
+                self._emit('give_up', method, url, params, attempt, status=response.status_code)
                 return response
+            if stream:
+                response.close()  # release the connection of the unread, retried response
+            if deadline is not None and delay >= deadline.remaining():
+                self._emit('give_up', method, url, params, attempt, status=response.status_code)
+                deadline.check(f'retrying HTTP {response.status_code} in {delay:g} s', delay)
+            self._emit('retry', method, url, params, attempt, status=response.status_code, sleep=delay)
             time.sleep(delay)
         raise RuntimeError('unreachable: retry loop always returns')
 
     def _request_items_pages(
-        self, method: str, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        stream: bool = False,
     ) -> Iterator[Response]:
         """
         Generic method for dispatching GET requests for the given `url` yielding
         response of each page
+
+        With `stream`, each response's body is still unread when it is yielded;
+        the next page is requested once the caller resumes the generator.
         """
         # keep fetching while there are more records to be returned
         while True:
-            response = self._request_with_retry(method, url, params=params)
+            response = self._request_with_retry(method, url, params=params, stream=stream)
             try:
                 response.raise_for_status()
             except Exception as e:
@@ -201,6 +890,120 @@ class APIBase:
 
             params = None
 
+    def _request_items_pages_prefetched(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Response]:
+        """
+        `_request_items_pages` with up to `prefetch` pages fetched ahead of the
+        consumer on a background thread
+
+        Cursor routes only reveal the next page's URL in each response's `Link`
+        header, so pages are still fetched one after another -- but as soon as a
+        page arrives the worker starts on the next, while the caller decodes and
+        transforms the current one. Look-ahead is bounded: at most `prefetch`
+        pages are fetched beyond the one the caller is processing. Errors are
+        re-raised in the caller at the page where they occurred, and abandoning
+        the iterator stops the worker.
+        """
+        slots = threading.Semaphore(prefetch)
+        pages: queue.Queue[Tuple[Optional[Response], Optional[BaseException]]] = queue.Queue()
+        stop = threading.Event()
+
+        def produce() -> None:
+            try:
+                iterator = self._request_items_pages(method, url, params)
+                while True:
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    response = next(iterator, None)
+                    pages.put((response, None))
+                    if response is None:
+                        return
+            except BaseException as e:
+                pages.put((None, e))
+
+        # run in a copy of the caller's context, so an active `deadline()` bounds the fetches
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(produce,), name='combocurve-prefetch', daemon=True).start()
+        try:
+            while True:
+                response, error = pages.get()
+                if error is not None:
+                    raise error
+                if response is None:
+                    return
+                slots.release()  # the caller now holds this page; fetch one more
+                yield response
+        finally:
+            stop.set()
+
+    def _request_item_pages_windowed(
+        self, url: str, params: Mapping[str, Union[str, int, float]], page_concurrency: int
+    ) -> Iterator[Tuple[Response, ItemList]]:
+        """
+        GET every page of `url` with up to `page_concurrency` skip windows in
+        flight, yielding each page's response and items in order
+
+        The first page is fetched alone; its `Link` header decides the mode. A
+        skip-paginated next link means the route honors `skip`/`take`, so the
+        remaining pages are requested as concurrent `skip` windows of `take`
+        records, reassembled in order, stopping at the first short page. A
+        cursor link (routes that ignore `skip`, e.g. the scenario econ-model
+        assignment grid) or a `params` without `take` falls back to following
+        the links one page at a time.
+        """
+        take = int(params['take']) if 'take' in params else 0
+        pages = self._request_items_pages('get', url, params)
+        first = next(pages)
+        items = self._extract_json(first)
+        yield first, items
+
+        next_page_url = get_next_page_url(first.headers)
+        if next_page_url is None or len(items) < take:
+            return
+        if take <= 0 or not _is_skip_paginated(next_page_url):
+            for response in pages:
+                yield response, self._extract_json(response)
+            return
+
+        def fetch_window(skip: int) -> Tuple[Response, ItemList]:
+            window = {**params, 'skip': skip, 'take': take}
+            response = self._request_with_retry('get', url, params=window)
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                print(f'\nException occured during request:\nURL: {url}\nParams: {window}\n')
+                raise e
+            return response, self._extract_json(response)
+
+        self._ensure_pool_size(page_concurrency)
+        next_skip = int(params.get('skip', 0)) + take
+        in_flight: Deque[Future[Tuple[Response, ItemList]]] = deque()
+        with ThreadPoolExecutor(max_workers=page_concurrency) as executor:
+            try:
+                while True:
+                    while len(in_flight) < page_concurrency:
+                        # each window runs in a copy of the caller's context (and its `deadline()`)
+                        in_flight.append(executor.submit(contextvars.copy_context().run, fetch_window, next_skip))
+                        next_skip += take
+
+                    response, page = in_flight.popleft().result()
+                    if page:
+                        yield response, page
+                    if len(page) < take:
+                        break
+            finally:
+                # windows past the end (or abandoned by the consumer) are not needed
+                for future in in_flight:
+                    future.cancel()
+
     def _request_items_pages_chunks(
         self,
         method: str,
@@ -245,69 +1048,94 @@ class APIBase:
         self,
         method: str,
         url: str,
-        headers: Mapping[str, str],
         index: int,
         offset: int,
         chunk: ItemList,
         rate_limit: _RateLimitState,
+        concurrency: Optional[_AdaptiveConcurrency] = None,
     ) -> BatchChunk:
         """Send one batch chunk with transient-failure retries; parse its 207 body.
 
-        Runs on a worker thread and uses pre-fetched `headers` (shared across
-        workers) rather than re-authenticating per request. A 429 pauses every
+        Runs on a worker thread and reads the shared auth header cache each
+        attempt, so a batch that outlives its token picks up the refreshed
+        headers mid-flight (one worker re-signs; the rest wait). A 429 pauses every
         worker via `rate_limit`; transient gateway errors (502/503/504) back off
         and retry just this chunk. Both retry up to `_MAX_REQUEST_RETRIES`; any
         other 4xx/5xx (and a transient status that survives all retries) is
-        recorded as a whole-chunk failure.
+        recorded as a whole-chunk failure. With adaptive `concurrency`, each
+        attempt holds one of its slots and reports whether it was congested
+        (429/502/503/504) or fast enough to grow the limit.
+
+        The chunk is encoded once and the same bytes resent on retries. The
+        returned `BatchChunk` carries the attempts made, the body size, and the
+        time spent overall, paused by 429s, and backing off gateway errors.
+
+        A connect/read timeout, or running out of an active `deadline()` (at
+        the start of an attempt, or before a pause or backoff that would
+        overrun it), ends the chunk as a `timed_out` whole-chunk failure
+        rather than raising, so the batch still returns.
         """
         count = len(chunk)
-        for attempt in range(_MAX_REQUEST_RETRIES + 1):
-            rate_limit.wait_if_limited()
-            response = requests.request(method, url, headers=dict(headers), json=chunk)
-            status = response.status_code
-
-            if attempt < _MAX_REQUEST_RETRIES:
-                if status == 429:
-                    rate_limit.set_limited()
-                    continue
-                if status in _RETRYABLE_GATEWAY_STATUSES:
-                    time.sleep(_GATEWAY_BACKOFF_SECONDS * (2.0**attempt))
-                    continue
-
-            if status >= 400:
-                try:
-                    detail: Any = response.json()
-                except ValueError:
-                    detail = response.text
-                return BatchChunk(
-                    index=index,
-                    offset=offset,
-                    count=count,
-                    http_status=status,
-                    failed_count=count,
-                    error_message=str(detail),
-                )
-
-            try:
-                body: Any = response.json()
-            except ValueError:
-                body = {}
-            if not isinstance(body, dict):
-                body = {}
-            results_raw = body.get('results') or []
-            general_raw = body.get('generalErrors') or []
-            return BatchChunk(
-                index=index,
-                offset=offset,
-                count=count,
-                http_status=status,
-                success_count=int(body.get('successCount', 0) or 0),
-                failed_count=int(body.get('failedCount', 0) or 0),
-                results=[r for r in results_raw if isinstance(r, dict)],
-                general_errors=[e for e in general_raw if isinstance(e, dict)],
-            )
-
-        raise RuntimeError('unreachable: retry loop always returns on the final attempt')
+        content_headers: Dict[str, str] = {}
+        body = self._encode_body(chunk, content_headers)
+        deadline = _current_deadline()
+        chunk_start = time.monotonic()
+        rate_limit_wait = 0.0
+        backoff_wait = 0.0
+        attempts = 0
+        response: Optional[Response] = None
+        try:
+            while True:
+                attempt = attempts
+                rate_limit_wait += rate_limit.wait_if_limited(deadline)
+                if deadline is not None:
+                    deadline.check(f'sending batch chunk {index}')
+                headers = {**self._get_auth_headers(), **content_headers}
+                attempts += 1
+                if concurrency is None:
+                    response = self._send(method, url, headers=headers, body=body, attempt=attempt)
+                else:
+                    epoch = concurrency.acquire()
+                    start = time.monotonic()
+                    congested = False
+                    fast = False
+                    try:
+                        response = self._send(method, url, headers=headers, body=body, attempt=attempt)
+                        congested = response.status_code == 429 or response.status_code in _RETRYABLE_GATEWAY_STATUSES
+                        fast = response.status_code < 400 and time.monotonic() - start <= concurrency.latency_target
+                    finally:
+                        concurrency.release(epoch, congested=congested, fast=fast)
+                status = response.status_code
+
+                if attempt < _MAX_REQUEST_RETRIES:
+                    if status == 429:
+                        self._emit('retry', method, url, None, attempt, status=status, sleep=rate_limit.pause_seconds)
+                        rate_limit.set_limited()
+                        continue
+                    if status in _RETRYABLE_GATEWAY_STATUSES:
+                        delay = _GATEWAY_BACKOFF_SECONDS * (2.0**attempt)
+                        if deadline is not None:
+                            deadline.check(f'retrying HTTP {status} in {delay:g} s', delay)
+                        self._emit('retry', method, url, None, attempt, status=status, sleep=delay)
+                        time.sleep(delay)
+                        backoff_wait += delay
+                        continue
+                elif status == 429 or status in _RETRYABLE_GATEWAY_STATUSES:
+                    self._emit('give_up', method, url, None, attempt, status=status)
+
+                chunk_result = _parse_chunk_response(index, offset, count, response, self.codec)
+                break
+        except (requests.Timeout, DeadlineExceeded) as e:
+            if isinstance(e, DeadlineExceeded) and e.__cause__ is None:  # `_send` reported timeouts
+                self._emit('give_up', method, url, None, max(0, attempts - 1), error=e)
+            chunk_result = _timed_out_chunk(index, offset, count, response, e)
+
+        chunk_result.attempts = attempts
+        chunk_result.request_bytes = len(body or b'')
+        chunk_result.elapsed = time.monotonic() - chunk_start
+        chunk_result.rate_limit_wait = rate_limit_wait
+        chunk_result.backoff_wait = backoff_wait
+        return chunk_result
 
     def _request_batched(
         self,
@@ -318,6 +1146,8 @@ class APIBase:
         chunksize: int,
         max_workers: int = 10,
         on_progress: Optional[Callable[[BatchChunk], None]] = None,
+        adaptive: bool = False,
+        latency_target: float = _ADAPTIVE_LATENCY_TARGET_SECONDS,
     ) -> BatchWriteResult:
         """Send `data` to `url` in parallel chunks, returning the stitched 207 envelope.
 
@@ -327,26 +1157,54 @@ class APIBase:
         per-record success/failure: ``BatchWriteResult.results[i]`` corresponds to
         ``data[i]`` (results are stitched back into input order across chunks).
         ``on_progress``, if given, is invoked once per completed chunk from the
-        calling thread.
-
-        Auth headers are fetched once up front and shared across workers (avoids
-        concurrent token refreshes); a batch is expected to finish well within a
-        token's lifetime.
+        calling thread. The session's connection pool is grown to `max_workers`
+        so every worker reuses a kept-alive connection.
+
+        Workers share the instance's auth header cache, so batches longer than a
+        token's lifetime refresh it once, mid-batch, without racing.
+
+        ``adaptive=True`` treats `max_workers` as a ceiling instead of a fixed
+        width: concurrency starts at `_ADAPTIVE_INITIAL_CONCURRENCY`, grows by
+        about one per window of chunks answered within `latency_target`
+        seconds, and halves on 429/502/503/504 (AIMD). The limit over time is
+        reported in ``BatchWriteResult.concurrency``.
+
+        Timings for tuning `chunksize` / `max_workers` come back on the result:
+        per chunk (`BatchChunk.elapsed`, `attempts`, `request_bytes`,
+        `rate_limit_wait`, `backoff_wait`) and for the batch (`elapsed`,
+        `records_per_second`, `bytes_per_second`, `rate_limit_pause`).
+
+        Under a `deadline()` the batch returns by the deadline (give or take
+        one response in flight) instead of raising: chunks that time out or run
+        out of budget -- including those never started -- are `timed_out`
+        whole-chunk failures, listed in ``BatchWriteResult.timed_out_chunks``.
         """
-        chunk_specs: List[Tuple[int, int, ItemList]] = []
-        offset = 0
-        for index, chunk in enumerate(chunked(data, chunksize)):
-            chunk_list: ItemList = list(chunk)
-            chunk_specs.append((index, offset, chunk_list))
-            offset += len(chunk_list)
+        chunk_specs = _split_chunks(data, chunksize)
 
-        headers = self.auth.get_auth_headers()
+        self._ensure_pool_size(max_workers)
         rate_limit = _RateLimitState(pause_seconds=_RATE_LIMIT_DEFAULT_PAUSE_SECONDS)
+        concurrency: Optional[_AdaptiveConcurrency] = None
+        if adaptive:
+            concurrency = _AdaptiveConcurrency(
+                ceiling=max_workers, latency_target=latency_target, limit=_ADAPTIVE_INITIAL_CONCURRENCY
+            )
         completed: List[BatchChunk] = []
 
+        start = time.monotonic()
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # each chunk runs in a copy of the caller's context (and its `deadline()`)
             futures = [
-                executor.submit(self._send_one_chunk, method, url, headers, index, off, chunk_list, rate_limit)
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._send_one_chunk,
+                    method,
+                    url,
+                    index,
+                    off,
+                    chunk_list,
+                    rate_limit,
+                    concurrency,
+                )
                 for index, off, chunk_list in chunk_specs
             ]
             for future in as_completed(futures):
@@ -355,25 +1213,8 @@ class APIBase:
                 if on_progress is not None:
                     on_progress(chunk_result)
 
-        completed.sort(key=lambda c: c.index)
-
-        results: ItemList = []
-        general_errors: ItemList = []
-        success_count = 0
-        failed_count = 0
-        for chunk_result in completed:
-            results.extend(chunk_result.results)
-            general_errors.extend(chunk_result.general_errors)
-            success_count += chunk_result.success_count
-            failed_count += chunk_result.failed_count
-
-        return BatchWriteResult(
-            success_count=success_count,
-            failed_count=failed_count,
-            results=results,
-            general_errors=general_errors,
-            chunks=completed,
-        )
+        timeline = concurrency.timeline if concurrency is not None else [(0.0, max_workers)]
+        return _stitch_batch(completed, timeline, time.monotonic() - start, rate_limit.paused)
 
     def _get_responses_iterator(
         self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
@@ -392,23 +1233,144 @@ class APIBase:
         return list(self._request_items_pages('get', url, params))
 
     def _get_items_iterator(
-        self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+        self,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        *,
+        page_concurrency: int = 1,
+        prefetch: int = 0,
     ) -> Iterator[ItemList]:
         """
         Generic method for dispatching GET requests for the given `url`
         strictly returning a generator of JSON of type: list of objects
+
+        `page_concurrency` > 1 fetches skip/take routes as that many concurrent
+        skip windows (see `_request_item_pages_windowed`); pages still arrive
+        in order, and cursor-paginated routes stay sequential. Otherwise
+        `prefetch` > 0 fetches up to that many pages ahead on a background
+        thread while the caller processes the current one (see
+        `_request_items_pages_prefetched`).
+
+        With a `response_cache`, a fresh entry for `url` and `params` answers
+        the call without a request, and an expired one with validators is
+        revalidated page by page (see `_revalidate_pages`); otherwise the pages
+        are stored once the last one has been read.
         """
-        for response in self._request_items_pages('get', url, params):
-            yield self._extract_json(response)
+        cache = self.response_cache
+        if cache is None or cache.ttl_for(url) <= 0:
+            for _, items in self._get_pages(url, params, page_concurrency, prefetch):
+                yield items
+            return
+
+        key = _cache_key(url, params)
+        cached, fresh, generation = cache._lookup(key)
+        if cached is not None and fresh:
+            for page in cached:
+                yield self._decode_items(page.body)
+            return
+        if cached is not None:
+            pages = self._revalidate_pages(cached)
+        else:
+            pages = (
+                (_cached_page(r.url, r.content, r.headers), items)
+                for r, items in self._get_pages(url, params, page_concurrency, prefetch)
+            )
+        fetched: List[_CachedPage] = []
+        for page, items in pages:
+            fetched.append(page)
+            yield items
+        if cached is not None:
+            # a 304 reuses the stored body object, so unchanged pages keep theirs
+            unchanged = len(fetched) == len(cached) and all(f.body is c.body for f, c in zip(fetched, cached))
+            cache._revalidated(unchanged)
+        cache._store_pages(key, url, fetched, generation)
+
+    def _revalidate_pages(self, cached: Sequence[_CachedPage]) -> Iterator[Tuple[_CachedPage, ItemList]]:
+        """
+        Re-request each of a call's `cached` pages conditionally, yielding each
+        page (its refreshed validators included) and its items
 
-    def _get_items(self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None) -> ItemList:
+        A 304 Not Modified reuses the stored body. The first page that comes
+        back changed is read in full, and the call's remaining pages are then
+        fetched by following its `Link` header, like any other read.
+        """
+        for page in cached:
+            response = self._request_with_retry('get', page.url, headers=page.validators)
+            if response.status_code == 304:
+                headers = response.headers
+                etag = headers.get('ETag', page.etag)
+                last_modified = headers.get('Last-Modified', page.last_modified)
+                yield _CachedPage(page.url, page.body, etag, last_modified), self._decode_items(page.body)
+                continue
+
+            try:
+                response.raise_for_status()
+            except Exception as e:
+                print(f'\nException occured during request:\nURL: {page.url}\n')
+                raise e
+            responses: Iterator[Response] = iter([response])
+            next_page_url = get_next_page_url(response.headers)
+            if next_page_url is not None:
+                responses = chain(responses, self._request_items_pages('get', next_page_url))
+            for response in responses:
+                yield _cached_page(response.url, response.content, response.headers), self._extract_json(response)
+            return
+
+    def _get_pages(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]],
+        page_concurrency: int,
+        prefetch: int,
+    ) -> Iterator[Tuple[Response, ItemList]]:
+        """Yield each page's response and items, by the mode `_get_items_iterator` selects."""
+        if page_concurrency > 1 and params is not None:
+            yield from self._request_item_pages_windowed(url, params, page_concurrency)
+            return
+
+        if prefetch > 0:
+            responses = self._request_items_pages_prefetched('get', url, params, prefetch)
+        else:
+            responses = self._request_items_pages('get', url, params)
+        for response in responses:
+            yield response, self._extract_json(response)
+
+    def _get_items_streamed(
+        self, url: str, params: Optional[Mapping[str, Union[str, int, float]]] = None
+    ) -> Iterator[Item]:
+        """
+        Generic method for dispatching GET requests for the given `url`
+        yielding one JSON object at a time, across every page
+
+        The streaming item mode of `_get_items_iterator`: each page's body is
+        read off the socket in `_STREAM_CHUNK_BYTES` steps and its top-level
+        array decoded incrementally (see `_stream._iter_json_array`), so peak
+        memory is one record plus one read, not one 20,000-record page.
+        Records arrive in API order. Abandoning the iterator closes the page
+        being read.
+        """
+        for response in self._request_items_pages('get', url, params, stream=True):
+            try:
+                yield from _iter_json_array(response.iter_content(_STREAM_CHUNK_BYTES))
+            finally:
+                response.close()
+
+    def _get_items(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, float]]] = None,
+        *,
+        page_concurrency: int = 1,
+    ) -> ItemList:
         """
         Generic method for dispatching GET requests for the given `url`
         strictly returning JSON of type: list of objects
+
+        `page_concurrency` is as for `_get_items_iterator`.
         """
         items: ItemList = []
-        for response in self._request_items_pages('get', url, params):
-            items.extend(self._extract_json(response))
+        for page in self._get_items_iterator(url, params, page_concurrency=page_concurrency):
+            items.extend(page)
 
         return items
 
@@ -1,6 +1,14 @@
+"""Credential paths, the user's API configuration, and the bundled assets.
+
+`REFERENCE_WELLHEADER`, `ECON_MODELS` and `cfg` are read from disk on first
+access, not at import, so importing the package neither touches the filesystem
+nor needs credentials -- only constructing a client with them reads
+`CC_API_CONFIG_JSON`.
+"""
+
 import json
 from pathlib import Path
-from typing import List, Dict, NamedTuple, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, NamedTuple, Optional, TypedDict, Union
 from typing_extensions import Self
 
 
@@ -10,10 +18,6 @@ PACKAGE_ROOT = Path(__file__).parent.resolve()
 COMBOCURVE_JSON = USER_HOME / '.combocurve' / 'combocurve.json'
 CC_API_CONFIG_JSON = USER_HOME / '.combocurve' / 'cc-api.config.json'
 
-REFERENCE_WELLHEADER: Dict[str, Union[str, int, float, bool]] = json.loads(
-    (PACKAGE_ROOT / 'assets' / 'wellHeader.json').read_text()
-)
-
 
 class EconModelEntry(TypedDict):
     """Shape of each entry in `assets/econModels.json`."""
@@ -26,9 +30,6 @@ class EconModelEntry(TypedDict):
     assignable: bool
 
 
-ECON_MODELS: List[EconModelEntry] = json.loads((PACKAGE_ROOT / 'assets' / 'econModels.json').read_text())
-
-
 class Configuration(NamedTuple):
     apikey: str
 
@@ -47,5 +48,28 @@ class Configuration(NamedTuple):
         )
 
 
-# default to the configuration file bundled with the package
-cfg = Configuration.from_file(CC_API_CONFIG_JSON)
+if TYPE_CHECKING:
+    REFERENCE_WELLHEADER: Dict[str, Union[str, int, float, bool]]
+    ECON_MODELS: List[EconModelEntry]
+    cfg: Configuration  # default to the user's configuration file
+
+
+def _read_asset(name: str) -> Any:
+    return json.loads((PACKAGE_ROOT / 'assets' / name).read_text())
+
+
+_LAZY: Dict[str, Callable[[], Any]] = {
+    'REFERENCE_WELLHEADER': lambda: _read_asset('wellHeader.json'),
+    'ECON_MODELS': lambda: _read_asset('econModels.json'),
+    'cfg': lambda: Configuration.from_file(CC_API_CONFIG_JSON),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load a lazy module attribute on first access and keep it as a plain global."""
+    try:
+        load = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = globals()[name] = load()
+    return value
@@ -1,7 +1,5 @@
 from typing import Dict, Optional
 
-import requests
-
 from .base import APIBase, Item, ItemList
 
 
@@ -183,10 +181,10 @@ class Directional(APIBase):
         """
         # The endpoint receives a single object body, not a list, so
         # `self._post_items` (which chunks a list) does not apply.
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_directional_surveys_url()
 
-        response = requests.post(url, headers=headers, json=data)
+        response = self._send('post', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
@@ -275,10 +273,10 @@ class Directional(APIBase):
         }
         """
         # The endpoint receives a single object body, not a list.
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_directional_survey_by_id_url(directional_survey_id)
 
-        response = requests.put(url, headers=headers, json=data)
+        response = self._send('put', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
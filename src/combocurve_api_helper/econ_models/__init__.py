@@ -1,34 +1,80 @@
-from .base import Context, EconModelMapper
-from .actual_or_forecast import ActualOrForecastMapper
-from .capex import CapexMapper
-from .date_settings import DateSettingsMapper
-from .differentials import DifferentialsMapper
-from .expenses import ExpensesMapper
-from .ownership_reversion import OwnershipReversionMapper
-from .pricing import PricingMapper
-from .production_taxes import ProductionTaxesMapper
-from .reserves_category import ReservesCategoryMapper
-from .risking import RiskingMapper
-from .stream_properties import StreamPropertiesMapper
-from .registry import MAPPERS, get_mapper
-from . import _csv_generated
-from ._csv_generated import *  # noqa: F401,F403 -- per-type CSV convenience functions
-
-__all__ = [
-    'Context',
-    'EconModelMapper',
-    'MAPPERS',
-    'get_mapper',
-    'StreamPropertiesMapper',
-    'DifferentialsMapper',
-    'ProductionTaxesMapper',
-    'ExpensesMapper',
-    'CapexMapper',
-    'ReservesCategoryMapper',
-    'PricingMapper',
-    'DateSettingsMapper',
-    'OwnershipReversionMapper',
-    'ActualOrForecastMapper',
-    'RiskingMapper',
-    *_csv_generated.__all__,
-]
+"""Econ-model CSV mappers.
+
+The mappers and their pydantic models are imported on first access (PEP 562):
+``import combocurve_api_helper.econ_models`` loads nothing until a name such
+as `get_mapper`, `ExpensesMapper` or `expenses_to_csv` is used.
+"""
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    # Explicit re-export (`as`) so downstream `mypy --strict` sees these names as exported.
+    from .base import Context as Context
+    from .base import EconModelMapper as EconModelMapper
+    from .actual_or_forecast import ActualOrForecastMapper as ActualOrForecastMapper
+    from .capex import CapexMapper as CapexMapper
+    from .date_settings import DateSettingsMapper as DateSettingsMapper
+    from .differentials import DifferentialsMapper as DifferentialsMapper
+    from .expenses import ExpensesMapper as ExpensesMapper
+    from .ownership_reversion import OwnershipReversionMapper as OwnershipReversionMapper
+    from .pricing import PricingMapper as PricingMapper
+    from .production_taxes import ProductionTaxesMapper as ProductionTaxesMapper
+    from .reserves_category import ReservesCategoryMapper as ReservesCategoryMapper
+    from .risking import RiskingMapper as RiskingMapper
+    from .stream_properties import StreamPropertiesMapper as StreamPropertiesMapper
+    from .registry import MAPPERS as MAPPERS
+    from .registry import get_mapper as get_mapper
+    from .profiling import MapperProfile as MapperProfile
+    from .profiling import StageStats as StageStats
+    from .profiling import profile as profile
+    from ._csv_generated import *  # noqa: F401,F403 -- per-type CSV convenience functions
+
+# `__all__` (every name below plus the generated functions) is built on first
+# access by `__getattr__`, as listing the generated functions imports them.
+
+# public name -> the submodule defining it; every other name in `__all__` is a
+# generated per-type CSV function from `_csv_generated`
+_LAZY: Dict[str, str] = {
+    'Context': '.base',
+    'EconModelMapper': '.base',
+    'MAPPERS': '.registry',
+    'get_mapper': '.registry',
+    'profile': '.profiling',
+    'MapperProfile': '.profiling',
+    'StageStats': '.profiling',
+    'ActualOrForecastMapper': '.actual_or_forecast',
+    'CapexMapper': '.capex',
+    'DateSettingsMapper': '.date_settings',
+    'DifferentialsMapper': '.differentials',
+    'ExpensesMapper': '.expenses',
+    'OwnershipReversionMapper': '.ownership_reversion',
+    'PricingMapper': '.pricing',
+    'ProductionTaxesMapper': '.production_taxes',
+    'ReservesCategoryMapper': '.reserves_category',
+    'RiskingMapper': '.risking',
+    'StreamPropertiesMapper': '.stream_properties',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    elif (name.startswith('__') and name != '__all__') or importlib.util.find_spec(f'.{name}', __name__):
+        # a dunder probe, or a submodule (`from . import formats`) for the import system to load
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        generated = importlib.import_module('._csv_generated', __name__)
+        if name == '__all__':
+            value = [*_LAZY, *generated.__all__]
+        elif name in generated.__all__:
+            value = getattr(generated, name)
+        else:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__getattr__('__all__')})
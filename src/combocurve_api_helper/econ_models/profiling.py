@@ -0,0 +1,207 @@
+"""Opt-in profiling of the econ-model mappers' hot paths.
+
+Inside ``with profile() as prof:`` every mapper call is timed and counted per
+mapper (`econ_model_type`) and stage:
+
+- ``forward``: `to_row_dicts` (API dict -> CSV rows);
+- ``inverse``: `from_row_dicts` (CSV rows -> API dict);
+- ``validation``: pydantic construction, `model_validate` and `model_dump` of the
+  mappers' row/leaf models;
+- ``formatting``: the `formats` helpers (`_parse_iso`, `_float_str`, `num_to_csv`,
+  date and enum conversions, ...);
+- ``csv_io``: `to_csv` / `from_csv` / `read_csv` / `write_csv` -- the csv module,
+  file I/O and row grouping, net of the nested stages.
+
+Each stage reports inclusive `seconds` and exclusive `self_seconds` (time not
+spent in a nested profiled call), so the self times add up to the time spent in
+the mappers and show where it goes::
+
+    with profile() as prof:
+        ExpensesMapper().to_csv(models)
+    print(prof.report())
+
+The instrumentation is installed by wrapping those functions on entry and
+removed on exit, so outside a `profile()` block the mappers run their original,
+unwrapped code. The wrapping is process-wide: calls from every thread are
+counted while a block is active, and only one block may be active at a time.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from . import formats, registry  # noqa: F401 -- `registry` imports every mapper module
+from .base import EconModelMapper
+
+_STAGES = ('forward', 'inverse', 'validation', 'formatting', 'csv_io')
+_CSV_IO_METHODS = ('to_csv', 'from_csv', 'read_csv', 'write_csv')
+_NO_MAPPER = '-'  # calls made outside any mapper method
+_PACKAGE = __name__.rpartition('.')[0]
+
+
+@dataclass
+class StageStats:
+    """Calls and time of one (mapper, stage)."""
+
+    calls: int = 0
+    seconds: float = 0.0  # inclusive of nested profiled calls
+    self_seconds: float = 0.0  # exclusive: `seconds` minus nested profiled calls
+
+
+class MapperProfile:
+    """Per-mapper, per-stage timings collected by `profile()`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats: Dict[Tuple[str, str], StageStats] = {}
+
+    def stats(self) -> Dict[Tuple[str, str], StageStats]:
+        """Return a copy of the stats, keyed by ``(econ_model_type, stage)``."""
+        with self._lock:
+            return {key: StageStats(s.calls, s.seconds, s.self_seconds) for key, s in self._stats.items()}
+
+    def by_stage(self) -> Dict[str, StageStats]:
+        """Return the stats summed over mappers, keyed by stage."""
+        totals = {stage: StageStats() for stage in _STAGES}
+        for (_, stage), s in self.stats().items():
+            total = totals[stage]
+            total.calls += s.calls
+            total.seconds += s.seconds
+            total.self_seconds += s.self_seconds
+        return totals
+
+    def report(self) -> str:
+        """Render the stats as a text table, largest self time first."""
+        stats = sorted(self.stats().items(), key=lambda item: item[1].self_seconds, reverse=True)
+        total = sum(s.self_seconds for _, s in stats) or 1.0
+        lines = [f'{"mapper":<20} {"stage":<11} {"calls":>9} {"seconds":>10} {"self":>10} {"self %":>7}']
+        for (mapper, stage), s in stats:
+            lines.append(
+                f'{mapper:<20} {stage:<11} {s.calls:>9} {s.seconds:>10.4f} {s.self_seconds:>10.4f}'
+                f' {100 * s.self_seconds / total:>6.1f}%'
+            )
+        return '\n'.join(lines)
+
+    def _stack(self) -> List[List[Any]]:
+        stack: Optional[List[List[Any]]] = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _timed(self, stage: str, fn: Callable[..., Any], is_mapper_method: bool = False) -> Callable[..., Any]:
+        """Wrap `fn` to record its calls under `stage`, attributed to the calling mapper."""
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            stack = self._stack()
+            if is_mapper_method:
+                mapper = args[0].econ_model_type
+            else:
+                mapper = stack[-1][0] if stack else _NO_MAPPER
+            frame = [mapper, 0.0]  # [mapper, seconds in nested profiled calls]
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                with self._lock:
+                    s = self._stats.get((mapper, stage))
+                    if s is None:
+                        s = self._stats[(mapper, stage)] = StageStats()
+                    s.calls += 1
+                    s.seconds += elapsed
+                    s.self_seconds += elapsed - frame[1]
+
+        return wrapper
+
+
+_active_lock = threading.Lock()
+_active: Optional[MapperProfile] = None
+
+
+def _package_modules() -> List[ModuleType]:
+    return [m for name, m in sorted(sys.modules.items()) if name.startswith(_PACKAGE + '.') and m is not None]
+
+
+def _patches(prof: MapperProfile) -> List[Tuple[Any, str, Any]]:
+    """Return ``(owner, attribute, wrapper)`` for every function `prof` instruments."""
+    modules = _package_modules()
+    patches: List[Tuple[Any, str, Any]] = []
+
+    # formatting helpers: rebind them in `formats` and wherever a module imported them by name
+    helpers = {
+        fn: prof._timed('formatting', fn)
+        for _, fn in inspect.getmembers(formats, inspect.isfunction)
+        if fn.__module__ == formats.__name__
+    }
+    for module in modules:
+        for name, value in vars(module).items():
+            if inspect.isfunction(value) and value in helpers:
+                patches.append((module, name, helpers[value]))
+
+    for name in _CSV_IO_METHODS:
+        patches.append((EconModelMapper, name, prof._timed('csv_io', getattr(EconModelMapper, name), True)))
+    mapper_classes = {
+        cls
+        for module in modules
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, EconModelMapper) and cls is not EconModelMapper
+    }
+    for cls in mapper_classes:
+        for name, stage in (('to_row_dicts', 'forward'), ('from_row_dicts', 'inverse')):
+            if name in vars(cls):
+                patches.append((cls, name, prof._timed(stage, vars(cls)[name], True)))
+
+    # pydantic models: originals are resolved before anything is patched, so a
+    # model subclassing another profiled model is not counted twice
+    model_classes: Set[Type[BaseModel]] = {
+        model
+        for module in modules
+        for _, model in inspect.getmembers(module, inspect.isclass)
+        if issubclass(model, BaseModel) and model.__module__.startswith(_PACKAGE + '.')
+    }
+    for model in model_classes:
+        patches.append((model, '__init__', prof._timed('validation', model.__init__)))
+        patches.append((model, 'model_dump', prof._timed('validation', model.model_dump)))
+        validate = model.model_validate.__func__  # type: ignore[attr-defined]
+        patches.append((model, 'model_validate', classmethod(prof._timed('validation', validate))))
+    return patches
+
+
+@contextmanager
+def profile() -> Iterator[MapperProfile]:
+    """Profile every econ-model mapper call made inside the ``with`` block (see the module docstring)."""
+    global _active
+    with _active_lock:
+        if _active is not None:
+            raise RuntimeError('an econ-model profile() block is already active')
+        prof = _active = MapperProfile()
+    originals: List[Tuple[Any, str, bool, Any]] = []  # (owner, attribute, owned, original)
+    try:
+        for owner, name, wrapper in _patches(prof):
+            originals.append((owner, name, name in vars(owner), vars(owner).get(name)))
+            setattr(owner, name, wrapper)
+        yield prof
+    finally:
+        for owner, name, owned, original in reversed(originals):
+            if owned:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        with _active_lock:
+            _active = None
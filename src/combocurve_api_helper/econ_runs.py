@@ -1,16 +1,23 @@
+import contextvars
 import requests
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from combocurve_api_v1.pagination import get_next_page_url
 
-from typing import List, Dict, Optional, Union, Any, Iterator, Mapping, cast
+from typing import List, Dict, Optional, Tuple, Union, Any, Iterator, Mapping, Callable, cast
 
-from .base import APIBase, Item, ItemList
+from .base import APIBase, Item, ItemList, JsonValue
 
 
 GET_LIMIT = 200
 GET_LIMIT_MONTHLY_EXPORTS = 100
 CONCURRENCY_MONTHLY_EXPORTS = 10
+CONCURRENCY_COMBO_NAMES = 8
+
+# Econ runs in these states are finished, so their combo names can no longer change.
+_COMPLETED_STATUSES = frozenset({'complete', 'completed'})
 
 
 def flatten_outputs(result: Item) -> Optional[Item]:
@@ -32,6 +39,30 @@ def flatten_outputs(result: Item) -> Optional[Item]:
     return {**result, **out}
 
 
+class _LazyComboNamesRun(Dict[str, JsonValue]):
+    """
+    An econ run whose `comboNames` are fetched on first access, by
+    ``run['comboNames']`` or ``run.get('comboNames')``, and then kept. Until
+    then the key is absent: ``'comboNames' in run`` is False, and iterating
+    or serializing the run does not fetch it.
+    """
+
+    def __init__(self, run: Item, fetch: Callable[[], List[str]]) -> None:
+        super().__init__(run)
+        self._fetch = fetch
+
+    def __missing__(self, key: str) -> JsonValue:
+        if key != 'comboNames':
+            raise KeyError(key)
+        combo_names = self[key] = cast(List[JsonValue], self._fetch())
+        return combo_names
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == 'comboNames':
+            return self[key]
+        return super().get(key, default)
+
+
 class EconRuns(APIBase):
     ######
     # URLs
@@ -114,18 +145,22 @@ class EconRuns(APIBase):
     # API calls
     ###########
 
-    def get_econ_runs(self, project_id: str, scenario_id: str, add_combo_names: bool = True) -> ItemList:
+    def get_econ_runs(
+        self, project_id: str, scenario_id: str, add_combo_names: bool = True, *, lazy_combo_names: bool = False
+    ) -> ItemList:
         """
         Returns a list of econ runs for a specific project id and scenario id.
 
-        `add_combo_names` will add the list of combo names to each econ run.
+        `add_combo_names` will add the list of combo names to each econ run,
+        fetched concurrently; `lazy_combo_names` defers each run's fetch until
+        its `comboNames` is first accessed (see `update_econ_run_combo_names`).
         """
         url = self.get_econ_runs_url(project_id, scenario_id)
         params = {'take': GET_LIMIT}
         econruns = self._get_items(url, params)
 
         if add_combo_names:
-            self.update_econ_run_combo_names(econruns, project_id, scenario_id)
+            self.update_econ_run_combo_names(econruns, project_id, scenario_id, lazy=lazy_combo_names)
 
         order = {
             'id': 2,
@@ -135,18 +170,25 @@ class EconRuns(APIBase):
         return self._keysort(econruns, order, reverse=True)
 
     def get_econ_run_by_id(
-        self, project_id: str, scenario_id: str, econ_run_id: str, add_combo_names: bool = True
+        self,
+        project_id: str,
+        scenario_id: str,
+        econ_run_id: str,
+        add_combo_names: bool = True,
+        *,
+        lazy_combo_names: bool = False,
     ) -> Item:
         """
         Returns a specific econ run from its econ run id.
 
-        `add_combo_names` will add the list of combo names to the econ run.
+        `add_combo_names` will add the list of combo names to the econ run;
+        `lazy_combo_names` defers the fetch until `comboNames` is first accessed.
         """
         url = self.get_econ_run_by_id_url(project_id, scenario_id, econ_run_id)
         econruns = self._get_items(url)
 
         if add_combo_names:
-            self.update_econ_run_combo_names(econruns, project_id, scenario_id)
+            self.update_econ_run_combo_names(econruns, project_id, scenario_id, lazy=lazy_combo_names)
 
         order = {
             'id': 2,
@@ -226,19 +268,72 @@ class EconRuns(APIBase):
 
         return self._get_items(url, params)
 
-    def update_econ_run_combo_names(self, econruns: ItemList, project_id: str, scenario_id: str) -> None:
+    def update_econ_run_combo_names(
+        self,
+        econruns: ItemList,
+        project_id: str,
+        scenario_id: str,
+        *,
+        max_workers: int = CONCURRENCY_COMBO_NAMES,
+        lazy: bool = False,
+    ) -> None:
         """
         Add combo names to the econ run data.
+
+        The combo names of up to `max_workers` runs are requested at once.
+        Those of completed runs cannot change, so they are remembered by this
+        instance and not requested again. With `lazy`, each run is replaced by
+        a dict that requests its combo names only when `comboNames` is first
+        accessed.
         """
+        pending: List[int] = []
         for i, run in enumerate(econruns):
-            econ_run_id = str(run['id'])
-            combo_names = self.get_econ_run_combo_names(project_id, scenario_id, econ_run_id)
-            run['comboNames'] = combo_names
-            # _ = run.pop('outputParams')
-            econruns[i] = run
+            memoized = self._combo_names_memo.get((project_id, scenario_id, str(run['id'])))
+            if memoized is not None:
+                run['comboNames'] = list(memoized)
+            else:
+                pending.append(i)
+
+        if lazy:
+            for i in pending:
+                run = econruns[i]
+                fetch = partial(self._get_memoized_combo_names, project_id, scenario_id, run)
+                econruns[i] = _LazyComboNamesRun(run, fetch)
+            return
+
+        if len(pending) <= 1 or max_workers <= 1:
+            for i in pending:
+                econruns[i]['comboNames'] = self._get_memoized_combo_names(project_id, scenario_id, econruns[i])
+            return
+
+        self._ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            # each request runs in a copy of the caller's context (and its `deadline()`)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._get_memoized_combo_names, project_id, scenario_id, econruns[i]
+                )
+                for i in pending
+            ]
+            for i, future in zip(pending, futures):
+                econruns[i]['comboNames'] = future.result()
 
         return
 
+    @property
+    def _combo_names_memo(self) -> Dict[Tuple[str, str, str], Tuple[str, ...]]:
+        """Combo names of completed econ runs, by (project id, scenario id, econ run id); created on first use."""
+        # `dict.setdefault` is atomic, so concurrent first uses share one memo
+        return self.__dict__.setdefault('_econ_run_combo_names', {})
+
+    def _get_memoized_combo_names(self, project_id: str, scenario_id: str, run: Item) -> List[str]:
+        """Request the combo names of `run`, remembering them when the run is completed."""
+        econ_run_id = str(run['id'])
+        combo_names = self.get_econ_run_combo_names(project_id, scenario_id, econ_run_id)
+        if str(run.get('status', '')).casefold() in _COMPLETED_STATUSES:
+            self._combo_names_memo[(project_id, scenario_id, econ_run_id)] = tuple(combo_names)
+        return combo_names
+
     def post_econ_run_monthly_export(self, project_id: str, scenario_id: str, econ_run_id: str) -> str:
         """
         Create a monthly export for a specific project id, scenario id,
@@ -272,13 +367,17 @@ class EconRuns(APIBase):
         return results_flat
 
     def get_stream_econ_run_monthly_export(
-        self, project_id: str, scenario_id: str, econ_run_id: str, monthly_export_id: str
+        self, project_id: str, scenario_id: str, econ_run_id: str, monthly_export_id: str, *, prefetch: int = 1
     ) -> Iterator[ItemList]:
         """
         Similar to `get_econ_run_monthly_export` but instead streams the data
         yielding chunks of 100 items at a time, where each item is a list of
         monthly exports for a specific project id, scenario id, econ run id,
         and monthly export id.
+
+        The next page is fetched in the background while the current one is
+        flattened and consumed; `prefetch` bounds how many pages run ahead
+        (0 disables the look-ahead).
         """
         url = self.get_econ_run_monthly_export_url(project_id, scenario_id, econ_run_id, monthly_export_id)
 
@@ -286,7 +385,7 @@ class EconRuns(APIBase):
             'take': GET_LIMIT_MONTHLY_EXPORTS,
             'concurrency': CONCURRENCY_MONTHLY_EXPORTS,
         }
-        iter_items = self._get_items_iterator(url, params)
+        iter_items = self._get_items_iterator(url, params, prefetch=prefetch)
 
         for items in iter_items:
             for item in items:
@@ -1,5 +1,3 @@
-import requests
-
 from .base import APIBase, Item
 
 
@@ -41,10 +39,10 @@ class Exports(APIBase):
         Submits a v2 async export of `kind` (single-object body) and returns the
         job carrying its job id; poll `_get_v2_export` for status/results.
         """
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_v2_export_url(kind)
 
-        response = requests.post(url, headers=headers, json=data)
+        response = self._send('post', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
@@ -53,10 +51,10 @@ class Exports(APIBase):
         """
         Returns the status/result of a v2 async export job of `kind` from its job id.
         """
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_v2_export_by_job_id_url(kind, job_id)
 
-        response = requests.get(url, headers=headers)
+        response = self._send('get', url, headers=headers)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
@@ -135,10 +133,10 @@ class Exports(APIBase):
             ]
         }
         """
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_exports_url()
 
-        response = requests.post(url, headers=headers, json=data)
+        response = self._send('post', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
@@ -0,0 +1,546 @@
+"""Local stand-in for the ComboCurve REST API, for deterministic offline load tests.
+
+`FakeComboCurve` serves in-memory collections over HTTP/1.1 keep-alive on
+localhost with the semantics the client relies on:
+
+- GET pages by ``take``/``skip`` with a ``Link: <...>;rel="next"`` header, or --
+  for cursor routes -- by an opaque ``cursor`` that ignores ``skip``;
+- POST/PUT/PATCH/DELETE answer with the 207 Multi-Status write envelope
+  (``successCount`` / ``failedCount`` / per-record ``results`` / ``generalErrors``),
+  optionally rejecting individual records; gzip request bodies are accepted;
+- GET pages carry ``ETag`` and ``Last-Modified`` validators and answer
+  ``If-None-Match`` / ``If-Modified-Since`` with 304 Not Modified;
+- GET range filters ``field[gt|ge|lt|le]=value`` (e.g. ``updatedAt[ge]=...``),
+  compared as strings; records without the field are filtered out;
+- 429 with ``Retry-After`` from a request quota or injected faults, and 502/503/504
+  injected on demand (a FIFO per route) or at a seeded random rate;
+- per-route latency and payload size.
+
+Point a client at it by overriding the base URLs; `client()` builds one that
+skips credential loading::
+
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=10_000)
+        server.configure_route('/v1/wells', latency=0.02, failure_rate=0.01)
+        api = server.client()
+        wells = api._get_items(f'{api.API_BASE_URL}/wells', {'take': 200})
+
+Route patterns are URL paths in which ``*`` matches one path segment and ``**``
+any number, e.g. ``/v1/projects/*/forecasts/*/parameters``; all paths matching one collection
+pattern share its records. Also runnable standalone (e.g. to load-test from
+another process or machine)::
+
+    python -m combocurve_api_helper.fake_server --port 8080 --collection /v1/wells=10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, overload
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .base import APIBase, Item, ItemList
+
+_DEFAULT_TAKE = 25
+_DEFAULT_MAX_TAKE = 200
+_GATEWAY_STATUSES = (502, 503, 504)
+
+RecordFactory = Callable[[int], Item]
+RecordValidator = Callable[[Item], Optional[str]]
+_API = TypeVar('_API', bound=APIBase)
+
+
+def _default_record_factory(record_bytes: int) -> RecordFactory:
+    """Return a factory of well-header-like records padded to about `record_bytes` encoded bytes."""
+
+    def make(i: int) -> Item:
+        record: Item = {
+            'id': f'{i:024x}',
+            'chosenID': f'{42000000000000 + i}',
+            'wellName': f'WELL {i}',
+            'dataSource': 'other',
+            'createdAt': '2024-01-01T00:00:00.000Z',
+        }
+        padding = record_bytes - len(json.dumps(record))
+        if padding > 12:
+            record['notes'] = 'x' * (padding - 12)
+        return record
+
+    return make
+
+
+def _pattern_regex(pattern: str) -> re.Pattern[str]:
+    parts = {'*': '[^/]+', '**': '.*'}
+    return re.compile('/'.join(parts.get(part) or re.escape(part) for part in pattern.split('/')) + '/?')
+
+
+@dataclass
+class _Collection:
+    records: ItemList
+    cursor: bool
+    max_take: int
+    validate: Optional[RecordValidator]
+    # (skip, take, range filters) -> (encoded page, its ETag); cleared on writes
+    pages: Dict[Tuple[int, int, str], Tuple[bytes, str]] = field(default_factory=dict)
+    # `Last-Modified` epoch seconds: whole seconds, bumped by at least one per write so
+    # `If-Modified-Since` never misses a write made within the second of a read
+    modified: int = field(default_factory=lambda: int(time.time()))
+
+
+@dataclass
+class _RouteBehavior:
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    failure_statuses: Tuple[int, ...] = _GATEWAY_STATUSES
+    faults: Deque[Tuple[int, Optional[float]]] = field(default_factory=deque)  # (status, retry_after)
+
+
+class _Quota:
+    """Token bucket deciding when the fake answers 429."""
+
+    def __init__(self, rate: float, burst: float, retry_after: Optional[float]) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.retry_after = retry_after
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> Optional[float]:
+        """Take a token; return None, or the Retry-After seconds when the quota is exhausted."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return self.retry_after if self.retry_after is not None else (1 - self.tokens) / self.rate
+
+
+@overload
+def client_for(base_url: str) -> APIBase: ...
+
+
+@overload
+def client_for(base_url: str, api_class: Type[_API]) -> _API: ...
+
+
+def client_for(base_url: str, api_class: Type[APIBase] = APIBase) -> APIBase:
+    """Return an `api_class` instance pointed at a fake server's v1 `base_url` (e.g. one
+    started with ``python -m combocurve_api_helper.fake_server``), without credentials."""
+    api = api_class.offline()
+    api.API_BASE_URL = base_url
+    api.API_BASE_URL_V2 = base_url[: -len('/v1')] + '/v2'
+    return api
+
+
+class FakeComboCurve:
+    """In-memory ComboCurve API served on a background thread (see module docstring)."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, *, seed: int = 0) -> None:
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._collections: List[Tuple[re.Pattern[str], str, _Collection]] = []
+        self._routes: List[Tuple[re.Pattern[str], _RouteBehavior]] = []
+        self._quota: Optional[_Quota] = None
+        self.request_log: List[Tuple[str, str, int]] = []  # (method, path, status)
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host!s}:{port}/v1'
+
+    @property
+    def base_url_v2(self) -> str:
+        return self.base_url[: -len('/v1')] + '/v2'
+
+    def start(self) -> FakeComboCurve:
+        """Serve on a daemon thread; return self."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='fake-combocurve', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> FakeComboCurve:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @overload
+    def client(self) -> APIBase: ...
+
+    @overload
+    def client(self, api_class: Type[_API]) -> _API: ...
+
+    def client(self, api_class: Type[APIBase] = APIBase) -> APIBase:
+        """Return an `api_class` instance (e.g. `ComboCurveAPI`) pointed at this server, without credentials."""
+        return client_for(self.base_url, api_class)
+
+    ###############
+    # Configuration
+    ###############
+
+    def add_collection(
+        self,
+        pattern: str,
+        records: Optional[ItemList] = None,
+        *,
+        count: int = 0,
+        record_factory: Optional[RecordFactory] = None,
+        record_bytes: int = 200,
+        cursor: bool = False,
+        max_take: int = _DEFAULT_MAX_TAKE,
+        validate: Optional[RecordValidator] = None,
+    ) -> None:
+        """Serve a collection at every path matching `pattern`.
+
+        Starts with `records`, or `count` records from `record_factory`
+        (default: well-header-like records of about `record_bytes` bytes).
+        `cursor=True` pages by opaque cursor instead of `skip`. Pages larger
+        than `max_take` are refused with a 400, like the real API.
+        `validate(record)` returning a message rejects that record in writes.
+        """
+        if records is None:
+            factory = record_factory or _default_record_factory(record_bytes)
+            records = [factory(i) for i in range(count)]
+        collection = _Collection(list(records), cursor, max_take, validate)
+        with self._lock:
+            self._collections.append((_pattern_regex(pattern), pattern, collection))
+
+    def records(self, pattern: str) -> ItemList:
+        """Return (a copy of) the records currently stored in the collection registered as `pattern`."""
+        with self._lock:
+            for _, registered, collection in self._collections:
+                if registered == pattern:
+                    return list(collection.records)
+        raise KeyError(pattern)
+
+    def configure_route(
+        self,
+        pattern: str,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_statuses: Tuple[int, ...] = _GATEWAY_STATUSES,
+    ) -> None:
+        """Delay responses on paths matching `pattern` by `latency` (+ up to `jitter`) seconds,
+        and fail a seeded-random `failure_rate` of them with one of `failure_statuses`."""
+        behavior = self._behavior(pattern)
+        behavior.latency = latency
+        behavior.jitter = jitter
+        behavior.failure_rate = failure_rate
+        behavior.failure_statuses = failure_statuses
+
+    def inject(self, pattern: str, *statuses: int, retry_after: Optional[float] = None) -> None:
+        """Answer the next requests on paths matching `pattern` with `statuses`, in order.
+
+        A 429 carries ``Retry-After: retry_after`` (when given).
+        """
+        behavior = self._behavior(pattern)
+        with self._lock:
+            behavior.faults.extend((status, retry_after) for status in statuses)
+
+    def set_quota(
+        self, requests_per_second: Optional[float], burst: Optional[float] = None, retry_after: Optional[float] = None
+    ) -> None:
+        """Answer 429 (with ``Retry-After``) once requests exceed `requests_per_second` (None: no quota)."""
+        with self._lock:
+            if requests_per_second is None:
+                self._quota = None
+            else:
+                self._quota = _Quota(requests_per_second, burst or requests_per_second, retry_after)
+
+    def request_count(self, method: Optional[str] = None, status: Optional[int] = None) -> int:
+        """Count logged requests, optionally only those with `method` and/or `status`."""
+        with self._lock:
+            return sum(
+                1
+                for m, _, s in self.request_log
+                if (method is None or m == method.upper()) and (status is None or s == status)
+            )
+
+    def _behavior(self, pattern: str) -> _RouteBehavior:
+        with self._lock:
+            for regex, behavior in self._routes:
+                if regex.pattern == _pattern_regex(pattern).pattern:
+                    return behavior
+            behavior = _RouteBehavior()
+            self._routes.append((_pattern_regex(pattern), behavior))
+            return behavior
+
+    ##########
+    # Serving
+    ##########
+
+    def _handle(
+        self, method: str, raw_url: str, body: Optional[bytes], conditions: Optional[Mapping[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes, float]:
+        """Return (status, headers, body, delay seconds) for one request.
+
+        `conditions` holds the request's ``If-None-Match`` / ``If-Modified-Since`` headers.
+        """
+        parts = urlsplit(raw_url)
+        path = parts.path
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        with self._lock:
+            behavior = next((b for regex, b in self._routes if regex.fullmatch(path)), None)
+            delay = 0.0
+            fault: Optional[Tuple[int, Optional[float]]] = None
+            if behavior is not None:
+                delay = behavior.latency + (self._random.uniform(0, behavior.jitter) if behavior.jitter else 0.0)
+                if behavior.faults:
+                    fault = behavior.faults.popleft()
+                elif behavior.failure_rate and self._random.random() < behavior.failure_rate:
+                    fault = (self._random.choice(behavior.failure_statuses), None)
+            if fault is None and self._quota is not None:
+                retry_after = self._quota.take()
+                if retry_after is not None:
+                    fault = (429, retry_after)
+            collection = next((c for regex, _, c in self._collections if regex.fullmatch(path)), None)
+
+        if fault is not None:
+            status, retry_after = fault
+            headers = {'Retry-After': str(math.ceil(retry_after))} if retry_after is not None else {}
+            return status, headers, _encode({'message': f'injected {status}'}), delay
+        if collection is None:
+            return 404, {}, _encode({'message': f'no route for {path}'}), delay
+        if method == 'GET':
+            page = self._get_page(collection, parts.scheme, parts.netloc, path, query, conditions or {})
+            return (*page, delay)
+        try:
+            data = json.loads(body or b'null')
+        except ValueError:
+            return 400, {}, _encode({'message': 'request body is not valid JSON'}), delay
+        return 207, {}, _encode(self._write(collection, method, data if isinstance(data, list) else [data])), delay
+
+    def _get_page(
+        self,
+        collection: _Collection,
+        scheme: str,
+        netloc: str,
+        path: str,
+        query: Dict[str, str],
+        conditions: Mapping[str, str],
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        try:
+            take = int(query.get('take', _DEFAULT_TAKE))
+            if collection.cursor:
+                skip = int(query['cursor'], 16) if 'cursor' in query else 0
+            else:
+                skip = int(query.get('skip', 0))
+        except ValueError:
+            return 400, {}, _encode({'message': 'take, skip and cursor must be integers'})
+        if not 1 <= take <= collection.max_take:
+            return 400, {}, _encode({'message': f'take must be between 1 and {collection.max_take}'})
+
+        ranges = {name: value for name, value in sorted(query.items()) if _RANGE_FILTER.fullmatch(name)}
+        with self._lock:
+            records = collection.records
+            if ranges:
+                records = [r for r in records if all(_in_range(r, name, value) for name, value in ranges.items())]
+            total = len(records)
+            modified = collection.modified
+            key = (skip, take, urlencode(ranges))
+            cached = collection.pages.get(key)
+            if cached is None:
+                page = _encode(records[skip : skip + take])
+                # the ETag also covers the page count, so a page whose `Link` changed is not "not modified"
+                digest = hashlib.sha1(page + str(min(total, skip + take + 1)).encode()).hexdigest()
+                cached = collection.pages[key] = (page, f'"{digest[:20]}"')
+            page, etag = cached
+
+        headers: Dict[str, str] = {'ETag': etag, 'Last-Modified': formatdate(modified, usegmt=True)}
+        if skip + take < total:
+            others = {k: v for k, v in query.items() if k not in ('skip', 'take', 'cursor')}
+            position = {'cursor': f'{skip + take:x}'} if collection.cursor else {'skip': str(skip + take)}
+            next_query = urlencode({**others, **position, 'take': str(take)})
+            host = self.base_url.split('/')[2] if not netloc else netloc
+            headers['Link'] = f'<{scheme or "http"}://{host}{path}?{next_query}>;rel="next"'
+        if _not_modified(conditions, etag, modified):
+            return 304, headers, b''
+        return 200, headers, page
+
+    def _write(self, collection: _Collection, method: str, records: List[Any]) -> Dict[str, Any]:
+        results: ItemList = []
+        created = {'POST': ('Created', 201), 'DELETE': ('Deleted', 200)}.get(method, ('OK', 200))
+        with self._lock:
+            for index, record in enumerate(records):
+                message = None
+                if not isinstance(record, dict):
+                    message = 'each record must be an object'
+                elif collection.validate is not None:
+                    message = collection.validate(record)
+                if message is not None:
+                    results.append(
+                        {
+                            'status': 'Error',
+                            'code': 400,
+                            'errors': [{'name': 'ValidationError', 'message': message, 'location': f'[{index}]'}],
+                        }
+                    )
+                    continue
+                if method == 'DELETE':
+                    collection.records = [r for r in collection.records if r.get('id') != record.get('id')]
+                else:
+                    collection.records.append(record)
+                results.append({'status': created[0], 'code': created[1], 'chosenID': record.get('chosenID')})
+            collection.pages.clear()
+            collection.modified = max(int(time.time()), collection.modified + 1)
+        failed = sum(1 for r in results if r['status'] == 'Error')
+        return {
+            'generalErrors': [],
+            'results': results,
+            'failedCount': failed,
+            'successCount': len(results) - failed,
+        }
+
+    def _log(self, method: str, path: str, status: int) -> None:
+        with self._lock:
+            self.request_log.append((method, path, status))
+
+
+_RANGE_FILTER = re.compile(r'(\w+)\[(gt|ge|lt|le)\]')
+_RANGE_OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+    'gt': lambda a, b: a > b,
+    'ge': lambda a, b: a >= b,
+    'lt': lambda a, b: a < b,
+    'le': lambda a, b: a <= b,
+}
+
+
+def _in_range(record: Any, name: str, value: str) -> bool:
+    """Whether `record` passes the range filter ``name=value``, e.g. ``updatedAt[ge]=2025-01-01``."""
+    match = _RANGE_FILTER.fullmatch(name)
+    assert match is not None
+    field_value = record.get(match[1]) if isinstance(record, dict) else None
+    return field_value is not None and _RANGE_OPERATORS[match[2]](str(field_value), value)
+
+
+def _not_modified(conditions: Mapping[str, str], etag: str, modified: int) -> bool:
+    """Evaluate the request's conditional headers; `If-None-Match`, when present, decides alone."""
+    if_none_match = conditions.get('If-None-Match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        tags = [tag[2:] if tag.startswith('W/') else tag for tag in tags]  # weak comparison
+        return '*' in tags or etag in tags
+    if_modified_since = conditions.get('If-Modified-Since')
+    if if_modified_since is None:
+        return False
+    try:
+        return modified <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def _encode(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _make_handler(server: FakeComboCurve) -> Type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep connections alive, like the real API
+        disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+        def _serve(self) -> None:
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else None
+            if body and self.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            url = self.path if '://' in self.path else f'http://{self.headers.get("Host", "")}{self.path}'
+            conditions = {
+                name: self.headers[name] for name in ('If-None-Match', 'If-Modified-Since') if name in self.headers
+            }
+            status, headers, payload, delay = server._handle(self.command, url, body, conditions)
+            if delay > 0:
+                time.sleep(delay)
+            server._log(self.command, urlsplit(url).path, status)
+
+            try:
+                self.send_response(status)
+                if status != 304:  # a 304 has no body
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True  # the client gave up waiting (a timeout under test)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument(
+        '--collection',
+        action='append',
+        default=[],
+        metavar='PATTERN=COUNT',
+        help='serve COUNT generated records at PATTERN (repeatable), e.g. /v1/wells=10000',
+    )
+    parser.add_argument('--cursor', action='append', default=[], metavar='PATTERN', help='page PATTERN by cursor')
+    parser.add_argument('--max-take', type=int, default=_DEFAULT_MAX_TAKE)
+    parser.add_argument('--record-bytes', type=int, default=200, help='approximate size of generated records')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='up to this many random seconds more')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='fraction of requests answered 502/503/504')
+    parser.add_argument('--quota', type=float, default=None, help='requests/second before answering 429')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeComboCurve(args.host, args.port, seed=args.seed)
+    for spec in args.collection:
+        pattern, _, count = spec.partition('=')
+        server.add_collection(
+            pattern,
+            count=int(count or 0),
+            record_bytes=args.record_bytes,
+            cursor=pattern in args.cursor,
+            max_take=args.max_take,
+        )
+    server.configure_route('/**', latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate)
+    server.set_quota(args.quota)
+    print(f'Serving a fake ComboCurve API at {server.base_url} (Ctrl+C to stop)', flush=True)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
 import warnings
 from typing import Callable, List, Dict, Optional, Union, Any, Iterator, Mapping, cast
 
-import requests
 from more_itertools import chunked
 
 from .base import APIBase, Item, ItemList, WriteResponse
@@ -240,13 +239,13 @@ class Forecasts(APIBase):
         # NOTE: we can't use `self._post_items` since it expects the base data to be a list
         # whereas this particular endpoint receives an object
 
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_forecast_wells_url(project_id, forecast_id)
 
         items: ItemList = []
         for well_ids_chunk in chunked(well_ids, chunksize):
             data = {'wellIds': well_ids_chunk}
-            response = requests.post(url, headers=headers, json=data)
+            response = self._send('post', url, headers=headers, json_body=data)
             response.raise_for_status()
 
             items.extend(self._extract_json(response))
@@ -322,10 +321,10 @@ class Forecasts(APIBase):
         """
         # The by-id PATCH endpoint receives a single object body (e.g. {'name': ...}),
         # not a list, so `self._patch_items` (which chunks a list) does not apply.
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_forecast_by_id_url(project_id, forecast_id)
 
-        response = requests.patch(url, headers=headers, json=data)
+        response = self._send('patch', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)[0]
@@ -827,6 +826,21 @@ class Forecasts(APIBase):
         }
         return self._keysort(daily_volumes, order)
 
+    def get_stream_forecast_daily_volumes(
+        self, project_id: str, forecast_id: str, filters: Optional[Dict[str, str]] = None
+    ) -> Iterator[Item]:
+        """
+        Similar to `get_forecast_daily_volumes` but instead streams the daily
+        volumes one well at a time, decoding each page incrementally as it
+        arrives (see `APIBase._get_items_streamed`). Items arrive in API order
+        rather than sorted.
+
+        https://docs.api.combocurve.com/api/get-forecast-daily-volumes
+        """
+        url = self.get_forecast_daily_volumes_url(project_id, forecast_id, filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def get_forecast_monthly_volumes(
         self, project_id: str, forecast_id: str, filters: Optional[Dict[str, str]] = None
     ) -> ItemList:
@@ -998,6 +1012,21 @@ class Forecasts(APIBase):
         }
         return self._keysort(monthly_volumes, order)
 
+    def get_stream_forecast_monthly_volumes(
+        self, project_id: str, forecast_id: str, filters: Optional[Dict[str, str]] = None
+    ) -> Iterator[Item]:
+        """
+        Similar to `get_forecast_monthly_volumes` but instead streams the monthly
+        volumes one well at a time, decoding each page incrementally as it
+        arrives (see `APIBase._get_items_streamed`). Items arrive in API order
+        rather than sorted.
+
+        https://docs.api.combocurve.com/api/get-forecast-monthly-volumes
+        """
+        url = self.get_forecast_monthly_volumes_url(project_id, forecast_id, filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def post_forecast_segment_parameters(
         self, project_id: str, forecast_id: str, well_id: str, phase: str, series: str, data: ItemList
     ) -> List[WriteResponse]:
@@ -1131,6 +1160,7 @@ class Forecasts(APIBase):
         chunksize: int = 25,
         max_workers: int = 10,
         on_progress: Optional[Callable[[BatchChunk], None]] = None,
+        adaptive: bool = False,
     ) -> BatchWriteResult:
         """Upsert forecast parameters in parallel chunks, returning the 207 envelope.
 
@@ -1141,11 +1171,14 @@ class Forecasts(APIBase):
         are preserved (``result.failed_count`` / ``result.ok``) rather than
         silently dropped. Prefer this when you need to detect partial failures or
         want parallel throughput; `on_progress` is called once per completed
-        chunk (from the calling thread) for progress reporting.
+        chunk (from the calling thread) for progress reporting. With
+        `adaptive=True`, `max_workers` becomes a ceiling that concurrency ramps
+        up to while the API keeps up and halves back from on 429/503 (see
+        `APIBase._request_batched`).
         """
         url = self.get_forecast_parameters_url(project_id, forecast_id)
         return self._request_batched(
-            'put', url, data, chunksize=chunksize, max_workers=max_workers, on_progress=on_progress
+            'put', url, data, chunksize=chunksize, max_workers=max_workers, on_progress=on_progress, adaptive=adaptive
         )
 
     def get_forecast_run_url(self, project_id: str, forecast_id: str) -> str:
@@ -1172,14 +1205,14 @@ class Forecasts(APIBase):
         """
         # The run endpoint receives a single object body ({configurationId}), not
         # a list, so `self._post_items` (which chunks a list) does not apply.
-        headers = self.auth.get_auth_headers()
+        headers = self._get_auth_headers()
         url = self.get_forecast_run_url(project_id, forecast_id)
 
         data: Dict[str, str] = {}
         if configuration_id is not None:
             data['configurationId'] = configuration_id
 
-        response = requests.post(url, headers=headers, json=data)
+        response = self._send('post', url, headers=headers, json_body=data)
         response.raise_for_status()
 
         return self._extract_json(response)
@@ -62,15 +62,20 @@ class Production(APIBase):
     # API calls
     ###########
 
-    def get_company_monthly_productions(self, filters: Optional[Dict[str, str]] = None) -> ItemList:
+    def get_company_monthly_productions(
+        self, filters: Optional[Dict[str, str]] = None, *, page_concurrency: int = 1
+    ) -> ItemList:
         """
         Returns a list of company monthly production items.
 
+        `page_concurrency` > 1 fetches that many `GET_LIMIT`-record pages
+        concurrently as skip windows (see `APIBase._get_items_iterator`).
+
         https://docs.api.combocurve.com/api/get-monthly-productions
         """
         url = self.get_company_monthly_productions_url(filters)
         params = {'take': GET_LIMIT}
-        monthly_production = self._get_items(url, params)
+        monthly_production = self._get_items(url, params, page_concurrency=page_concurrency)
 
         order = {
             'well': 0,
@@ -78,6 +83,20 @@ class Production(APIBase):
         }
         return self._keysort(monthly_production, order)
 
+    def get_stream_company_monthly_productions(self, filters: Optional[Dict[str, str]] = None) -> Iterator[Item]:
+        """
+        Similar to `get_company_monthly_productions` but instead streams company
+        monthly production items one at a time, decoding each `GET_LIMIT`-record
+        page incrementally as it arrives (see `APIBase._get_items_streamed`).
+        Memory stays constant regardless of the page size; items arrive in API
+        order rather than sorted by well and date.
+
+        https://docs.api.combocurve.com/api/get-monthly-productions
+        """
+        url = self.get_company_monthly_productions_url(filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def post_company_monthly_productions(self, data: ItemList) -> List[WriteResponse]:
         """
         Creates monthly production items.
@@ -122,15 +141,20 @@ class Production(APIBase):
 
         return monthly_production
 
-    def get_company_daily_productions(self, filters: Optional[Dict[str, str]] = None) -> ItemList:
+    def get_company_daily_productions(
+        self, filters: Optional[Dict[str, str]] = None, *, page_concurrency: int = 1
+    ) -> ItemList:
         """
         Returns a list of company monthly production items.
 
+        `page_concurrency` > 1 fetches that many `GET_LIMIT`-record pages
+        concurrently as skip windows (see `APIBase._get_items_iterator`).
+
         https://docs.api.combocurve.com/api/get-daily-productions
         """
         url = self.get_company_daily_productions_url(filters)
         params = {'take': GET_LIMIT}
-        dailiy_production = self._get_items(url, params)
+        dailiy_production = self._get_items(url, params, page_concurrency=page_concurrency)
 
         order = {
             'well': 0,
@@ -138,6 +162,20 @@ class Production(APIBase):
         }
         return self._keysort(dailiy_production, order)
 
+    def get_stream_company_daily_productions(self, filters: Optional[Dict[str, str]] = None) -> Iterator[Item]:
+        """
+        Similar to `get_company_daily_productions` but instead streams company
+        daily production items one at a time, decoding each `GET_LIMIT`-record
+        page incrementally as it arrives (see `APIBase._get_items_streamed`).
+        Memory stays constant regardless of the page size; items arrive in API
+        order rather than sorted by well and date.
+
+        https://docs.api.combocurve.com/api/get-daily-productions
+        """
+        url = self.get_company_daily_productions_url(filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def post_company_daily_productions(self, data: ItemList) -> List[WriteResponse]:
         """
         Creates daily production items.
@@ -182,15 +220,20 @@ class Production(APIBase):
 
         return daily_production
 
-    def get_project_monthly_productions(self, project_id: str, filters: Optional[Dict[str, str]] = None) -> ItemList:
+    def get_project_monthly_productions(
+        self, project_id: str, filters: Optional[Dict[str, str]] = None, *, page_concurrency: int = 1
+    ) -> ItemList:
         """
         Returns a list of monthly production items for a specific project id.
 
+        `page_concurrency` > 1 fetches that many `GET_LIMIT`-record pages
+        concurrently as skip windows (see `APIBase._get_items_iterator`).
+
         https://docs.api.combocurve.com/api/get-projects-monthly-productions
         """
         url = self.get_project_monthly_productions_url(project_id, filters)
         params = {'take': GET_LIMIT}
-        monthly_production = self._get_items(url, params)
+        monthly_production = self._get_items(url, params, page_concurrency=page_concurrency)
 
         order = {
             'well': 0,
@@ -198,6 +241,22 @@ class Production(APIBase):
         }
         return self._keysort(monthly_production, order)
 
+    def get_stream_project_monthly_productions(
+        self, project_id: str, filters: Optional[Dict[str, str]] = None
+    ) -> Iterator[Item]:
+        """
+        Similar to `get_project_monthly_productions` but instead streams a specific project's
+        monthly production items one at a time, decoding each `GET_LIMIT`-record
+        page incrementally as it arrives (see `APIBase._get_items_streamed`).
+        Memory stays constant regardless of the page size; items arrive in API
+        order rather than sorted by well and date.
+
+        https://docs.api.combocurve.com/api/get-projects-monthly-productions
+        """
+        url = self.get_project_monthly_productions_url(project_id, filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def post_project_monthly_productions(self, project_id: str, data: ItemList) -> List[WriteResponse]:
         """
         Creates project monthly production items.
@@ -242,15 +301,20 @@ class Production(APIBase):
 
         return monthly_production
 
-    def get_project_daily_productions(self, project_id: str, filters: Optional[Dict[str, str]] = None) -> ItemList:
+    def get_project_daily_productions(
+        self, project_id: str, filters: Optional[Dict[str, str]] = None, *, page_concurrency: int = 1
+    ) -> ItemList:
         """
         Returns a list of daily production items for a specific project id.
 
+        `page_concurrency` > 1 fetches that many `GET_LIMIT`-record pages
+        concurrently as skip windows (see `APIBase._get_items_iterator`).
+
         https://docs.api.combocurve.com/api/get-projects-daily-productions
         """
         url = self.get_project_daily_productions_url(project_id, filters)
         params = {'take': GET_LIMIT}
-        daily_production = self._get_items(url, params)
+        daily_production = self._get_items(url, params, page_concurrency=page_concurrency)
 
         order = {
             'well': 0,
@@ -258,6 +322,22 @@ class Production(APIBase):
         }
         return self._keysort(daily_production, order)
 
+    def get_stream_project_daily_productions(
+        self, project_id: str, filters: Optional[Dict[str, str]] = None
+    ) -> Iterator[Item]:
+        """
+        Similar to `get_project_daily_productions` but instead streams a specific project's
+        daily production items one at a time, decoding each `GET_LIMIT`-record
+        page incrementally as it arrives (see `APIBase._get_items_streamed`).
+        Memory stays constant regardless of the page size; items arrive in API
+        order rather than sorted by well and date.
+
+        https://docs.api.combocurve.com/api/get-projects-daily-productions
+        """
+        url = self.get_project_daily_productions_url(project_id, filters)
+        params = {'take': GET_LIMIT}
+        yield from self._get_items_streamed(url, params)
+
     def post_project_daily_productions(self, project_id: str, data: ItemList) -> List[WriteResponse]:
         """
         Creates project daily production items.
@@ -0,0 +1,81 @@
+"""Tests for the opt-in econ-model mapper profiling (econ_models/profiling.py)."""
+
+import os
+import pathlib
+
+import pytest
+
+from combocurve_api_helper.econ_models import MAPPERS, formats, get_mapper, profile
+from combocurve_api_helper.econ_models import expenses
+from combocurve_api_helper.econ_models.expenses import ExpenseLeaf, ExpensesMapper
+from tests.econ_models.csv_fixture_io import FIXTURE_FILES, FIXTURES_DIR
+
+
+def _fixture_text(econ_model_type: str) -> str:
+    path = os.path.join(FIXTURES_DIR, FIXTURE_FILES[econ_model_type][0])
+    return pathlib.Path(path).read_text(encoding='utf-8')
+
+
+def test_stages_are_attributed_per_mapper() -> None:
+    expenses_text = _fixture_text('Expenses')
+    capex_text = _fixture_text('Capex')
+
+    with profile() as prof:
+        models = get_mapper('Expenses').from_csv(expenses_text)
+        get_mapper('Expenses').to_csv(models)
+        get_mapper('Capex').from_csv(capex_text)
+        formats.yes_no(True)  # outside any mapper
+
+    stats = prof.stats()
+    assert stats[('Expenses', 'inverse')].calls == len(models)
+    assert stats[('Expenses', 'forward')].calls == len(models)
+    assert stats[('Expenses', 'csv_io')].calls == 2
+    assert stats[('Expenses', 'validation')].calls > 0
+    assert stats[('Expenses', 'formatting')].calls > 0
+    assert ('Capex', 'inverse') in stats and ('Capex', 'forward') not in stats
+    assert stats[('-', 'formatting')].calls == 1
+
+    for s in stats.values():
+        assert 0 <= s.self_seconds <= s.seconds
+    csv_io = stats[('Expenses', 'csv_io')]
+    nested = sum(s.seconds for (m, stage), s in stats.items() if m == 'Expenses' and stage in ('forward', 'inverse'))
+    assert csv_io.self_seconds == pytest.approx(csv_io.seconds - nested, abs=1e-3)
+
+    assert prof.by_stage()['inverse'].calls == len(models) + stats[('Capex', 'inverse')].calls
+    assert prof.report().splitlines()[0].split()[:2] == ['mapper', 'stage']
+
+
+def test_originals_are_restored_on_exit() -> None:
+    before = (
+        formats.num_to_csv,
+        expenses.num_to_csv_float,
+        ExpensesMapper.to_row_dicts,
+        ExpenseLeaf.model_validate,
+        '__init__' in vars(ExpenseLeaf),
+        MAPPERS['Expenses'].to_csv,
+    )
+    with pytest.raises(KeyError):
+        with profile():
+            assert formats.num_to_csv is not before[0]
+            assert expenses.num_to_csv_float is not before[1]
+            raise KeyError('boom')
+
+    after = (
+        formats.num_to_csv,
+        expenses.num_to_csv_float,
+        ExpensesMapper.to_row_dicts,
+        ExpenseLeaf.model_validate,
+        '__init__' in vars(ExpenseLeaf),
+        MAPPERS['Expenses'].to_csv,
+    )
+    assert after == before
+
+
+def test_only_one_profile_at_a_time() -> None:
+    with profile():
+        with pytest.raises(RuntimeError, match='already active'):
+            with profile():
+                pass
+    with profile() as prof:
+        pass
+    assert prof.stats() == {}
@@ -0,0 +1,146 @@
+"""Unit tests for the asyncio client (async_api.py) -- no live API.
+
+Installs an `httpx.MockTransport` on the async client so we verify URL-builder
+reuse, Link-header pagination, retry parity with the blocking transport, and
+in-order 207 stitching for `_arequest_batched` deterministically.
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List
+
+import pytest
+from pytest import MonkeyPatch
+
+httpx = pytest.importorskip('httpx')
+
+from combocurve_api_helper import ComboCurveAPI
+from combocurve_api_helper.async_api import AsyncComboCurveAPI
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+
+def _make_api(monkeypatch: MonkeyPatch, handler: Callable[[Any], Any]) -> AsyncComboCurveAPI:
+    api = AsyncComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    api.aclient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return api
+
+
+def test_url_builders_match_sync_client() -> None:
+    api = AsyncComboCurveAPI()
+    sync = ComboCurveAPI()
+    assert api.get_projects_url() == sync.get_projects_url()
+    assert api.get_forecast_parameters_url('P', 'F') == sync.get_forecast_parameters_url('P', 'F')
+    assert api.get_econ_runs_url('P', 'S') == sync.get_econ_runs_url('P', 'S')
+
+
+def test_aget_items_follows_link_pagination(monkeypatch: MonkeyPatch) -> None:
+    def handler(request: Any) -> Any:
+        if request.url.params.get('page') == '2':
+            return httpx.Response(200, json=[{'id': 'c'}])
+        return httpx.Response(200, json=[{'id': 'a'}, {'id': 'b'}], headers={'Link': '<https://x/p?page=2>;rel="next"'})
+
+    api = _make_api(monkeypatch, handler)
+
+    async def run() -> List[Dict[str, Any]]:
+        async with api:
+            pages = [page async for page in api._aget_items_iterator('https://x/p', {'take': 2})]
+            assert [len(page) for page in pages] == [2, 1]
+            return await api._aget_items('https://x/p', {'take': 2})
+
+    assert [item['id'] for item in asyncio.run(run())] == ['a', 'b', 'c']
+
+
+def test_arequest_with_retry_retries_429_then_gateway(monkeypatch: MonkeyPatch) -> None:
+    statuses = [429, 503, 200]
+    sleeps: List[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+
+    def handler(request: Any) -> Any:
+        status = statuses.pop(0)
+        return httpx.Response(status, json=[{}], headers={'Retry-After': '7'} if status == 429 else {})
+
+    api = _make_api(monkeypatch, handler)
+    response = asyncio.run(api._arequest_with_retry('get', 'https://x'))
+
+    assert response.status_code == 200
+    assert sleeps == [7.0, 2.0]  # Retry-After, then gateway backoff for attempt 1
+
+
+def test_arequest_batched_stitches_in_order(monkeypatch: MonkeyPatch) -> None:
+    def handler(request: Any) -> Any:
+        records = json.loads(request.content)
+        return httpx.Response(
+            207,
+            json={
+                'successCount': len(records),
+                'failedCount': 0,
+                'results': [{'well': rec['well']} for rec in records],
+                'generalErrors': [],
+            },
+        )
+
+    api = _make_api(monkeypatch, handler)
+    data: List[Dict[str, Any]] = [{'well': f'w{i}'} for i in range(60)]
+    progress: List[int] = []
+
+    result = asyncio.run(
+        api._arequest_batched(
+            'put', 'https://x', data, chunksize=25, max_workers=2, on_progress=lambda c: progress.append(c.index)
+        )
+    )
+
+    assert result.ok
+    assert result.success_count == 60
+    assert [c.count for c in result.chunks] == [25, 25, 10]
+    assert sorted(progress) == [0, 1, 2]
+    assert [rec['well'] for rec in result.results] == [f'w{i}' for i in range(60)]
+
+
+def test_arequest_batched_records_timeouts_and_deadline(monkeypatch: MonkeyPatch) -> None:
+    timeouts: List[Any] = []
+
+    def handler(request: Any) -> Any:
+        timeouts.append(request.extensions['timeout'])
+        records = json.loads(request.content)
+        if records[0]['n'] == 'stall':
+            raise httpx.ReadTimeout('stalled', request=request)
+        if records[0]['n'] == 'limited':
+            return httpx.Response(429, headers={'Retry-After': '60'})
+        return httpx.Response(207, json={'successCount': len(records), 'failedCount': 0, 'results': records})
+
+    api = _make_api(monkeypatch, handler)
+
+    async def run(n: str) -> Any:
+        data: List[Dict[str, Any]] = [{'n': n}]
+        with api.deadline(30):
+            return await api._arequest_batched('put', 'https://x', data, chunksize=1)
+
+    ok, stalled, limited = (asyncio.run(run(n)).chunks[0] for n in ('ok', 'stall', 'limited'))
+    assert not ok.timed_out and ok.success_count == 1
+    assert stalled.timed_out and 'ReadTimeout' in stalled.error_message
+    assert limited.timed_out and 'DeadlineExceeded' in limited.error_message and limited.http_status == 429
+    assert timeouts[0]['connect'] == 10.0 and 29 < timeouts[0]['read'] <= 30  # clipped to the budget
+
+
+def test_async_writes_invalidate_a_shared_response_cache(monkeypatch: MonkeyPatch) -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=3)
+        sync = server.client(ComboCurveAPI)
+        cache = sync.enable_cache()
+        url = f'{sync.API_BASE_URL}/projects'
+        sync._get_items(url, {'take': 10})
+        sync._get_items(url, {'take': 10})
+        assert server.request_count('GET') == 1
+
+        api = _make_api(monkeypatch, lambda request: httpx.Response(207, json={'successCount': 1, 'failedCount': 0}))
+        api.enable_cache(cache)
+        asyncio.run(api._arequest_with_retry('post', url, json_body=[{'name': 'new'}]))
+
+        sync._get_items(url, {'take': 10})
+        assert server.request_count('GET') == 2
+    assert (cache.stats().hits, cache.stats().misses, cache.stats().invalidations) == (1, 2, 1)
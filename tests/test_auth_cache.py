@@ -0,0 +1,121 @@
+"""Unit tests for the expiry-aware auth header cache (_auth.py) -- no live API.
+
+Drives `_AuthHeaderCache` with hand-built JWTs and a controllable clock, so we
+verify expiry tracking, refresh-ahead, single-flight refresh across threads,
+and that batch workers pick up refreshed headers mid-batch.
+"""
+
+import base64
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import AuthHeaderStats, ComboCurveAPI
+from combocurve_api_helper import _auth
+from combocurve_api_helper._auth import _AuthHeaderCache
+
+
+def _bearer(exp: float, tag: str = 't') -> Dict[str, str]:
+    def b64(obj: Any) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).decode().rstrip('=')
+
+    token = f'{b64({"alg": "RS256"})}.{b64({"exp": exp, "tag": tag})}.sig'
+    return {'Authorization': f'Bearer {token}', 'x-api-key': 'k'}
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_token_expiry_reads_exp_claim() -> None:
+    assert _auth._token_expiry(_bearer(1234.0)) == 1234.0
+    assert _auth._token_expiry({}) is None
+    assert _auth._token_expiry({'Authorization': 'Bearer not-a-jwt'}) is None
+
+
+def test_cache_serves_until_refresh_ahead_window(monkeypatch: MonkeyPatch) -> None:
+    clock = _Clock(1000.0)
+    monkeypatch.setattr(_auth.time, 'time', clock.time)
+    fetched: List[float] = []
+
+    def fetch() -> Dict[str, str]:
+        fetched.append(clock.now)
+        return _bearer(clock.now + 3600)
+
+    cache = _AuthHeaderCache(fetch, refresh_ahead_seconds=30)
+    first = cache.get()
+    clock.now += 3500
+    assert cache.get() is first  # still well before exp - 30
+    clock.now += 80  # now inside the refresh-ahead window
+    assert cache.get() is not first
+
+    assert fetched == [1000.0, 4580.0]
+    stats = cache.stats()
+    assert isinstance(stats, AuthHeaderStats)
+    assert stats.refreshes == 2
+
+
+def test_single_flight_refresh_across_threads() -> None:
+    calls = {'n': 0}
+    release = threading.Event()
+
+    def slow_fetch() -> Dict[str, str]:
+        calls['n'] += 1
+        release.wait(timeout=5)
+        return _bearer(time.time() + 3600)
+
+    cache = _AuthHeaderCache(slow_fetch)
+    results: List[Any] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls['n'] == 1
+    assert len(results) == 16 and all(r is results[0] for r in results)
+    assert 1 <= cache.stats().waits <= 15  # threads arriving after the refresh don't wait
+
+
+def test_batch_workers_pick_up_refreshed_headers(monkeypatch: MonkeyPatch) -> None:
+    api = ComboCurveAPI()
+    tokens = iter(['first', 'second'])
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {'x-api-key': next(tokens)})
+    seen: List[str] = []
+
+    class _Response:
+        status_code = 207
+        headers: Dict[str, str] = {}
+        text = ''
+
+        content = b'{"successCount": 1, "failedCount": 0, "results": [{}], "generalErrors": []}'
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _Response:
+        seen.append(headers['x-api-key'])
+        if len(seen) == 1:
+            api.invalidate_auth_headers()  # simulate the token expiring mid-batch
+        return _Response()
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    result = api._request_batched('put', 'https://x', [{'well': 'a'}, {'well': 'b'}], chunksize=1, max_workers=1)
+
+    assert result.ok
+    assert seen == ['first', 'second']
+    assert api.auth_header_stats().refreshes == 2
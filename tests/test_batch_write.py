@@ -1,17 +1,19 @@
 """Unit tests for the batched-write driver (_request_batched) — no live API.
 
-Monkeypatches auth + requests.request so we exercise chunking, parallel
+Monkeypatches auth + the API's pooled session so we exercise chunking, parallel
 completion, 207-envelope parsing, in-order stitching, and partial/whole-chunk
 failure accounting deterministically.
 """
 
+import json
+import threading
 import time
 from typing import Any
 
-import requests
 from pytest import MonkeyPatch
 
 from combocurve_api_helper import BatchWriteResult, ComboCurveAPI
+from combocurve_api_helper._batch import _AdaptiveConcurrency
 
 
 class _FakeResponse:
@@ -23,8 +25,9 @@ class _FakeResponse:
         self.headers: dict[str, str] = {}
         self.text = str(body)
 
-    def json(self) -> Any:
-        return self._body
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
 
 
 def _make_api(monkeypatch: MonkeyPatch) -> ComboCurveAPI:
@@ -36,19 +39,28 @@ def _make_api(monkeypatch: MonkeyPatch) -> ComboCurveAPI:
 def test_request_batched_chunks_and_stitches_207_in_order(monkeypatch: MonkeyPatch) -> None:
     api = _make_api(monkeypatch)
 
-    def fake_request(method: str, url: str, headers: Any = None, params: Any = None, json: Any = None) -> _FakeResponse:
-        n = len(json)
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        records = json.loads(data or b'[]')
+        n = len(records)
         return _FakeResponse(
             207,
             {
                 'successCount': n,
                 'failedCount': 0,
-                'results': [{'status': 'Success', 'well': rec['well']} for rec in json],
+                'results': [{'status': 'Success', 'well': rec['well']} for rec in records],
                 'generalErrors': [],
             },
         )
 
-    monkeypatch.setattr(requests, 'request', fake_request)
+    monkeypatch.setattr(api.session, 'request', fake_request)
 
     data: list[dict[str, Any]] = [{'well': f'w{i}', 'phase': 'oil', 'segments': []} for i in range(60)]
     result = api._request_batched('put', 'https://x/parameters', data, chunksize=25, max_workers=4)
@@ -66,14 +78,23 @@ def test_request_batched_chunks_and_stitches_207_in_order(monkeypatch: MonkeyPat
 def test_request_batched_preserves_partial_and_whole_chunk_failures(monkeypatch: MonkeyPatch) -> None:
     api = _make_api(monkeypatch)
 
-    def fake_request(method: str, url: str, headers: Any = None, params: Any = None, json: Any = None) -> _FakeResponse:
-        if json[0]['well'] == 'BAD':
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        records = json.loads(data or b'[]')
+        if records[0]['well'] == 'BAD':
             return _FakeResponse(400, {'generalErrors': [{'message': 'bad batch'}]})
-        n = len(json)
+        n = len(records)
         results = [{'status': 'Error' if i == 0 else 'Success'} for i in range(n)]
         return _FakeResponse(207, {'successCount': n - 1, 'failedCount': 1, 'results': results, 'generalErrors': []})
 
-    monkeypatch.setattr(requests, 'request', fake_request)
+    monkeypatch.setattr(api.session, 'request', fake_request)
 
     # chunk 0: 25 records, 1 fails in the 207; chunk 1: 25 records, whole-chunk 400.
     data: list[dict[str, Any]] = (
@@ -89,7 +110,7 @@ def test_request_batched_preserves_partial_and_whole_chunk_failures(monkeypatch:
 
 def test_request_batched_empty_data(monkeypatch: MonkeyPatch) -> None:
     api = _make_api(monkeypatch)
-    monkeypatch.setattr(requests, 'request', lambda *a, **k: _FakeResponse(207, {}))
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: _FakeResponse(207, {}))
     result = api._request_batched('put', 'https://x/parameters', [], chunksize=25)
     assert result.ok
     assert result.success_count == 0
@@ -102,16 +123,25 @@ def test_request_batched_retries_transient_gateway_5xx(monkeypatch: MonkeyPatch)
     monkeypatch.setattr(time, 'sleep', lambda _s: None)  # skip real backoff
     calls = {'n': 0}
 
-    def fake_request(method: str, url: str, headers: Any = None, params: Any = None, json: Any = None) -> _FakeResponse:
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        records = json.loads(data or b'[]')
         calls['n'] += 1
         if calls['n'] == 1:
             return _FakeResponse(503, {'error': 'temporarily unavailable'})
-        n = len(json)
+        n = len(records)
         return _FakeResponse(
-            207, {'successCount': n, 'failedCount': 0, 'results': [{} for _ in json], 'generalErrors': []}
+            207, {'successCount': n, 'failedCount': 0, 'results': [{} for _ in records], 'generalErrors': []}
         )
 
-    monkeypatch.setattr(requests, 'request', fake_request)
+    monkeypatch.setattr(api.session, 'request', fake_request)
     data: list[dict[str, Any]] = [{'well': f'w{i}'} for i in range(10)]
     result = api._request_batched('put', 'https://x', data, chunksize=25, max_workers=1)
 
@@ -125,13 +155,167 @@ def test_request_batched_does_not_retry_non_gateway_5xx(monkeypatch: MonkeyPatch
     monkeypatch.setattr(time, 'sleep', lambda _s: None)
     calls = {'n': 0}
 
-    def fake_request(method: str, url: str, headers: Any = None, params: Any = None, json: Any = None) -> _FakeResponse:
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
         calls['n'] += 1
         return _FakeResponse(500, {'error': 'boom'})
 
-    monkeypatch.setattr(requests, 'request', fake_request)
+    monkeypatch.setattr(api.session, 'request', fake_request)
     result = api._request_batched('put', 'https://x', [{'well': 'w0'}], chunksize=25, max_workers=1)
 
     assert not result.ok
     assert result.failed_count == 1
     assert calls['n'] == 1  # 500 is not a retryable gateway status
+
+
+def _ok_207(records: Any) -> _FakeResponse:
+    n = len(records)
+    return _FakeResponse(
+        207, {'successCount': n, 'failedCount': 0, 'results': [{} for _ in records], 'generalErrors': []}
+    )
+
+
+def test_adaptive_concurrency_grows_on_fast_successes_up_to_ceiling(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    lock = threading.Lock()
+    active = {'n': 0, 'max': 0}
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        with lock:
+            active['n'] += 1
+            active['max'] = max(active['max'], active['n'])
+        time.sleep(0.005)
+        with lock:
+            active['n'] -= 1
+        return _ok_207(json.loads(data or b'[]'))
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    data: list[dict[str, Any]] = [{'well': f'w{i}'} for i in range(200)]
+    result = api._request_batched('put', 'https://x', data, chunksize=1, max_workers=6, adaptive=True)
+
+    assert result.ok
+    assert result.success_count == 200
+    limits = [limit for _, limit in result.concurrency]
+    assert limits[0] == 2  # starts low ...
+    assert limits == sorted(limits)  # ... only ever grows without congestion ...
+    assert limits[-1] == 6  # ... and stops at the ceiling
+    assert active['max'] <= 6
+
+
+def test_adaptive_concurrency_halves_once_per_window_on_congestion() -> None:
+    limiter = _AdaptiveConcurrency(ceiling=16, latency_target=1.0, limit=8)
+
+    epochs = [limiter.acquire() for _ in range(8)]
+    limiter.release(epochs[0], congested=True, fast=False)
+    assert limiter.limit == 4.0
+    # the rest of the window was sent before the cut: no further halving
+    for epoch in epochs[1:]:
+        limiter.release(epoch, congested=True, fast=False)
+    assert limiter.limit == 4.0
+
+    # a request sent after the cut may cut again
+    limiter.release(limiter.acquire(), congested=True, fast=False)
+    assert limiter.limit == 2.0
+    assert [limit for _, limit in limiter.timeline] == [8, 4, 2]
+
+
+def test_adaptive_concurrency_backs_off_on_429_and_still_completes(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    monkeypatch.setattr(time, 'sleep', lambda _s: None)  # skip the 429 pause
+    calls = {'n': 0}
+    lock = threading.Lock()
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        with lock:
+            calls['n'] += 1
+            n = calls['n']
+        if n == 40:
+            return _FakeResponse(429, {'error': 'too many requests'})
+        return _ok_207(json.loads(data or b'[]'))
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    data: list[dict[str, Any]] = [{'well': f'w{i}'} for i in range(80)]
+    result = api._request_batched('put', 'https://x', data, chunksize=1, max_workers=8, adaptive=True)
+
+    assert result.ok
+    assert result.success_count == 80
+    limits = [limit for _, limit in result.concurrency]
+    assert any(later < earlier for earlier, later in zip(limits, limits[1:]))  # the 429 cut the limit
+
+
+def test_fixed_concurrency_is_reported(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    monkeypatch.setattr(
+        api.session,
+        'request',
+        lambda method, url, headers=None, params=None, data=None, stream=False, timeout=None: _ok_207(json.loads(data)),
+    )
+
+    result = api._request_batched('put', 'https://x', [{'well': 'w0'}], chunksize=25, max_workers=3)
+
+    assert result.concurrency == [(0.0, 3)]
+
+
+def test_chunk_and_batch_timings(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    monkeypatch.setattr(time, 'sleep', lambda _s: None)  # waits are still measured, not slept
+    statuses = {'w0': [429], 'w4': [503, 502]}
+    bodies: list[bytes] = []
+    lock = threading.Lock()
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        records = json.loads(data)
+        with lock:
+            bodies.append(data)
+            pending = statuses.get(records[0]['well'])
+            if pending:
+                return _FakeResponse(pending.pop(0), {})
+        return _ok_207(records)
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    data: list[dict[str, Any]] = [{'well': f'w{i}'} for i in range(5)]
+    result = api._request_batched('put', 'https://x', data, chunksize=2, max_workers=1)
+
+    assert result.ok
+    first, second, third = result.chunks
+    assert [c.attempts for c in result.chunks] == [2, 1, 3]
+    assert first.request_bytes == len(b'[{"well":"w0"},{"well":"w1"}]')
+    assert third.request_bytes == len(b'[{"well":"w4"}]')
+    assert third.backoff_wait == 1.0 + 2.0 and first.backoff_wait == 0.0
+    assert 59.0 < first.rate_limit_wait <= 60.0  # resent after the batch-wide 429 pause
+    assert result.rate_limit_pause == 60.0
+    assert result.bytes_sent == sum(len(b) for b in bodies)
+    assert result.elapsed >= max(c.elapsed for c in result.chunks) > 0
+    assert result.records_per_second == 5 / result.elapsed
+    assert result.bytes_per_second == result.bytes_sent / result.elapsed
@@ -0,0 +1,202 @@
+"""Tests for the opt-in GET response cache (APIBase.enable_cache, _cache.py), against `FakeComboCurve`."""
+
+import time
+from pathlib import Path
+
+from combocurve_api_helper import ComboCurveAPI, ResponseCache
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+_PROJECT = 'a' * 24
+
+
+def test_repeated_reads_are_served_from_the_cache() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=5)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache()
+        url = f'{api.API_BASE_URL}/projects'
+
+        first = api._get_items(url, {'take': 2})
+        first[0]['wellName'] = 'mutated by the caller'
+        assert server.request_count('GET') == 3
+
+        again = api._get_items(url, {'take': 2})
+        assert server.request_count('GET') == 3
+        assert again[0]['wellName'] != 'mutated by the caller' and len(again) == 5
+        assert [p for p in api._get_items_iterator(url, {'take': 2})] == [again[:2], again[2:4], again[4:]]
+
+        api._get_items(url, {'take': 3})  # other params: another entry
+        assert server.request_count('GET') == 5
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (2, 2, 2, 2)
+    assert stats.bytes > 0 and stats.hit_ratio == 0.5
+
+
+def test_writes_invalidate_their_resource() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=3)
+        server.add_collection('/v1/projects/*/scenarios', count=2)
+        server.add_collection('/v1/projects/*/scenarios/*/**', count=1)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache()
+        projects = f'{api.API_BASE_URL}/projects'
+        scenarios = f'{projects}/{_PROJECT}/scenarios'
+        qualifiers = f'{scenarios}/{"b" * 24}/qualifiers'
+
+        for url in (projects, scenarios, qualifiers):
+            api._get_items(url, {'take': 10})
+        assert cache.stats().entries == 3
+
+        api._post_items(scenarios, [{'name': 'new'}])
+        assert cache.stats().entries == 1  # the scenarios list and the path below it
+        assert len(api._get_items(scenarios, {'take': 10})) == 3
+
+        result = api._request_batched('put', projects, [{'name': str(i)} for i in range(4)], chunksize=2)
+        assert result.success_count == 4
+        assert cache.stats().entries == 0
+        assert len(api._get_items(projects, {'take': 10})) == 7
+
+    assert cache.stats().invalidations == 4  # the projects write also dropped the re-read scenarios
+
+
+def test_record_writes_invalidate_the_collection_lists() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=3)
+        server.add_collection('/v1/projects/*', count=0)
+        server.add_collection('/v1/projects/*/forecasts', count=2)
+        server.add_collection('/v1/projects/*/forecasts/*', count=0)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache()
+        forecasts = f'{api.API_BASE_URL}/projects/{_PROJECT}/forecasts'
+        other_forecasts = f'{api.API_BASE_URL}/projects/{"c" * 24}/forecasts'
+
+        api.get_projects()
+        api._get_items(forecasts, {'take': 10})
+        api._get_items(other_forecasts, {'take': 10})
+        assert cache.stats().entries == 3
+
+        api.delete_project_by_id('d' * 24)  # drops the projects list, not the forecast lists
+        assert cache.stats().entries == 2 and cache.stats().invalidations == 1
+        api.get_projects()
+        assert cache.stats().misses == 4
+
+        api.patch_forecast_by_id(_PROJECT, 'e' * 24, {'name': 'renamed'})  # drops only that project's list
+        assert cache.stats().entries == 2 and cache.stats().invalidations == 2
+        api._get_items(other_forecasts, {'take': 10})
+        assert cache.stats().hits == 1
+
+
+def test_route_ttls_and_expiry() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=2)
+        server.add_collection('/v1/projects', count=2)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache(ttl=0.05, routes={'/v1/wells': 0})
+
+        for _ in range(2):
+            api._get_items(f'{api.API_BASE_URL}/wells')
+        assert server.request_count('GET') == 2
+        assert cache.stats().misses == 0  # uncached routes are not looked up
+
+        api._get_items(f'{api.API_BASE_URL}/projects')
+        api._get_items(f'{api.API_BASE_URL}/projects')
+        assert server.request_count('GET') == 3
+        time.sleep(0.1)
+        api._get_items(f'{api.API_BASE_URL}/projects')  # expired: revalidated
+        assert server.request_count('GET') == 4 and server.request_count('GET', 304) == 1
+        assert (cache.stats().hits, cache.stats().misses, cache.stats().revalidations) == (2, 1, 1)
+
+
+def test_expired_pages_are_revalidated_with_conditional_requests() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=5, record_bytes=2_000)
+        api = server.client(ComboCurveAPI)
+        metrics = api.enable_metrics()
+        cache = api.enable_cache(ttl=1e-9)  # every call revalidates
+        url = f'{api.API_BASE_URL}/projects'
+
+        projects = api._get_items(url, {'take': 2})
+        received = metrics.snapshot()['GET /v1/projects']['bytes_received']
+        assert api._get_items(url, {'take': 2}) == projects
+        assert server.request_count('GET', 304) == 3
+        assert metrics.snapshot()['GET /v1/projects']['bytes_received'] == received  # nothing re-downloaded
+        assert cache.stats().revalidations == 1
+
+        # a write elsewhere changes the last page (and grows the collection by a page)
+        server.client()._post_items(url, [{'name': 'new'}, {'name': 'newer'}])
+        assert cache.stats().revalidations == 1
+        updated = api._get_items(url, {'take': 2})
+        assert updated[:5] == projects and len(updated) == 7
+        assert server.request_count('GET', 304) == 5  # pages 1-2 unchanged, 3 changed, 4 fetched
+        assert server.request_count('GET') == 3 + 3 + 4
+
+        assert api._get_items(url, {'take': 2}) == updated
+        assert server.request_count('GET', 304) == 9
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.revalidations, stats.stores) == (2, 2, 2, 4)
+
+
+def test_lru_bounds() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=4, record_bytes=100)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache(max_entries=2)
+        url = f'{api.API_BASE_URL}/projects'
+
+        api._get_items(url, {'take': 1})
+        api._get_items(url, {'take': 2})
+        api._get_items(url, {'take': 1})  # hit: now the most recently used
+        api._get_items(url, {'take': 3})  # evicts take=2
+        assert cache.stats().evictions == 1
+        before = server.request_count('GET')
+        api._get_items(url, {'take': 1})
+        api._get_items(url, {'take': 3})
+        assert server.request_count('GET') == before
+
+        cache.max_bytes = cache.stats().bytes // 2
+        api._get_items(url, {'take': 4})
+        assert cache.stats().entries == 1 and cache.stats().bytes <= cache.max_bytes
+
+
+def test_abandoned_and_raced_reads_are_not_stored() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', count=4)
+        api = server.client(ComboCurveAPI)
+        cache = api.enable_cache()
+        url = f'{api.API_BASE_URL}/projects'
+
+        next(api._get_items_iterator(url, {'take': 2}))  # abandoned after the first page
+        assert cache.stats().stores == 0
+
+        pages = api._get_items_iterator(url, {'take': 2})
+        next(pages)
+        cache.invalidate(f'{url}?skip=2')  # a write lands mid-read
+        list(pages)
+        assert cache.stats().stores == 0
+
+        api._get_items(url, {'take': 2})
+        assert cache.stats().stores == 1
+
+
+def test_sqlite_backend_outlives_the_client(tmp_path: Path) -> None:
+    path = tmp_path / 'cache' / 'responses.sqlite3'
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=9)
+        api = server.client(ComboCurveAPI)
+        api.enable_cache(path=path)
+        url = f'{api.API_BASE_URL}/wells'
+        wells = api._get_items(url, {'take': 2}, page_concurrency=3)
+        assert len(wells) == 9
+
+        other = server.client(ComboCurveAPI)
+        cache = other.enable_cache(ResponseCache(path=path, max_entries=1))
+        requests = server.request_count('GET')
+        assert other._get_items(url, {'take': 2}) == wells
+        assert server.request_count('GET') == requests
+        assert cache.stats().entries == 1
+
+        other._get_items(url, {'take': 3})
+        assert cache.stats().evictions == 1 and cache.stats().entries == 1
+        other._put_items(url, [{'chosenID': 'x'}])
+        assert cache.stats().entries == 0
@@ -0,0 +1,97 @@
+"""Tests for the record/replay transport (_cassette.py).
+
+Records real HTTP traffic against the local `FakeComboCurve`, stops the server,
+and replays the cassette on an `APIBase.offline()` instance: same results, same
+request count, recorded `Link` / `Retry-After` headers honoured, and timings
+replayed at the requested scale.
+"""
+
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI, ItemList
+from combocurve_api_helper._cassette import load_cassette
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+_WRITES = '/v1/projects/*/forecasts/*/parameters'
+
+
+def _sync(api: ComboCurveAPI) -> ItemList:
+    """A small stand-in for a month-end sync: a paginated read, then a batched write."""
+    wells = api._get_items(f'{api.API_BASE_URL}/wells', {'take': 4})
+    data: ItemList = [{'chosenID': w['chosenID'], 'rate': i} for i, w in enumerate(wells)]
+    url = f'{api.API_BASE_URL}/projects/a/forecasts/b/parameters'
+    result = api._request_batched('put', url, data, chunksize=3, max_workers=2)
+    return wells + result.results
+
+
+def test_replays_a_recorded_session_offline(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    cassette = tmp_path / 'sync.cassette.gz'
+
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=10)
+        server.add_collection(_WRITES)
+        server.inject('/v1/wells', 429, retry_after=3)
+        api = server.client(ComboCurveAPI)
+        with api.record_cassette(cassette) as recorder:
+            recorded = _sync(api)
+        assert len(recorder.interactions) == server.request_count() == 1 + 3 + 4
+
+    interactions = load_cassette(cassette)
+    assert interactions[0].status == 429 and interactions[0].headers['Retry-After'] == '3'
+    assert 'rel="next"' in interactions[1].headers['Link']
+    assert {i.method for i in interactions} == {'GET', 'PUT'}
+
+    sleeps.clear()
+    replay = ComboCurveAPI.offline()
+    replay.API_BASE_URL = api.API_BASE_URL  # the URLs the cassette was recorded against
+    player = replay.replay_cassette(cassette, time_scale=0)
+    assert _sync(replay) == recorded
+    assert (player.served, player.remaining) == (8, 0)
+    assert sleeps == [3.0]  # the recorded Retry-After, honoured again
+
+    with pytest.raises(requests.ConnectionError, match='no recorded response'):
+        replay._get_items(f'{replay.API_BASE_URL}/wells', {'take': 4})
+
+
+def test_streamed_reads_replay(tmp_path: Path) -> None:
+    cassette = tmp_path / 'stream.cassette.gz'
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=5)
+        api = server.client()
+        with api.record_cassette(cassette):
+            recorded = list(api._get_items_streamed(f'{api.API_BASE_URL}/wells', {'take': 2}))
+
+    replay = ComboCurveAPI.offline()
+    replay.replay_cassette(cassette, time_scale=0)
+    replay.API_BASE_URL = api.API_BASE_URL
+    assert list(replay._get_items_streamed(f'{replay.API_BASE_URL}/wells', {'take': 2})) == recorded
+    assert len(recorded) == 5
+
+
+def test_time_scale_replays_recorded_durations(tmp_path: Path) -> None:
+    cassette = tmp_path / 'slow.cassette.gz'
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=2)
+        server.configure_route('/v1/wells', latency=0.1)
+        api = server.client()
+        with api.record_cassette(cassette):
+            api._get_items(f'{api.API_BASE_URL}/wells', {'take': 1})
+
+    def replay_seconds(time_scale: float) -> float:
+        replay = ComboCurveAPI.offline()
+        replay.replay_cassette(cassette, time_scale=time_scale)
+        start = time.perf_counter()
+        replay._get_items(f'{api.API_BASE_URL}/wells', {'take': 1})
+        return time.perf_counter() - start
+
+    assert replay_seconds(1.0) >= 0.2
+    assert 0.1 <= replay_seconds(0.5) < 0.2
+    assert replay_seconds(0) < 0.1
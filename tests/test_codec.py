@@ -0,0 +1,108 @@
+"""Unit tests for the pluggable JSON codec (_codec.py) -- no live API.
+
+Verifies the orjson/stdlib selection and fallback, that both codecs agree on
+API-shaped payloads, and that the API encodes write bodies and decodes
+responses through whatever codec is installed.
+"""
+
+import json
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+import pytest
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI
+from combocurve_api_helper._codec import OrjsonCodec, StdlibJSONCodec, default_codec
+
+PAYLOAD: List[Dict[str, Any]] = [
+    {'well': 'w0', 'date': '2024-01-01', 'oil': 12.5, 'gas': None, 'tags': ['a', 'ü'], 'nested': {'n': 1}},
+    {'well': 'w1', 'date': '2024-01-02', 'oil': 0, 'gas': 3e-07, 'tags': [], 'nested': {}},
+]
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, content: bytes) -> None:
+        self.status_code = 200
+        self.headers: Dict[str, str] = {}
+        self.content = content
+        self.text = content.decode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _CountingCodec(StdlibJSONCodec):
+    name = 'counting'
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        self.calls.append('dumps')
+        return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        self.calls.append('loads')
+        return super().loads(data)
+
+
+def test_default_codec_prefers_orjson_and_falls_back(monkeypatch: MonkeyPatch) -> None:
+    pytest.importorskip('orjson')
+    assert default_codec().name == 'orjson'
+
+    monkeypatch.setitem(sys.modules, 'orjson', None)  # makes `import orjson` raise ImportError
+    assert default_codec().name == 'json'
+
+
+def test_codecs_round_trip_identically() -> None:
+    pytest.importorskip('orjson')
+    stdlib, fast = StdlibJSONCodec(), OrjsonCodec()
+
+    assert stdlib.loads(fast.dumps(PAYLOAD)) == PAYLOAD
+    assert fast.loads(stdlib.dumps(PAYLOAD)) == PAYLOAD
+    assert json.loads(fast.dumps(PAYLOAD)) == json.loads(stdlib.dumps(PAYLOAD))
+
+
+def test_api_encodes_and_decodes_through_installed_codec(monkeypatch: MonkeyPatch) -> None:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    codec = _CountingCodec()
+    api.codec = codec
+    sent: List[Tuple[Any, Any]] = []
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        sent.append((headers.get('Content-Type'), data))
+        return _FakeResponse(b'[{"id": "X"}]')
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    assert api._post_items('https://x/items', PAYLOAD) == [{'id': 'X'}]
+    assert api._get_items('https://x/items') == [{'id': 'X'}]
+
+    assert codec.calls == ['dumps', 'loads', 'loads']
+    assert sent[0] == ('application/json', StdlibJSONCodec().dumps(PAYLOAD))
+    assert sent[1] == (None, None)  # GETs carry no body
+
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), -float('inf')])
+@pytest.mark.parametrize('codec_class', [StdlibJSONCodec, OrjsonCodec])
+def test_codecs_reject_non_finite_floats(codec_class: Any, value: float) -> None:
+    if codec_class is OrjsonCodec:
+        pytest.importorskip('orjson')
+    codec = codec_class()
+    with pytest.raises(ValueError):
+        codec.dumps([{'well': 'w0', 'oil': None, 'segments': [{'b': value}]}])
+    with pytest.raises(ValueError):
+        codec.dumps(value)
+    assert codec.loads(codec.dumps([{'oil': None}])) == [{'oil': None}]
@@ -0,0 +1,114 @@
+"""Unit tests for opt-in request-body gzip and response negotiation -- no live API.
+
+Monkeypatches auth + the API's pooled session to capture what goes on the wire:
+bodies stay uncompressed by default, large ones are gzipped (and decode back to
+the same JSON) once `configure_compression` is on, small ones are left alone,
+and the savings are counted.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, List, Tuple
+
+import requests
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    status_code = 207
+    headers: Dict[str, str] = {}
+    text = ''
+    content = b'{"successCount": 1, "failedCount": 0, "results": [{}], "generalErrors": []}'
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _capture(monkeypatch: MonkeyPatch) -> Tuple[ComboCurveAPI, List[Tuple[Dict[str, str], bytes]]]:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    sent: List[Tuple[Dict[str, str], bytes]] = []
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        sent.append((headers, data))
+        return _FakeResponse()
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    return api, sent
+
+
+def _segments(n: int) -> List[Dict[str, Any]]:
+    return [
+        {'well': f'w{i}', 'phase': 'oil', 'series': 'best', 'segments': [{'segmentType': 'arps', 'b': 1.2}] * 4}
+        for i in range(n)
+    ]
+
+
+def test_bodies_are_uncompressed_by_default(monkeypatch: MonkeyPatch) -> None:
+    api, sent = _capture(monkeypatch)
+    api._put_items('https://x/parameters', _segments(200))
+
+    headers, body = sent[0]
+    assert 'Content-Encoding' not in headers
+    assert json.loads(body) == _segments(200)
+    assert api.compression_stats().compressed_requests == 0
+
+
+def test_large_bodies_are_gzipped_and_counted(monkeypatch: MonkeyPatch) -> None:
+    api, sent = _capture(monkeypatch)
+    api.configure_compression(min_bytes=1024)
+
+    api._put_items('https://x/parameters', _segments(200))
+    api._post_items('https://x/parameters', _segments(1))  # below the threshold
+
+    (big_headers, big_body), (small_headers, small_body) = sent
+    assert big_headers['Content-Encoding'] == 'gzip'
+    assert big_headers['Content-Type'] == 'application/json'
+    assert json.loads(gzip.decompress(big_body)) == _segments(200)
+    assert 'Content-Encoding' not in small_headers
+    assert json.loads(small_body) == _segments(1)
+
+    stats = api.compression_stats()
+    assert stats.compressed_requests == 1
+    assert stats.uncompressed_bytes == len(gzip.decompress(big_body))
+    assert stats.compressed_bytes == len(big_body)
+    assert stats.bytes_saved > 0
+    assert stats.ratio > 10
+
+
+def test_batched_chunks_are_gzipped(monkeypatch: MonkeyPatch) -> None:
+    api, sent = _capture(monkeypatch)
+    api.configure_compression(min_bytes=1024)
+
+    api._request_batched('put', 'https://x/parameters', _segments(100), chunksize=25, max_workers=2)
+
+    assert len(sent) == 4
+    assert all(headers['Content-Encoding'] == 'gzip' for headers, _ in sent)
+    assert sorted(len(json.loads(gzip.decompress(body))) for _, body in sent) == [25, 25, 25, 25]
+    assert api.compression_stats().compressed_requests == 4
+
+    api.configure_compression(min_bytes=None)
+    api._request_batched('put', 'https://x/parameters', _segments(25), chunksize=25)
+    assert 'Content-Encoding' not in sent[-1][0]
+
+
+def test_sessions_negotiate_compressed_responses() -> None:
+    api = ComboCurveAPI()
+    assert 'gzip' in api.session.headers['Accept-Encoding']
+
+    custom = requests.Session()
+    del custom.headers['Accept-Encoding']
+    api.configure_session(session=custom)
+    assert 'gzip' in api.session.headers['Accept-Encoding']
@@ -0,0 +1,84 @@
+"""Tests for request timeouts and `deadline()` budgets (_deadline.py) against the local `FakeComboCurve`."""
+
+import time
+
+import pytest
+import requests
+
+from combocurve_api_helper import ComboCurveAPI, DeadlineExceeded, ItemList
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+_WRITES = '/v1/projects/*/forecasts/*/parameters'
+
+
+def test_read_timeout_fails_a_stalled_request() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=3)
+        server.configure_route('/v1/wells', latency=1.0)
+        api = server.client(ComboCurveAPI)
+        api.timeout = (1.0, 0.2)
+        start = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            api._get_items(f'{api.API_BASE_URL}/wells')
+        assert time.monotonic() - start < 0.8
+
+
+def test_deadline_spans_pagination() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=20)
+        server.configure_route('/v1/wells', latency=0.1)
+        api = server.client(ComboCurveAPI)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            with api.deadline(0.35):
+                api._get_items(f'{api.API_BASE_URL}/wells', {'take': 2})
+        assert time.monotonic() - start < 0.6
+        assert 3 <= server.request_count() <= 4
+
+        with api.deadline(5):  # enough budget: no effect
+            assert len(api._get_items(f'{api.API_BASE_URL}/wells', {'take': 10})) == 20
+
+
+def test_no_429_pause_that_would_overrun_the_deadline() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=3)
+        server.inject('/v1/wells', 429, retry_after=60)
+        api = server.client(ComboCurveAPI)
+        start = time.monotonic()
+        with api.deadline(5), pytest.raises(DeadlineExceeded, match='retrying HTTP 429 in 60 s'):
+            api._get_items(f'{api.API_BASE_URL}/wells')
+        assert time.monotonic() - start < 1.0
+        assert server.request_count() == 1
+
+
+def test_batch_returns_a_partial_result_at_the_deadline() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection(_WRITES)
+        server.configure_route(_WRITES, latency=0.2)
+        api = server.client(ComboCurveAPI)
+        url = f'{api.API_BASE_URL}/projects/a/forecasts/b/parameters'
+        data: ItemList = [{'chosenID': str(i)} for i in range(40)]
+        start = time.monotonic()
+        with api.deadline(0.5):
+            result = api._request_batched('put', url, data, chunksize=5, max_workers=2)
+        assert time.monotonic() - start < 0.9
+
+    timed_out = result.timed_out_chunks
+    assert timed_out and len(timed_out) < len(result.chunks) == 8
+    assert not result.ok
+    assert all('DeadlineExceeded' in c.error_message and c.failed_count == c.count for c in timed_out)
+    assert any(c.attempts == 0 and c.http_status == 0 for c in timed_out)  # never sent
+    assert result.success_count == sum(c.count for c in result.chunks if not c.timed_out)
+
+
+def test_batch_records_stalled_chunks_as_timed_out() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection(_WRITES)
+        server.configure_route(_WRITES, latency=0.5)
+        api = server.client(ComboCurveAPI)
+        api.timeout = (1.0, 0.1)
+        url = f'{api.API_BASE_URL}/projects/a/forecasts/b/parameters'
+        result = api._request_batched('put', url, [{'chosenID': str(i)} for i in range(6)], chunksize=3)
+
+    assert [c.timed_out for c in result.chunks] == [True, True]
+    assert all('ReadTimeout' in c.error_message and c.attempts == 1 for c in result.chunks)
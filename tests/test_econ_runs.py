@@ -1,8 +1,12 @@
 """Unit tests for econ-run wrappers that carry validation logic (no live API)."""
 
+import threading
+from typing import List
+
 import pytest
 
 from combocurve_api_helper import ComboCurveAPI
+from combocurve_api_helper.fake_server import FakeComboCurve
 
 
 def test_monthly_econ_results_requires_columns() -> None:
@@ -11,3 +15,54 @@ def test_monthly_econ_results_requires_columns() -> None:
     api = ComboCurveAPI()
     with pytest.raises(ValueError, match='columns is required'):
         api.get_econ_run_monthly_econ_result_by_id('P', 'S', 'R', [])
+
+
+def _econ_runs_server() -> FakeComboCurve:
+    server = FakeComboCurve()
+    runs = [
+        {'id': f'{i:024x}', 'status': 'complete' if i < 3 else 'running', 'runDate': f'2025-01-0{i + 1}'}
+        for i in range(4)
+    ]
+    server.add_collection('/v1/projects/*/scenarios/*/econ-runs', runs)
+    combo_names = '/v1/projects/*/scenarios/*/econ-runs/*/one-liners/combo-names'
+    server.add_collection(combo_names, ['b', 'a', 'b'])  # type: ignore[list-item]
+    server.configure_route(combo_names, latency=0.1)
+    return server
+
+
+def test_combo_names_are_fetched_concurrently_and_memoized() -> None:
+    with _econ_runs_server() as server:
+        api = server.client(ComboCurveAPI)
+        fetch = api.get_econ_run_combo_names
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, maximum
+
+        def counting_fetch(project_id: str, scenario_id: str, econ_run_id: str) -> List[str]:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            try:
+                return fetch(project_id, scenario_id, econ_run_id)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        api.get_econ_run_combo_names = counting_fetch  # type: ignore[method-assign]
+        runs = api.get_econ_runs('P', 'S')
+        assert in_flight[1] > 1  # the 0.1 s requests overlapped
+        assert [run['comboNames'] for run in runs] == [['a', 'b']] * 4
+
+        api.get_econ_runs('P', 'S')
+        assert server.request_count('GET') == 1 + 4 + 1 + 1  # only the running run is re-requested
+
+
+def test_lazy_combo_names_are_fetched_on_access() -> None:
+    with _econ_runs_server() as server:
+        api = server.client(ComboCurveAPI)
+        runs = api.get_econ_runs('P', 'S', lazy_combo_names=True)
+        assert server.request_count('GET') == 1
+        assert 'comboNames' not in runs[0]
+
+        assert runs[0]['comboNames'] == ['a', 'b'] and runs[1].get('comboNames') == ['a', 'b']
+        assert runs[0]['comboNames'] == ['a', 'b']
+        assert server.request_count('GET') == 3
@@ -1,11 +1,12 @@
 """Unit tests for the v2/v1 export wrappers (exports.py) -- no live API.
 
-Monkeypatches auth + requests.post/get so we verify URL construction, the
+Monkeypatches auth + the API's pooled session so we verify URL construction, the
 per-kind -> URL mapping, and the raw-request delegation deterministically
 (the one new module with logic beyond a thin URL-build-and-dispatch wrapper).
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import json
+from typing import Any, Dict, List, Tuple
 
 import pytest
 import requests
@@ -33,8 +34,9 @@ class _FakeResponse:
         self._body = body
         self.headers: Dict[str, str] = {}
 
-    def json(self) -> Any:
-        return self._body
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -60,11 +62,20 @@ def test_post_export_hits_correct_v2_url(monkeypatch: MonkeyPatch, kind: str) ->
     api = _make_api(monkeypatch)
     calls: List[Tuple[str, Any]] = []
 
-    def fake_post(url: str, headers: Any = None, json: Any = None) -> _FakeResponse:
-        calls.append((url, json))
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        assert method == 'post'
+        calls.append((url, json.loads(data or b'null')))
         return _FakeResponse(200, [{'id': 'JOB'}])
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(api.session, 'request', fake_request)
 
     result = getattr(api, f'post_export_{KINDS[kind]}')({'scenarioId': 's'})
 
@@ -77,11 +88,20 @@ def test_get_export_by_job_id_hits_correct_v2_url(monkeypatch: MonkeyPatch, kind
     api = _make_api(monkeypatch)
     calls: List[str] = []
 
-    def fake_get(url: str, headers: Any = None, params: Optional[Any] = None) -> _FakeResponse:
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        assert method == 'get'
         calls.append(url)
         return _FakeResponse(200, [{'status': 'complete'}])
 
-    monkeypatch.setattr(requests, 'get', fake_get)
+    monkeypatch.setattr(api.session, 'request', fake_request)
 
     result = getattr(api, f'get_export_{KINDS[kind]}_by_job_id')('JOB123')
 
@@ -93,11 +113,20 @@ def test_post_export_v1_hits_v1_url(monkeypatch: MonkeyPatch) -> None:
     api = _make_api(monkeypatch)
     calls: List[Tuple[str, Any]] = []
 
-    def fake_post(url: str, headers: Any = None, json: Any = None) -> _FakeResponse:
-        calls.append((url, json))
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        assert method == 'post'
+        calls.append((url, json.loads(data or b'null')))
         return _FakeResponse(200, [{'id': 'X'}])
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(api.session, 'request', fake_request)
 
     result = api.post_export({'exportType': 'x'})
 
@@ -107,6 +136,6 @@ def test_post_export_v1_hits_v1_url(monkeypatch: MonkeyPatch) -> None:
 
 def test_export_raises_on_http_error(monkeypatch: MonkeyPatch) -> None:
     api = _make_api(monkeypatch)
-    monkeypatch.setattr(requests, 'post', lambda *a, **k: _FakeResponse(400, {}))
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: _FakeResponse(400, {}))
     with pytest.raises(requests.HTTPError):
         api.post_export_econ_monthly({})
@@ -0,0 +1,118 @@
+"""Tests for the local ComboCurve stand-in (fake_server.py).
+
+Runs the real client against `FakeComboCurve` over localhost HTTP: pagination
+via `Link` headers (skip- and cursor-based), the 207 write envelope with
+per-record rejections and gzip bodies, and injected 429/5xx faults surfacing as
+retries in the request metrics. `time.sleep` is patched out where retries would
+otherwise back off for real.
+"""
+
+import time
+from typing import Iterator, Optional
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI, Item, ItemList
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+
+@pytest.fixture
+def server() -> Iterator[FakeComboCurve]:
+    with FakeComboCurve() as server:
+        yield server
+
+
+def test_paginates_with_link_headers(server: FakeComboCurve) -> None:
+    server.add_collection('/v1/wells', count=55)
+    api = server.client(ComboCurveAPI)
+
+    wells = api._get_items(f'{api.API_BASE_URL}/wells', {'take': 20})
+
+    assert [w['id'] for w in wells] == [f'{i:024x}' for i in range(55)]
+    assert server.request_count('GET') == 3
+
+
+def test_cursor_routes_ignore_skip(server: FakeComboCurve) -> None:
+    server.add_collection('/v1/projects/*/daily-productions', count=7, cursor=True)
+    api = server.client()
+    url = f'{api.API_BASE_URL}/projects/5e272d38b78910dd2a1bd691/daily-productions'
+
+    response = requests.get(url, params={'take': 3, 'skip': 5})
+    assert response.json()[0]['id'] == f'{0:024x}'
+    assert 'cursor=3' in response.headers['Link']
+
+    assert len(api._get_items(url, {'take': 3})) == 7
+
+
+def test_take_above_max_is_rejected(server: FakeComboCurve) -> None:
+    server.add_collection('/v1/wells', count=5, max_take=10)
+
+    assert requests.get(f'{server.base_url}/wells', params={'take': 11}).status_code == 400
+    assert requests.get(f'{server.base_url}/nowhere').status_code == 404
+
+
+def test_batched_writes_get_the_207_envelope(server: FakeComboCurve) -> None:
+    def validate(record: Item) -> Optional[str]:
+        return 'negative rate' if record['rate'] == -1 else None
+
+    server.add_collection('/v1/projects/*/forecasts/*/parameters', validate=validate)
+    api = server.client()
+    api.configure_compression()
+    url = f'{api.API_BASE_URL}/projects/a/forecasts/b/parameters'
+    data: ItemList = [{'chosenID': str(i), 'rate': -1 if i == 7 else i, 'pad': 'x' * 400} for i in range(30)]
+
+    result = api._request_batched('put', url, data, chunksize=10, max_workers=3)
+
+    assert (result.success_count, result.failed_count) == (29, 1)
+    assert result.results[7]['errors'] == [{'name': 'ValidationError', 'message': 'negative rate', 'location': '[7]'}]
+    assert result.results[8]['chosenID'] == '8'
+    assert len(server.records('/v1/projects/*/forecasts/*/parameters')) == 29  # gzip bodies were decoded
+    assert api.compression_stats().compressed_requests == 3
+
+
+def test_injected_faults_are_retried(server: FakeComboCurve, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(time, 'sleep', lambda _s: None)
+    server.add_collection('/v1/wells', count=10)
+    server.inject('/v1/wells', 429, 503, retry_after=2)
+    api = server.client()
+    metrics = api.enable_metrics()
+
+    assert len(api._get_items(f'{api.API_BASE_URL}/wells', {'take': 5})) == 10
+
+    wells = metrics.snapshot()['GET /v1/wells']
+    assert wells['statuses'] == {200: 2, 429: 1, 503: 1}
+    assert wells['retries'] == {'rate_limit': 1, 'gateway': 1}
+    assert wells['backoff_seconds'] == 2.0 + 2.0  # Retry-After, then the attempt-1 gateway backoff
+    assert server.request_count(status=200) == 2
+
+
+def test_seeded_failures_and_quota_are_deterministic(monkeypatch: MonkeyPatch) -> None:
+    def failures(seed: int) -> int:
+        with FakeComboCurve(seed=seed) as server:
+            server.add_collection('/v1/wells', count=1)
+            server.configure_route('/v1/**', failure_rate=0.3)
+            for _ in range(40):
+                requests.get(f'{server.base_url}/wells')
+            return server.request_count(status=200)
+
+    assert failures(1) == failures(1) < 40
+
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=1)
+        server.set_quota(0.001, burst=2, retry_after=7)
+        statuses = [requests.get(f'{server.base_url}/wells') for _ in range(3)]
+        assert [r.status_code for r in statuses] == [200, 200, 429]
+        assert statuses[-1].headers['Retry-After'] == '7'
+
+
+def test_range_filters() -> None:
+    records = [{'id': str(i), 'updatedAt': f'2025-01-0{i}T00:00:00.000Z'} for i in range(1, 6)] + [{'id': 'x'}]
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', records)
+        api = server.client()
+        url = f'{api.API_BASE_URL}/wells'
+        assert [r['id'] for r in api._get_items(url, {'take': 2, 'updatedAt[ge]': '2025-01-03'})] == ['3', '4', '5']
+        assert [r['id'] for r in api._get_items(url, {'take': 2, 'updatedAt[lt]': '2025-01-03'})] == ['1', '2']
+        assert len(api._get_items(url, {'take': 2})) == 6
@@ -0,0 +1,137 @@
+"""Unit tests for request lifecycle hooks (_hooks.py) -- no live API.
+
+Monkeypatches auth + the API's pooled session so we verify the event sequence
+around retries and give-ups, the fields each event carries, emission from
+`_request_batched` worker threads, and that a failing hook never fails a request.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI, RequestEvent
+from combocurve_api_helper._hooks import _url_template
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        self.status_code = status_code
+        self.content = json.dumps(body).encode()
+        self.headers: Dict[str, str] = {}
+        self.text = self.content.decode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _make_api(monkeypatch: MonkeyPatch, statuses: List[int]) -> Tuple[ComboCurveAPI, List[RequestEvent]]:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    monkeypatch.setattr(time, 'sleep', lambda _s: None)
+    lock = threading.Lock()
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        with lock:
+            status = statuses.pop(0) if statuses else 207
+        return _FakeResponse(status, [{'id': 'X'}])
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    events: List[RequestEvent] = []
+    api.hooks.add(events.append)
+    return api, events
+
+
+def test_url_template_replaces_record_ids() -> None:
+    url = 'https://api.combocurve.com/v1/projects/5e272d38b78910dd2a1bd691/forecasts/5e272d38b78910dd2a1bd692?take=5'
+    assert _url_template(url) == '/v1/projects/{id}/forecasts/{id}'
+    assert _url_template('https://x/v1/wells/abc') == '/v1/wells/abc'
+
+
+def test_retry_then_success_event_sequence(monkeypatch: MonkeyPatch) -> None:
+    api, events = _make_api(monkeypatch, [503, 200])
+
+    api._post_items('https://x/v1/projects/5e272d38b78910dd2a1bd691/wells', [{'well': 'w'}])
+
+    assert [(e.kind, e.attempt, e.status) for e in events] == [
+        ('start', 0, None),
+        ('response', 0, 503),
+        ('retry', 0, 503),
+        ('start', 1, None),
+        ('response', 1, 200),
+    ]
+    assert {e.url_template for e in events} == {'/v1/projects/{id}/wells'}
+    assert events[2].sleep == 1.0  # gateway backoff for attempt 0
+    assert events[0].bytes_sent == len(b'[{"well":"w"}]')
+    assert events[1].bytes_received == len(b'[{"id": "X"}]')
+    assert events[1].elapsed >= 0
+
+
+def test_give_up_after_retries_exhausted(monkeypatch: MonkeyPatch) -> None:
+    api, events = _make_api(monkeypatch, [502] * 10)
+
+    response = api._request_with_retry('get', 'https://x/v1/wells', params={'take': 5})
+
+    assert response.status_code == 502
+    kinds = [e.kind for e in events]
+    assert kinds.count('retry') == kinds.count('start') - 1
+    assert events[-1].kind == 'give_up'
+    assert events[-1].status == 502
+    assert events[-1].params == {'take': 5}
+
+
+def test_send_errors_are_reported_as_give_up(monkeypatch: MonkeyPatch) -> None:
+    api, events = _make_api(monkeypatch, [])
+
+    def refuse(*args: Any, **kwargs: Any) -> Any:
+        raise requests.ConnectionError('refused')
+
+    monkeypatch.setattr(api.session, 'request', refuse)
+    with pytest.raises(requests.ConnectionError):
+        api._get_items('https://x/v1/wells')
+
+    assert [e.kind for e in events] == ['start', 'give_up']
+    assert isinstance(events[-1].error, requests.ConnectionError)
+
+
+def test_batched_workers_emit_events(monkeypatch: MonkeyPatch) -> None:
+    api, events = _make_api(monkeypatch, [429])
+    threads: List[str] = []
+    api.hooks.add(lambda event: threads.append(threading.current_thread().name))
+
+    data: List[Dict[str, Any]] = [{'well': f'w{i}'} for i in range(6)]
+    api._request_batched('put', 'https://x/v1/forecasts', data, chunksize=2, max_workers=3)
+
+    retries = [e for e in events if e.kind == 'retry']
+    assert len(retries) == 1 and retries[0].status == 429 and retries[0].sleep > 0
+    assert len([e for e in events if e.kind == 'response']) == 4
+    assert all(name != threading.main_thread().name for name in threads)
+
+
+def test_failing_hook_warns_and_request_succeeds(monkeypatch: MonkeyPatch) -> None:
+    api, events = _make_api(monkeypatch, [200])
+
+    def broken(event: RequestEvent) -> None:
+        raise KeyError('boom')
+
+    remove = api.hooks.add(broken)
+    with pytest.warns(RuntimeWarning, match='boom'):
+        assert api._get_items('https://x/v1/wells') == [{'id': 'X'}]
+    assert len(events) == 2  # the other hook still ran
+
+    remove()
+    assert len(api.hooks) == 1
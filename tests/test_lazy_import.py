@@ -0,0 +1,81 @@
+"""Tests for the lazy package imports (PEP 562 `__getattr__` in the package `__init__`s and `config`).
+
+Each check runs in a fresh interpreter with `HOME` pointing at an empty
+directory, so nothing is already imported and no credentials exist.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+
+def _run(code: str, home: Path) -> str:
+    env: Dict[str, str] = {'HOME': str(home), 'USERPROFILE': str(home), 'PYTHONPATH': os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, '-c', code], env=env, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_import_loads_nothing_heavy(tmp_path: Path) -> None:
+    code = (
+        'import sys, combocurve_api_helper, combocurve_api_helper.econ_models\n'
+        'heavy = ["requests", "pydantic", "asyncio", "combocurve_api_helper.base", "combocurve_api_helper.wells"]\n'
+        'print([m for m in heavy if m in sys.modules])\n'
+        'combocurve_api_helper.TokenBucket\n'
+        'print("combocurve_api_helper.base" in sys.modules)'
+    )
+    assert _run(code, tmp_path).splitlines() == ['[]', 'False']
+
+
+def test_config_is_read_on_first_use(tmp_path: Path) -> None:
+    code = (
+        'from combocurve_api_helper import ComboCurveAPI, config\n'
+        'api = ComboCurveAPI.offline()\n'  # no credentials needed
+        'print(api.ECON_MODELS is config.ECON_MODELS, api.WELLHEADER_COLUMNS["api10"] == "api10")\n'
+        'try:\n'
+        '    ComboCurveAPI()\n'
+        'except FileNotFoundError as e:\n'
+        '    print(type(e).__name__)'
+    )
+    assert _run(code, tmp_path).splitlines() == ['True True', 'FileNotFoundError']
+
+
+def test_public_names_resolve() -> None:
+    import combocurve_api_helper
+    from combocurve_api_helper import econ_models
+
+    assert combocurve_api_helper.ComboCurveAPI.__module__ == 'combocurve_api_helper'
+    assert {'ComboCurveAPI', 'TokenBucket', 'RequestPlan'} <= set(dir(combocurve_api_helper))
+    for name in combocurve_api_helper.__all__:
+        assert getattr(combocurve_api_helper, name) is not None
+    for name in econ_models.__all__:
+        assert getattr(econ_models, name) is not None
+    assert {'get_mapper', 'ExpensesMapper', 'expenses_to_csv'} <= set(econ_models.__all__)
+
+
+def test_resource_mixins_resolve() -> None:
+    import combocurve_api_helper
+    from combocurve_api_helper.base import APIBase
+
+    mixins = [
+        'Root',
+        'Projects',
+        'Scenarios',
+        'Production',
+        'EconRuns',
+        'Wells',
+        'Models',
+        'CompanyModels',
+        'Forecasts',
+        'TypeCurves',
+        'Directional',
+        'ForecastConfigurations',
+        'OwnershipQualifiers',
+        'Exports',
+    ]
+    for name in mixins:
+        mixin = getattr(combocurve_api_helper, name)
+        assert issubclass(mixin, APIBase) and issubclass(combocurve_api_helper.ComboCurveAPI, mixin)
+    from combocurve_api_helper import Wells  # noqa: F401
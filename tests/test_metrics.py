@@ -0,0 +1,119 @@
+"""Unit tests for the per-endpoint request metrics (_metrics.py) -- no live API.
+
+Drives `RequestMetrics` both with hand-built `RequestEvent`s (exact histogram
+and percentile arithmetic) and through a monkeypatched session (end-to-end
+counting of pages, retries by cause, backoff, and bytes), and checks the
+Prometheus text exposition.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI, RequestEvent, RequestMetrics
+
+
+def _event(kind: Any, elapsed: float = 0.0, status: Optional[int] = 200, **fields: Any) -> RequestEvent:
+    return RequestEvent(
+        kind, 'get', 'https://x/v1/wells', '/v1/wells', None, 0, status=status, elapsed=elapsed, **fields
+    )
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status_code = status_code
+        self.content = json.dumps(body).encode()
+        self.headers = headers or {}
+        self.text = self.content.decode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_latency_percentiles_track_the_distribution() -> None:
+    metrics = RequestMetrics()
+    for i in range(1, 101):
+        metrics(_event('response', elapsed=i / 100))  # 10 ms .. 1 s, uniform
+
+    latency = metrics.snapshot()['GET /v1/wells']['latency_seconds']
+    assert latency['count'] == 100
+    assert latency['max'] == 1.0
+    assert abs(latency['sum'] - 50.5) < 1e-9
+    for name, expected in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+        assert abs(latency[name] - expected) / expected < 0.25, (name, latency[name])
+
+
+def test_end_to_end_counts_pages_retries_backoff_and_bytes(monkeypatch: MonkeyPatch) -> None:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    monkeypatch.setattr(time, 'sleep', lambda _s: None)
+    responses: List[_FakeResponse] = [
+        _FakeResponse(429, {}, {'Retry-After': '3'}),
+        _FakeResponse(200, [{'id': 1}], {'Link': '<https://x/v1/wells?skip=1>;rel="next"', 'Content-Length': '10'}),
+        _FakeResponse(503, {}),
+        _FakeResponse(200, [{'id': 2}], {'Content-Length': '10'}),
+        _FakeResponse(200, [{'id': 'P'}], {'Content-Length': '12'}),
+    ]
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+    metrics = api.enable_metrics()
+
+    api._get_items('https://x/v1/wells', {'take': 1})
+    api._post_items('https://x/v1/projects/5e272d38b78910dd2a1bd691/wells', [{'w': 1}])
+
+    snapshot = metrics.snapshot()
+    wells = snapshot['GET /v1/wells']
+    assert wells['requests'] == 4
+    assert wells['statuses'] == {200: 2, 429: 1, 503: 1}
+    assert wells['pages'] == 2
+    assert wells['retries'] == {'rate_limit': 1, 'gateway': 1}
+    assert wells['backoff_seconds'] == 3.0 + 1.0  # Retry-After, then gateway backoff
+    assert wells['bytes_received'] >= 20
+
+    writes = snapshot['POST /v1/projects/{id}/wells']
+    assert writes['pages'] == 0
+    assert writes['bytes_sent'] == len(b'[{"w":1}]')
+    assert writes['bytes_received'] == 12
+
+
+def test_prometheus_text_exposition() -> None:
+    metrics = RequestMetrics()
+    metrics(_event('response', elapsed=0.004, bytes_received=100))
+    metrics(_event('response', elapsed=0.2, status=503))
+    metrics(_event('retry', status=503, sleep=1.0))
+    metrics(_event('give_up', status=None, error=RuntimeError('x')))
+
+    text = metrics.prometheus_text()
+    lines = text.splitlines()
+    labels = 'method="GET",endpoint="/v1/wells"'
+
+    assert '# TYPE combocurve_request_duration_seconds histogram' in lines
+    assert f'combocurve_responses_total{{{labels},status="200"}} 1' in lines
+    assert f'combocurve_responses_total{{{labels},status="503"}} 1' in lines
+    assert f'combocurve_retries_total{{{labels},cause="gateway"}} 1' in lines
+    assert f'combocurve_retries_total{{{labels},cause="rate_limit"}} 0' in lines
+    assert f'combocurve_give_ups_total{{{labels}}} 1' in lines
+    assert f'combocurve_backoff_seconds_total{{{labels}}} 1.0' in lines
+    assert f'combocurve_bytes_received_total{{{labels}}} 100' in lines
+    assert f'combocurve_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in lines
+    assert f'combocurve_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f'combocurve_request_duration_seconds_count{{{labels}}} 2' in lines
+    assert text.endswith('\n')
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,77 @@
+"""Tests for the local SQLite mirror (LocalMirror, _mirror.py), against `FakeComboCurve`."""
+
+from pathlib import Path
+
+import pytest
+
+from combocurve_api_helper import ComboCurveAPI, LocalMirror
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+
+def _well(i: int, updated_at: str = '', **fields: str):
+    updated_at = updated_at or f'2025-01-{i + 1:02d}T00:00:00.000Z'
+    return {'id': f'{i:024x}', 'chosenID': f'42{i:08d}', 'wellName': f'Well {i}', 'updatedAt': updated_at, **fields}
+
+
+def _production(well: int, month: int, updated_at: str = '', oil: float = 1.0):
+    updated_at = updated_at or f'2025-01-{month:02d}T00:00:00.000Z'
+    return {'well': f'{well:024x}', 'date': f'2024-{month:02d}-01T00:00:00.000Z', 'oil': oil, 'updatedAt': updated_at}
+
+
+def _server() -> FakeComboCurve:
+    server = FakeComboCurve()
+    server.add_collection('/v1/wells', [_well(i) for i in range(3)], max_take=20_000)
+    productions = [_production(well, month) for well in range(3) for month in range(1, 13)]
+    server.add_collection('/v1/monthly-productions', productions, max_take=20_000)
+    server.add_collection('/v1/projects/*/forecasts/*/outputs', [{'id': 'o1', 'well': f'{0:024x}'}], max_take=1000)
+    return server
+
+
+def test_sync_then_query_locally(tmp_path: Path) -> None:
+    with _server() as server, LocalMirror(server.client(ComboCurveAPI), tmp_path / 'mirror.db') as mirror:
+        assert mirror.watermark('wells') is None
+        assert mirror.sync() == {'wells': 3, 'monthly_productions': 36}
+        assert mirror.watermark('wells') == '2025-01-03T00:00:00.000Z'
+        requests = server.request_count('GET')
+
+        assert len(mirror.wells()) == 3
+        assert mirror.well(f'{1:024x}')['wellName'] == 'Well 1'
+        assert mirror.well_by_chosen_id('4200000002')['id'] == f'{2:024x}'
+        assert mirror.well('missing') is None
+
+        production = mirror.monthly_productions(chosen_ids=['4200000001'], start='2024-03', end='2024-06')
+        assert [p['date'][:7] for p in production] == ['2024-03', '2024-04', '2024-05']
+        assert {p['well'] for p in production} == {f'{1:024x}'}
+        assert len(mirror.monthly_productions(well_ids=[f'{0:024x}', f'{2:024x}'])) == 24
+        assert server.request_count('GET') == requests  # answered from the mirror
+
+        assert mirror.sync_forecast_outputs('P', 'F') == 1
+        assert mirror.forecast_outputs('P', 'F', well_ids=[f'{0:024x}'])[0]['id'] == 'o1'
+        assert mirror.forecast_outputs('P', 'other') == []
+
+        with pytest.raises(ValueError):
+            mirror.sync(['forecast_outputs'])
+
+
+def test_incremental_sync_requests_only_updates(tmp_path: Path) -> None:
+    path = tmp_path / 'mirror.db'
+    with _server() as server:
+        api = server.client(ComboCurveAPI)
+        with LocalMirror(api, path) as mirror:
+            mirror.sync()
+
+        later = '2025-02-01T00:00:00.000Z'
+        api._post_items(f'{api.API_BASE_URL}/wells', [_well(1, later, wellName='Renamed'), _well(3, later)])
+        api._post_items(f'{api.API_BASE_URL}/monthly-productions', [_production(0, 1, later, oil=5.0)])
+
+        with LocalMirror(api, path) as mirror:  # the watermark outlives the process
+            # the updates, and the items at the previous watermark (well 2; each well's December)
+            assert mirror.sync() == {'wells': 3, 'monthly_productions': 4}
+            assert mirror.watermark('wells') == later
+            assert len(mirror.wells()) == 4 and mirror.well(f'{1:024x}')['wellName'] == 'Renamed'
+            january = mirror.monthly_productions(well_ids=[f'{0:024x}'], end='2024-02')
+            assert [p['oil'] for p in january] == [5.0]
+
+            assert mirror.sync() == {'wells': 2, 'monthly_productions': 1}  # the watermark's own items again
+            assert mirror.sync(['wells'], full=True) == {'wells': 5}  # the fake server appends updates
+            assert len(mirror.wells()) == 4 and mirror.well(f'{1:024x}')['wellName'] == 'Renamed'
@@ -0,0 +1,231 @@
+"""Unit tests for concurrent skip-window pagination and page prefetch -- no live API.
+
+Serves a fake skip/take collection (and cursor-only ones) from the API's
+pooled session, so we verify in-order reassembly, the first-short-page stop,
+the sequential fallback for cursor routes, and the bounded prefetch look-ahead.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI
+
+TOTAL = 95
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status_code = 200
+        self._body = body
+        self.headers = headers or {}
+        self.text = str(body)
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _make_api(monkeypatch: MonkeyPatch) -> ComboCurveAPI:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    return api
+
+
+def _skip_take_server(calls: List[int], in_flight: List[int]) -> Any:
+    lock = threading.Lock()
+    active = {'n': 0}
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        if params is None:  # following a Link next-page URL
+            url, query = url.split('?')
+            params = dict(pair.split('=') for pair in query.split('&'))
+        skip = int(params.get('skip', 0))
+        take = int(params['take'])
+        with lock:
+            calls.append(skip)
+            active['n'] += 1
+            in_flight.append(active['n'])
+        time.sleep(0.01)
+        with lock:
+            active['n'] -= 1
+        page = [{'id': i} for i in range(skip, min(skip + take, TOTAL))]
+        headers_ = {}
+        if skip + take < TOTAL:
+            headers_['Link'] = f'<{url}?skip={skip + take}&take={take}>;rel="next"'
+        return _FakeResponse(page, headers_)
+
+    return fake_request
+
+
+def test_windowed_pages_reassemble_in_order(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    calls: List[int] = []
+    in_flight: List[int] = []
+    monkeypatch.setattr(api.session, 'request', _skip_take_server(calls, in_flight))
+
+    pages = list(api._get_items_iterator('https://x/items', {'take': 10}, page_concurrency=4))
+
+    assert [item['id'] for page in pages for item in page] == list(range(TOTAL))
+    assert [len(page) for page in pages] == [10] * 9 + [5]
+    assert max(in_flight) > 1  # windows really overlapped
+    # stops at the first short page: at most `page_concurrency` windows past the end
+    assert max(calls) < TOTAL + 4 * 10
+
+
+def test_windowed_matches_sequential(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    monkeypatch.setattr(api.session, 'request', _skip_take_server([], []))
+
+    sequential = api._get_items('https://x/items', {'take': 7})
+    windowed = api._get_items('https://x/items', {'take': 7}, page_concurrency=3)
+
+    assert windowed == sequential
+
+
+def test_cursor_route_stays_sequential(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    urls: List[str] = []
+    pages = {
+        'https://x/grid': ([{'id': 0}, {'id': 1}], 'https://x/grid?cursor=abc'),
+        'https://x/grid?cursor=abc': ([{'id': 2}], None),
+    }
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        assert params is None or 'skip' not in params
+        urls.append(url)
+        body, next_url = pages[url]
+        return _FakeResponse(body, {'Link': f'<{next_url}>;rel="next"'} if next_url else {})
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    items = api._get_items('https://x/grid', {'take': 2}, page_concurrency=8)
+
+    assert [item['id'] for item in items] == [0, 1, 2]
+    assert urls == ['https://x/grid', 'https://x/grid?cursor=abc']
+
+
+def test_windowed_raises_http_errors(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    serve = _skip_take_server([], [])
+
+    class _Failing(_FakeResponse):
+        def raise_for_status(self) -> None:
+            raise requests.HTTPError('400')
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        if params is not None and int(params.get('skip', 0)) == 30:
+            return _Failing([])
+        return serve(method, url, headers, params, data)
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    with pytest.raises(requests.HTTPError):
+        api._get_items('https://x/items', {'take': 10}, page_concurrency=4)
+
+
+def _cursor_pages(n: int, log: List[str], lock: threading.Lock) -> Any:
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        page = int(url.rsplit('=', 1)[1]) if '=' in url else 0
+        with lock:
+            log.append(f'fetch {page}')
+        time.sleep(0.01)
+        headers_ = {'Link': f'<https://x/grid?cursor={page + 1}>;rel="next"'} if page + 1 < n else {}
+        return _FakeResponse([{'page': page}], headers_)
+
+    return fake_request
+
+
+def test_prefetch_overlaps_fetch_with_processing_and_bounds_lookahead(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    log: List[str] = []
+    lock = threading.Lock()
+    monkeypatch.setattr(api.session, 'request', _cursor_pages(5, log, lock))
+
+    pages: List[int] = []
+    for page in api._get_items_iterator('https://x/grid', prefetch=1):
+        page_no = page[0]['page']
+        assert isinstance(page_no, int)
+        with lock:
+            log.append(f'start {page_no}')
+        time.sleep(0.05)  # slower than a fetch, so the worker always catches up
+        with lock:
+            fetched = sum(1 for entry in log if entry.startswith('fetch'))
+            log.append(f'end {page_no}')
+        pages.append(page_no)
+        # while page k is processed, page k+1 (and never k+2) has been fetched
+        assert fetched == min(pages[-1] + 2, 5)
+
+    assert pages == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_reraises_errors_in_caller(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    serve = _cursor_pages(5, [], threading.Lock())
+
+    class _Failing(_FakeResponse):
+        def raise_for_status(self) -> None:
+            raise requests.HTTPError('500')
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        if url.endswith('cursor=2'):
+            return _Failing([])
+        return serve(method, url, headers, params, data)
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    received: List[Any] = []
+    with pytest.raises(requests.HTTPError):
+        for page in api._get_items_iterator('https://x/grid', prefetch=2):
+            received.append(page)
+    assert len(received) == 2  # pages before the failure are still delivered
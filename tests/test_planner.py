@@ -0,0 +1,84 @@
+"""Tests for the dry-run request planner (APIBase.dry_run, _planner.py).
+
+The dry runs execute the real helpers against the synthetic transport; the
+measured-latency test first runs against the local `FakeComboCurve` to collect
+metrics, then checks the dry run sent nothing and left those metrics alone.
+"""
+
+import pytest
+
+from combocurve_api_helper import ComboCurveAPI, ItemList, TokenBucket
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+_PROJECT = 'a' * 24
+_FORECAST = 'b' * 24
+
+
+def test_plans_chunked_writes_and_quota() -> None:
+    api = ComboCurveAPI.offline()
+    api.rate_limiter = TokenBucket.per_minute(180, burst=3)  # 3 requests/second
+    api.configure_compression(min_bytes=1)
+    well_ids = [f'{i:024x}' for i in range(30_000)]
+
+    with api.dry_run(latency=0.2) as plan:
+        api.post_forecast_wells(_PROJECT, _FORECAST, well_ids, chunksize=100)
+        api.post_company_monthly_productions([{'well': w, 'oil': 1.0} for w in well_ids[:4_000]])
+
+    endpoints = plan.by_endpoint()
+    wells = endpoints['POST /v1/projects/{id}/forecasts/{id}/wells']
+    assert wells['requests'] == 300 and set(wells['chunks']) == {100}
+    assert wells['records'] == 30_000
+    assert endpoints['POST /v1/monthly-productions']['chunks'] == [4_000]
+    assert plan.request_count == 301
+    assert all(0 < r.bytes_sent for r in plan.requests)
+
+    assert plan.latency_seconds == pytest.approx(301 * 0.2)
+    assert plan.quota_seconds == pytest.approx((301 - 3) / 3)
+    assert plan.estimated_seconds == plan.quota_seconds
+    assert 'quota-bound' in plan.summary()
+
+    # the limiter and compressor were bypassed, not consumed
+    assert api.rate_limiter.reservations == 0
+    assert api.compression_stats().compressed_requests == 0
+
+
+def test_plans_paginated_reads_and_parallel_writes() -> None:
+    api = ComboCurveAPI.offline()
+    wells_url = f'{api.API_BASE_URL}/projects/{_PROJECT}/wells'
+    with api.dry_run(items={'/v1/projects/{id}/wells': 1_050}, concurrency=4) as plan:
+        wells = api._get_items(wells_url, {'take': 200})
+        data: ItemList = [{'chosenID': str(i)} for i in range(1_000)]
+        result = api._request_batched('put', f'{api.API_BASE_URL}/wells', data, chunksize=250, max_workers=4)
+
+    assert len(wells) == 1_050
+    assert result.success_count == 1_000 and len(result.chunks) == 4
+    endpoints = plan.by_endpoint()
+    assert endpoints['GET /v1/projects/{id}/wells']['chunks'] == [200] * 5 + [50]
+    assert sorted(endpoints['PUT /v1/wells']['chunks']) == [250] * 4
+    assert plan.quota_seconds == 0.0
+    assert plan.estimated_seconds == pytest.approx(10 * 0.5 / 4)
+
+
+def test_uses_measured_latencies_and_sends_nothing() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/wells', count=6)
+        server.configure_route('/v1/wells', latency=0.05)
+        api = server.client(ComboCurveAPI)
+        metrics = api.enable_metrics()
+        api._get_items(f'{api.API_BASE_URL}/wells', {'take': 3})
+        measured = server.request_count()
+        before = metrics.snapshot()
+
+        with api.dry_run(items={'/v1/wells': 30}, metrics=metrics, latency=9.0) as plan:
+            api._get_items(f'{api.API_BASE_URL}/wells', {'take': 3})
+            api._get_items(f'{api.API_BASE_URL}/projects', {'take': 3})
+
+        assert server.request_count() == measured
+        assert metrics.snapshot() == before
+        assert api.hooks  # restored
+        assert len(api._get_items(f'{api.API_BASE_URL}/wells', {'take': 3})) == 6  # network again
+
+    mean = before['GET /v1/wells']['latency_seconds']['sum'] / before['GET /v1/wells']['latency_seconds']['count']
+    assert 0.05 <= mean < 1.0
+    assert plan.by_endpoint()['GET /v1/wells']['requests'] == 10
+    assert plan.latency_seconds == pytest.approx(10 * mean + 9.0)
@@ -0,0 +1,112 @@
+"""Unit tests for the proactive token-bucket rate limiter (_rate_limit.py) -- no live API.
+
+Drives `TokenBucket` with a controllable clock and checks that `APIBase._send`
+paces every request, of every instance, through the process-wide bucket.
+"""
+
+from typing import Iterator, List
+
+import pytest
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI, DeadlineExceeded, TokenBucket
+from combocurve_api_helper import _rate_limit
+from combocurve_api_helper.base import APIBase
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(_rate_limit.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(_rate_limit.time, 'sleep', clock.sleep)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def _no_process_limit() -> Iterator[None]:
+    yield
+    APIBase.set_rate_limit(None)
+
+
+def test_bucket_allows_burst_then_paces(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]  # the burst
+    assert waits[3:] == pytest.approx([0.5, 0.5])  # then one token every 1/rate seconds
+    assert bucket.reservations == 5
+    assert bucket.waited_seconds == pytest.approx(1.0)
+
+
+def test_bucket_refills_while_idle(clock: _Clock) -> None:
+    bucket = TokenBucket.per_minute(60, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10  # far more than the capacity refills
+    assert [bucket.acquire(), bucket.acquire(), bucket.acquire()] == pytest.approx([0.0, 0.0, 1.0])
+
+
+def test_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_process_wide_limit_paces_every_instance(monkeypatch: MonkeyPatch, clock: _Clock) -> None:
+    first = ComboCurveAPI()
+    second = ComboCurveAPI()
+    for api in (first, second):
+        monkeypatch.setattr(api.session, 'request', lambda *a, **k: None)
+
+    bucket = APIBase.set_rate_limit(requests_per_second=1.0, burst=1)
+
+    first._send('get', 'https://x', headers={})
+    second._send('get', 'https://x', headers={})
+    first._send('get', 'https://x', headers={})
+
+    assert bucket is not None and bucket.reservations == 3
+    assert clock.sleeps == pytest.approx([1.0, 1.0])
+
+
+def test_instance_limiter_overrides_process_limit(monkeypatch: MonkeyPatch, clock: _Clock) -> None:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: None)
+    shared = APIBase.set_rate_limit(requests_per_second=1.0)
+    own = TokenBucket(rate=100.0)
+    api.rate_limiter = own
+
+    api._send('get', 'https://x', headers={})
+
+    assert own.reservations == 1
+    assert shared is not None and shared.reservations == 0
+
+
+def test_requests_rejected_by_the_deadline_take_no_token(monkeypatch: MonkeyPatch, clock: _Clock) -> None:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: None)
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    api.rate_limiter = bucket
+
+    with api.deadline(0.5):
+        api._send('get', 'https://x', headers={})  # the burst token
+        with pytest.raises(DeadlineExceeded):
+            api._send('get', 'https://x', headers={})  # its 1 s wait would overrun the deadline
+        clock.now += 0.6
+        with pytest.raises(DeadlineExceeded):
+            api._send('get', 'https://x', headers={})  # the deadline has run out
+
+    assert bucket.reservations == 1
+    assert bucket.acquire() == pytest.approx(0.4)  # the rejected requests left the quota untouched
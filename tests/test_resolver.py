@@ -0,0 +1,103 @@
+"""Tests for the indexed name / id resolver (NameResolver, _resolver.py), against `FakeComboCurve`."""
+
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from combocurve_api_helper import ComboCurveAPI, NameResolver
+from combocurve_api_helper.fake_server import FakeComboCurve
+
+_PROJECT = 'a' * 24
+
+
+def _named(*names: str) -> List[Dict[str, str]]:
+    return [{'id': f'{i:024x}', 'name': name} for i, name in enumerate(names)]
+
+
+def test_bulk_resolution_fetches_each_list_once() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', _named('Alpha', 'Beta', 'Gamma'))
+        server.add_collection('/v1/projects/*/scenarios', _named('Base', 'Upside'))
+        resolver = NameResolver(server.client(ComboCurveAPI))
+
+        assert resolver.ids('projects', ['Gamma', 'Alpha']) == {'Gamma': f'{2:024x}', 'Alpha': f'{0:024x}'}
+        assert resolver.id('projects', 'Beta') == f'{1:024x}'
+        assert resolver.item('projects', f'{1:024x}')['name'] == 'Beta'
+        assert resolver.id('scenarios', 'Upside', project_id=_PROJECT) == f'{1:024x}'
+        assert server.request_count('GET') == 2
+
+        with pytest.raises(ValueError):
+            resolver.id('scenarios', 'Upside')
+        with pytest.raises(ValueError):
+            resolver.id('wells', 'Alpha')
+
+
+def test_misses_refresh_once_per_call() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', _named('Alpha'))
+        api = server.client(ComboCurveAPI)
+        resolver = NameResolver(api, min_refresh_interval=0)
+
+        assert resolver.ids('projects', ['Alpha', 'Missing', 'Absent']) == {
+            'Alpha': f'{0:024x}',
+            'Missing': None,
+            'Absent': None,
+        }
+        assert server.request_count('GET') == 1  # the index was built by this call
+
+        api._post_items(f'{api.API_BASE_URL}/projects', [{'id': 'new-id', 'name': 'Missing'}])
+        assert resolver.ids('projects', ['Missing', 'Absent']) == {'Missing': 'new-id', 'Absent': None}
+        assert server.request_count('GET') == 2
+        assert resolver.id('projects', 'Alpha') == f'{0:024x}'
+        assert server.request_count('GET') == 2
+
+        throttled = NameResolver(api)  # refreshes at most every 5 s by default
+        assert throttled.id('projects', 'Absent') is None and throttled.id('projects', 'Absent') is None
+        assert server.request_count('GET') == 3
+
+        resolver.invalidate('projects')
+        resolver.id('projects', 'Alpha')
+        assert server.request_count('GET') == 4
+
+
+def test_casefold_and_duplicate_names_warn_once() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', _named('Alpha', 'alpha', 'Beta'))
+        api = server.client(ComboCurveAPI)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            resolver = NameResolver(api, casefold=True)
+            assert resolver.id('projects', 'ALPHA') == f'{0:024x}'
+            assert resolver.id('projects', 'Alpha') == f'{0:024x}'
+            resolver.id('projects', 'missing')  # refetches: the duplicate is not warned about again
+        assert len(caught) == 1 and 'alpha' in str(caught[0].message)
+
+        assert NameResolver(api).id('projects', 'alpha') == f'{1:024x}'
+
+
+def test_fetches_run_outside_the_lock_once_per_list() -> None:
+    with FakeComboCurve() as server:
+        server.add_collection('/v1/projects', _named('Alpha'))
+        server.add_collection('/v1/projects/*/scenarios', _named('Base'))
+        api = server.client(ComboCurveAPI)
+        resolver = NameResolver(api)
+        release = threading.Event()
+        get_projects = api.get_projects
+
+        def blocked_get_projects(*args: Any, **kwargs: Any) -> Any:
+            release.wait(5)
+            return get_projects(*args, **kwargs)
+
+        api.get_projects = blocked_get_projects  # type: ignore[method-assign]
+        with ThreadPoolExecutor(3) as executor:
+            projects = [executor.submit(resolver.id, 'projects', 'Alpha') for _ in range(3)]
+            # not held up by the projects fetch in flight
+            assert resolver.id('scenarios', 'Base', project_id=_PROJECT) == f'{0:024x}'
+            assert not any(future.done() for future in projects)
+            release.set()
+            assert [future.result() for future in projects] == [f'{0:024x}'] * 3
+        assert server.request_count('GET') == 2  # the concurrent projects misses shared one fetch
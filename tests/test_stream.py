@@ -0,0 +1,130 @@
+"""Unit tests for streaming item decoding (_stream.py, _get_items_streamed) -- no live API.
+
+Feeds JSON arrays split at every possible chunk boundary through the incremental
+parser, and serves paged, chunked bodies from the API's pooled session to
+verify records are yielded as they arrive, across pages, with the connection
+released when the iterator is abandoned.
+"""
+
+import json
+from collections.abc import Generator
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI
+from combocurve_api_helper._stream import _iter_json_array
+
+RECORDS: List[Any] = [
+    {'well': 'w0', 'date': '2024-01-01', 'oil': 1.5, 'note': 'quote " bracket ] brace } ü'},
+    {'well': 'w1', 'date': '2024-01-02', 'oil': None, 'segments': [{'b': -0.25e-3}, []]},
+    12345,
+    True,
+    None,
+    'tail',
+]
+
+
+def _split(body: bytes, size: int) -> List[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5, 16, 1 << 20])
+def test_iter_json_array_matches_json_loads_at_any_chunk_size(size: int) -> None:
+    body = json.dumps(RECORDS, indent=1, ensure_ascii=False).encode()
+    assert list(_iter_json_array(_split(body, size))) == RECORDS
+
+
+def test_iter_json_array_edge_shapes() -> None:
+    assert list(_iter_json_array([b' [ ] \n'])) == []
+    assert list(_iter_json_array([b'{"id": ', b'"X"}'])) == [{'id': 'X'}]  # lone object, like _extract_json
+
+
+@pytest.mark.parametrize(
+    'chunks, expected',
+    [
+        ([b'[1.', b'5]'], [1.5]),  # at '.'
+        ([b'[2', b'e3, 1E', b'-2]'], [2e3, 1e-2]),  # at 'e' / 'E'
+        ([b'[0, -', b'7]'], [0, -7]),  # at '-'
+        ([b'[12', b'34,5', b'6]'], [1234, 56]),  # between digits
+        ([b'[tr', b'ue,nu', b'll]'], [True, None]),
+    ],
+)
+def test_iter_json_array_scalars_split_across_chunks(chunks: List[bytes], expected: List[Any]) -> None:
+    assert list(_iter_json_array(chunks)) == expected
+
+
+@pytest.mark.parametrize(
+    'body', [b'', b'[', b'[1 2]', b'[1,]', b'[1,,2]', b'[1, 2', b'[{"a": ', b'[1] x', b'[1.x]', b'[1.5']
+)
+def test_iter_json_array_rejects_malformed_bodies(body: bytes) -> None:
+    for size in (1, 4, 100):
+        with pytest.raises(ValueError):
+            list(_iter_json_array(_split(body, size)))
+
+
+class _StreamedResponse:
+    """Stand-in for a `stream=True` requests.Response: the body is read lazily."""
+
+    def __init__(self, body: bytes, headers: Dict[str, str], reads: List[int]) -> None:
+        self.status_code = 200
+        self.headers = headers
+        self._body = body
+        self._reads = reads
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for chunk in _split(self._body, 64):
+            self._reads.append(len(chunk))
+            yield chunk
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_get_items_streamed_yields_records_across_pages(monkeypatch: MonkeyPatch) -> None:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    reads: List[int] = []
+    responses: List[_StreamedResponse] = []
+    pages: Dict[str, Tuple[List[Dict[str, Any]], Optional[str]]] = {
+        'https://x/daily-productions': ([{'id': i, 'pad': 'x' * 50} for i in range(40)], 'https://x/p2'),
+        'https://x/p2': ([{'id': 40}], None),
+    }
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _StreamedResponse:
+        assert stream
+        body, next_url = pages[url]
+        response = _StreamedResponse(
+            json.dumps(body).encode(), {'Link': f'<{next_url}>;rel="next"'} if next_url else {}, reads
+        )
+        responses.append(response)
+        return response
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    items = api._get_items_streamed('https://x/daily-productions', {'take': 40})
+    first = next(items)
+    assert first['id'] == 0
+    assert len(reads) < 5  # the first record arrived before the page body was read
+    assert [item['id'] for item in items] == list(range(1, 41))
+    assert [r.closed for r in responses] == [True, True]
+
+    # abandoning mid-page releases the connection
+    partial = api._get_items_streamed('https://x/daily-productions', {'take': 40})
+    next(partial)
+    assert isinstance(partial, Generator)
+    partial.close()
+    assert responses[-1].closed
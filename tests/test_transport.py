@@ -0,0 +1,115 @@
+"""Unit tests for the APIBase transport layer (pooled session) -- no live API.
+
+Monkeypatches auth + the API's pooled session so we verify every call path
+sends through one keep-alive `requests.Session` and that its connection pool
+follows `_request_batched`'s `max_workers`.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from pytest import MonkeyPatch
+
+from combocurve_api_helper import ComboCurveAPI
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        self.status_code = status_code
+        self._body = body
+        self.headers: Dict[str, str] = {}
+        self.text = str(body)
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+def _make_api(monkeypatch: MonkeyPatch) -> ComboCurveAPI:
+    api = ComboCurveAPI()
+    monkeypatch.setattr(api.auth, 'get_auth_headers', lambda: {})
+    return api
+
+
+def _pool_maxsize(api: ComboCurveAPI) -> int:
+    adapter = api.session.get_adapter('https://api.combocurve.com')
+    return int(adapter.poolmanager.connection_pool_kw['maxsize'])  # type: ignore[attr-defined]
+
+
+def test_single_object_endpoints_send_through_session(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    calls: List[Tuple[str, str]] = []
+
+    def fake_request(
+        method: str,
+        url: str,
+        headers: Any = None,
+        params: Any = None,
+        data: Any = None,
+        stream: bool = False,
+        timeout: Any = None,
+    ) -> _FakeResponse:
+        calls.append((method, url))
+        return _FakeResponse(200, [{'id': 'X'}])
+
+    monkeypatch.setattr(api.session, 'request', fake_request)
+
+    api.post_forecast_wells('P', 'F', ['w1', 'w2', 'w3'], chunksize=2)
+    api.post_forecast_run('P', 'F')
+    api.patch_forecast_by_id('P', 'F', {'name': 'n'})
+    api.get_projects()
+
+    assert [method for method, _ in calls] == ['post', 'post', 'post', 'patch', 'get']
+
+
+def test_request_batched_grows_pool_to_max_workers(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: _FakeResponse(207, {}))
+    assert _pool_maxsize(api) == 10
+
+    api._request_batched('put', 'https://x', [{'well': 'w0'}], chunksize=25, max_workers=32)
+    assert _pool_maxsize(api) == 32
+
+    # never shrinks below what a previous batch needed
+    api._request_batched('put', 'https://x', [{'well': 'w0'}], chunksize=25, max_workers=4)
+    assert _pool_maxsize(api) == 32
+
+
+def test_configure_session_replaces_and_closes_previous(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    previous = api.session
+    closed: List[bool] = []
+    monkeypatch.setattr(previous, 'close', lambda: closed.append(True))
+
+    api.configure_session(pool_maxsize=50)
+
+    assert api.session is not previous
+    assert closed == [True]
+    assert _pool_maxsize(api) == 50
+
+    custom = requests.Session()
+    api.configure_session(session=custom)
+    assert api.session is custom
+
+
+def test_request_batched_grows_a_custom_session_keeping_its_pool_settings(monkeypatch: MonkeyPatch) -> None:
+    api = _make_api(monkeypatch)
+    custom = requests.Session()
+    custom.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=64, pool_block=True))
+    custom.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=8, pool_block=True))
+    api.configure_session(session=custom)
+    monkeypatch.setattr(api.session, 'request', lambda *a, **k: _FakeResponse(207, {}))
+
+    api._request_batched('put', 'https://x', [{'well': 'w0'}], chunksize=25, max_workers=32)
+    assert _pool_maxsize(api) == 64  # not shrunk to max_workers
+    adapter = custom.get_adapter('http://x')
+    pool_kw = adapter.poolmanager.connection_pool_kw  # type: ignore[attr-defined]
+    assert (pool_kw['maxsize'], pool_kw['block'], adapter._pool_connections) == (32, True, 2)  # type: ignore[attr-defined]